@@ -1,4 +1,5 @@
 CREATE EXTENSION IF NOT EXISTS citext;
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
 CREATE COLLATION IF NOT EXISTS "und-ci-det" (provider = icu, locale = 'und-u-ks-level2', deterministic = true);
 create or replace function check_unique_document_for_individual(uuid, boolean)
    returns boolean
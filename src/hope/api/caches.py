@@ -1,10 +1,11 @@
 import functools
-from typing import Any, Callable, ParamSpec
+from typing import Any, Callable, Iterable, ParamSpec
 
 from constance import config
 from django.conf import settings
 from django.core.cache import cache
-from django.db.models import Count, Max, QuerySet
+from django.db import transaction
+from django.db.models import Model
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework_extensions.cache.decorators import CacheResponse
@@ -12,6 +13,8 @@ from rest_framework_extensions.key_constructor import bits
 from rest_framework_extensions.key_constructor.bits import KeyBitBase
 from rest_framework_extensions.key_constructor.constructors import KeyConstructor
 
+from hope.apps.core.cache_tags import TaggedCache
+
 
 class _ConstanceTTLCacheResponse(CacheResponse):
     # Reads REST_API_TTL from constance per request instead of at decoration time.
@@ -23,15 +26,52 @@ class _ConstanceTTLCacheResponse(CacheResponse):
         key_func: Any = None,
         cache: str | None = None,
         cache_errors: bool | None = None,
+        tags: tuple[str, ...] = (),
     ) -> None:
         super().__init__(timeout=0, key_func=key_func, cache=cache, cache_errors=cache_errors)
+        if tags:
+            # cached responses can then be dropped with `invalidate_cache_tags`
+            self.cache = TaggedCache(self.cache, tags)
 
     def calculate_timeout(self, view_instance: Any, **_: Any) -> int:
         return config.REST_API_TTL
 
+    def process_cache_response(  # noqa: PLR0913 – override of base method signature
+        self, view_instance: Any, view_method: Any, request: Any, args: tuple, kwargs: dict
+    ) -> Any:
+        hit = True
+
+        def _view_method(*view_args: Any, **view_kwargs: Any) -> Any:
+            # the view only runs when the response is not in the cache
+            nonlocal hit
+            hit = False
+            return view_method(*view_args, **view_kwargs)
+
+        response = super().process_cache_response(view_instance, _view_method, request, args, kwargs)
+        record_cache_response(f"{view_instance.__class__.__name__}.{view_method.__name__}", hit)
+        return response
+
 
 cached_response = _ConstanceTTLCacheResponse
 
+CACHE_RESPONSE_STATS_KEY = "cache_stats:{endpoint}:{result}"
+
+
+def record_cache_response(endpoint: str, hit: bool) -> None:
+    """Count a hit or a miss of the cached responses of `endpoint`, the counters never expire."""
+    key = CACHE_RESPONSE_STATS_KEY.format(endpoint=endpoint, result="hit" if hit else "miss")
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, timeout=None)
+
+
+def get_cache_response_stats(endpoint: str) -> dict[str, int]:
+    """Return the hits and misses counted for `endpoint`, e.g. `HouseholdViewSet.list`."""
+    keys = {result: CACHE_RESPONSE_STATS_KEY.format(endpoint=endpoint, result=result) for result in ("hit", "miss")}
+    counters = cache.get_many(keys.values())
+    return {result: counters.get(key, 0) for result, key in keys.items()}
+
 
 def _inm_matches(etag: str, inm_header: str | None) -> bool:
     if not inm_header:
@@ -201,25 +241,45 @@ class BusinessAreaAndProgramKeyBitMixin(KeyBitBase):
         return str(version)
 
 
-class BusinessAreaAndProgramLastUpdatedKeyBit(KeyBitBase):
-    """KeyBit that validates the cache based on the latest `updated_at` and the number of objects in the queryset.
+PROGRAM_MODEL_VERSION_KEY = "{program_id}:{model}:version"
 
-    It eliminates the need to create and maintain cache versions at the cost of an additional query to fetch
-    the latest `updated_at` value and object count.
-    The cache is based also on the business area, program and their version.
+
+def get_program_model_version(program_id: Any, model: type[Model]) -> Any:
+    return get_or_create_cache_key(
+        PROGRAM_MODEL_VERSION_KEY.format(program_id=program_id, model=model._meta.label_lower), 0
+    )
+
+
+def increment_program_model_version(program_id: Any, model: type[Model]) -> int:
+    return increment_cache_key(PROGRAM_MODEL_VERSION_KEY.format(program_id=program_id, model=model._meta.label_lower))
+
+
+def invalidate_program_model_cache(program_ids: Iterable[Any], *models: type[Model]) -> None:
+    """Invalidate the list caches versioned by `models` in the given programs once the transaction commits.
+
+    Saving and deleting the versioned models bumps the version through signals, call it explicitly after
+    `.update()` and `bulk_update()` since they bypass them.
     """
+    program_ids = set(program_ids)
 
-    # TODO This is a bad approach. On large tables this will cause performance issues. Count and Max are very expensive.
+    def _increment() -> None:
+        for program_id in program_ids:
+            for model in models:
+                increment_program_model_version(program_id, model)
 
-    specific_view_cache_key = ""
+    transaction.on_commit(_increment)
 
-    def _get_queryset(
-        self,
-        business_area_slug: Any | None,
-        program_code: Any | None,
-        view_instance: Any | None,
-    ) -> QuerySet:
-        return view_instance.get_queryset()
+
+class BusinessAreaAndProgramVersionKeyBit(KeyBitBase):
+    """KeyBit that validates the cache with the version of `versioned_model` in the program.
+
+    The version is a cache counter bumped on every write to the model (see `invalidate_program_model_cache`),
+    computing the key costs one cache read instead of a query over the listed table.
+    The cache is based also on the business area, program and their version.
+    """
+
+    specific_view_cache_key = ""
+    versioned_model: type[Model]
 
     def get_data(  # noqa: PLR0913 – override of base method signature
         self,
@@ -233,17 +293,9 @@ class BusinessAreaAndProgramLastUpdatedKeyBit(KeyBitBase):
         business_area_slug = kwargs.get("business_area_slug")
         business_area_version = get_or_create_cache_key(f"{business_area_slug}:version", 1)
         program_code = kwargs.get("program_code")
+        version = get_program_model_version(view_instance.program.id, self.versioned_model)
 
-        queryset = self._get_queryset(business_area_slug, program_code, view_instance).aggregate(
-            latest_updated_at=Max("updated_at"), obj_count=Count("id")
-        )
-        latest_updated_at = queryset["latest_updated_at"]
-        obj_count = queryset["obj_count"]
-
-        return (
-            f"{business_area_slug}:{business_area_version}:{program_code}:{self.specific_view_cache_key}"
-            f":{latest_updated_at}:{obj_count}"
-        )
+        return f"{business_area_slug}:{business_area_version}:{program_code}:{self.specific_view_cache_key}:{version}"
 
 
 class AreaLimitKeyBit(KeyBitBase):
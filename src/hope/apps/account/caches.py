@@ -1,21 +1,16 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from hope.models import BusinessArea, Program, User
+    from hope.models import User
 
 
 def get_user_permissions_version_key(user: "User") -> str:
     return f"user:{str(user.id)}:version"
 
 
-def get_user_permissions_cache_key(
-    user: "User",
-    user_version: int,
-    business_area: Optional["BusinessArea"],
-    program: Optional["Program"],
-) -> str:
-    return (
-        f"permissions:{str(user.id)}:"
-        f"{user_version}:{business_area.slug if business_area else 'None'}:"
-        f"{program.id if program else 'None'}"
-    )
+def get_programs_permissions_version_key() -> str:
+    return "permissions:programs:version"
+
+
+def get_user_permission_matrix_cache_key(user: "User", user_version: int, programs_version: int) -> str:
+    return f"permissions:{str(user.id)}:{user_version}:{programs_version}:matrix"
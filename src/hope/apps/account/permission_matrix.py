@@ -0,0 +1,134 @@
+"""Compiled permissions of a user.
+
+Resolving the permissions of a user takes several RoleAssignment/Role/Permission queries, and a request
+checks them many times (permission classes, key bits, serializers). `PermissionMatrix` resolves all the
+role assignments of the user and of their partner at once into a read-only mapping from business area and
+program to the permission set, so every further lookup is a dict access.
+
+The matrix is cached under the permissions version of the user (bumped when their role assignments,
+roles, groups or partner change) and the global programs version (bumped when a program is created,
+removed or hidden), and memoized on the user instance for the rest of the request.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from constance import config
+from django.contrib.auth.models import Permission
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils import timezone
+
+from hope.apps.account.caches import (
+    get_programs_permissions_version_key,
+    get_user_permission_matrix_cache_key,
+    get_user_permissions_version_key,
+)
+
+if TYPE_CHECKING:
+    from hope.models import User
+
+EMPTY_PERMISSIONS: frozenset[str] = frozenset()
+
+
+@dataclass(frozen=True)
+class PermissionMatrix:
+    # business areas and programs the user has a role in are keyed by str ids
+    business_area_ids: dict[str, str] = field(default_factory=dict)
+    program_ids: dict[tuple[str, str], str] = field(default_factory=dict)
+    business_area_wide: dict[str, frozenset[str]] = field(default_factory=dict)
+    programs: dict[tuple[str, str], frozenset[str]] = field(default_factory=dict)
+    business_areas: dict[str, frozenset[str]] = field(default_factory=dict)
+    all_permissions: frozenset[str] = EMPTY_PERMISSIONS
+    user_group_permissions: frozenset[str] = EMPTY_PERMISSIONS
+
+    @property
+    def has_roles(self) -> bool:
+        return bool(self.business_areas)
+
+    def business_area_permissions(self, business_area_id: str) -> frozenset[str] | None:
+        """Return the permissions of all the roles in the business area, None without any role in it."""
+        return self.business_areas.get(business_area_id)
+
+    def program_permissions(self, business_area_id: str, program_id: str | None) -> frozenset[str] | None:
+        """Return the permissions of the roles covering the program, None without such role.
+
+        Roles without a program cover all the programs of the business area. Without `program_id` only
+        those roles are taken into account.
+        """
+        if program_id and (business_area_id, program_id) in self.programs:
+            return self.programs[business_area_id, program_id]
+        return self.business_area_wide.get(business_area_id)
+
+
+def compile_permission_matrix(user: "User") -> PermissionMatrix:
+    from hope.models import Program, RoleAssignment
+
+    role_assignments = list(
+        RoleAssignment.objects.filter(Q(user=user) | Q(partner__user=user))
+        .exclude(expiry_date__lt=timezone.now())
+        .values_list("id", "business_area_id", "business_area__slug", "program_id", "role__permissions")
+    )
+    group_permissions = defaultdict(set)
+    for role_assignment_id, app_label, codename in Permission.objects.filter(
+        group__role_assignments__id__in=[role_assignment[0] for role_assignment in role_assignments]
+    ).values_list("group__role_assignments__id", "content_type__app_label", "codename"):
+        group_permissions[role_assignment_id].add(f"{app_label}.{codename}")
+
+    business_area_ids: dict[str, str] = {}
+    business_area_wide: dict[str, set[str]] = defaultdict(set)
+    program_specific: dict[tuple[str, str], set[str]] = defaultdict(set)
+    business_areas: dict[str, set[str]] = defaultdict(set)
+    for role_assignment_id, business_area_pk, business_area_slug, program_id, role_permissions in role_assignments:
+        business_area_id = str(business_area_pk)
+        business_area_ids[business_area_slug] = business_area_id
+        permissions = {*(role_permissions or ()), *group_permissions[role_assignment_id]}
+        if program_id is None:
+            business_area_wide[business_area_id].update(permissions)
+        else:
+            program_specific[business_area_id, str(program_id)].update(permissions)
+        business_areas[business_area_id].update(permissions)
+
+    program_ids = {
+        (str(business_area_id), code): str(program_id)
+        for business_area_id, code, program_id in Program.objects.filter(
+            business_area_id__in=business_area_ids.values()
+        ).values_list("business_area_id", "code", "id")
+    }
+    user_group_permissions = frozenset(
+        f"{app_label}.{codename}"
+        for app_label, codename in Permission.objects.filter(group__user=user).values_list(
+            "content_type__app_label", "codename"
+        )
+    )
+    return PermissionMatrix(
+        business_area_ids=business_area_ids,
+        program_ids=program_ids,
+        business_area_wide={key: frozenset(value) for key, value in business_area_wide.items()},
+        programs={
+            (business_area_id, program_id): frozenset(permissions | business_area_wide.get(business_area_id, set()))
+            for (business_area_id, program_id), permissions in program_specific.items()
+        },
+        business_areas={key: frozenset(value) for key, value in business_areas.items()},
+        all_permissions=frozenset().union(*business_areas.values()),
+        user_group_permissions=user_group_permissions,
+    )
+
+
+def get_permission_matrix(user: "User") -> PermissionMatrix:
+    user_version = cache.get_or_set(get_user_permissions_version_key(user), 1, timeout=None)
+    programs_version = cache.get_or_set(get_programs_permissions_version_key(), 1, timeout=None)
+    cache_key = get_user_permission_matrix_cache_key(user, user_version, programs_version)
+
+    memoized = getattr(user, "_permission_matrix", None)
+    if memoized and memoized[0] == cache_key:
+        return memoized[1]
+
+    matrix = cache.get(cache_key)
+    if matrix is None:
+        # a matrix without roles is cached too, granting the first role bumps the user version like any change
+        matrix = compile_permission_matrix(user)
+        cache.set(cache_key, matrix, timeout=config.REST_API_TTL)
+    user._permission_matrix = (cache_key, matrix)
+    return matrix
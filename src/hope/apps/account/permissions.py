@@ -322,7 +322,8 @@ DEFAULT_PERMISSIONS_LIST_FOR_IS_UNICEF_PARTNER = [str(perm.value) for perm in DE
 
 
 def check_permissions(user: Any, permissions: Iterable[Permissions], **kwargs: Any) -> bool:
-    from hope.models import BusinessArea, Program
+    from hope.apps.account.permission_matrix import get_permission_matrix
+    from hope.models import BusinessArea
 
     if not user.is_authenticated:
         return False
@@ -330,19 +331,34 @@ def check_permissions(user: Any, permissions: Iterable[Permissions], **kwargs: A
     business_area_arg = kwargs.get("business_area")
     if business_area_arg is None:
         return False
-    business_area = (
-        business_area_arg
-        if isinstance(business_area_arg, BusinessArea)
-        else BusinessArea.objects.filter(slug=business_area_arg).first()
-    )
-    if business_area is None:
+    if user.is_superuser:
+        business_area = (
+            business_area_arg
+            if isinstance(business_area_arg, BusinessArea)
+            else BusinessArea.objects.filter(slug=business_area_arg).first()
+        )
+        return business_area is not None and any(
+            user.has_perm(permission.name, business_area) for permission in permissions
+        )
+
+    # business area and program are resolved from the permission matrix, without a query per check
+    matrix = get_permission_matrix(user)
+    if isinstance(business_area_arg, BusinessArea):
+        business_area_id = str(business_area_arg.id)
+    else:
+        business_area_id = matrix.business_area_ids.get(business_area_arg)
+    if business_area_id is None:
         return False
-    program = None
-    if program_code := kwargs.get("program"):
-        program = Program.objects.filter(code=program_code, business_area=business_area).first()
-    obj = program or business_area
-
-    return any(user.has_perm(permission.name, obj) for permission in permissions)
+    granted = matrix.business_area_permissions(business_area_id)
+    if (program_code := kwargs.get("program")) and (
+        program_id := matrix.program_ids.get((business_area_id, program_code))
+    ):
+        granted = matrix.program_permissions(business_area_id, program_id)
+    if granted is None:
+        return False
+    return any(
+        permission.name in granted or permission.name in matrix.user_group_permissions for permission in permissions
+    )
 
 
 def check_creator_or_owner_permission(
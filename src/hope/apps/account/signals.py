@@ -8,9 +8,18 @@ from django.db.models.signals import m2m_changed, post_delete, post_save, pre_de
 from django.dispatch import receiver
 from django.utils import timezone
 
-from hope.apps.account.caches import get_user_permissions_version_key
+from hope.apps.account.caches import get_programs_permissions_version_key, get_user_permissions_version_key
 from hope.apps.account.profile_cache import profile_cache
-from hope.models import BusinessArea, Partner, PartnerRoleAssignment, Role, RoleAssignment, User, UserRoleAssignment
+from hope.models import (
+    BusinessArea,
+    Partner,
+    PartnerRoleAssignment,
+    Program,
+    Role,
+    RoleAssignment,
+    User,
+    UserRoleAssignment,
+)
 
 
 @receiver(post_save, sender=RoleAssignment)
@@ -147,6 +156,27 @@ def invalidate_permissions_cache_on_user_change(sender: Any, instance: User, **k
     _invalidate_user_permissions_cache([instance])
 
 
+# fields resolving a program by code in the permission matrix (see `Program.objects`)
+PROGRAM_LOOKUP_FIELDS = {"business_area", "business_area_id", "code", "is_removed", "is_visible"}
+
+
+@receiver(post_save, sender=Program)
+@receiver(post_delete, sender=Program)
+def invalidate_permissions_cache_on_program_change(
+    sender: Any, instance: Program, update_fields: frozenset | None = None, **kwargs: Any
+) -> None:
+    """Invalidate the permission matrices of all Users when a Program is created, removed or its code changes."""
+    if update_fields and not update_fields & PROGRAM_LOOKUP_FIELDS:
+        return
+    version_key = get_programs_permissions_version_key()
+
+    def _increment() -> None:
+        cache.get_or_set(version_key, 0, timeout=None)
+        cache.incr(version_key)
+
+    transaction.on_commit(_increment)
+
+
 # Profile cache
 
 
@@ -1,17 +1,9 @@
-from typing import Any
-
-from constance import config
 from django.contrib.auth.backends import BaseBackend
-from django.contrib.auth.models import AnonymousUser, Permission
-from django.core.cache import cache
-from django.db.models import Model, Q
-from django.utils import timezone
+from django.contrib.auth.models import AnonymousUser
+from django.db.models import Model
 
-from hope.apps.account.caches import (
-    get_user_permissions_cache_key,
-    get_user_permissions_version_key,
-)
-from hope.models import BusinessArea, Program, Role, RoleAssignment, User
+from hope.apps.account.permission_matrix import get_permission_matrix
+from hope.models import BusinessArea, Program, User
 
 
 class PermissionsBackend(BaseBackend):
@@ -21,97 +13,30 @@ class PermissionsBackend(BaseBackend):
     """
 
     def get_all_permissions(self, user: User, obj: Model | None = None) -> set[str]:  # type: ignore
-        filters: dict[str, Any]
+        """Return the permissions from the user's Groups and from the RoleAssignments of the User or their Partner.
+
+        RoleAssignments store them either on the Group or on the Role; they are read from the compiled
+        permission matrix of the user.
+        """
+        matrix = get_permission_matrix(user)
         if not obj:
-            program = None
-            business_area = None
-            filters = {}
+            permissions = matrix.all_permissions
         elif isinstance(obj, BusinessArea):
-            program = None
-            business_area = obj
-            filters = {"business_area": business_area}
+            permissions = matrix.business_area_permissions(str(obj.id))
         elif isinstance(obj, Program):
-            program = obj
-            business_area = obj.business_area
-            filters = {
-                "business_area": business_area,
-                "program": program,
-            }
+            permissions = matrix.program_permissions(str(obj.business_area_id), str(obj.id))
         elif hasattr(obj, "program"):
-            program = obj.program
-            business_area = obj.business_area
-            filters = {"business_area": business_area, "program": program}
+            program_id = str(obj.program.id) if obj.program else None
+            permissions = matrix.program_permissions(str(obj.business_area.id), program_id)
         elif hasattr(obj, "business_area"):
-            program = None
-            business_area = obj.business_area
-            filters = {"business_area": business_area}
+            permissions = matrix.business_area_permissions(str(obj.business_area.id))
         else:
             return set()
 
-        user_version = cache.get_or_set(get_user_permissions_version_key(user), 1, timeout=None)
-        cache_key = get_user_permissions_cache_key(user, user_version, business_area, program)  # type: ignore
-
-        cached_permissions = cache.get(cache_key)
-
-        if cached_permissions:
-            return cached_permissions
-
-        # If permission is checked for a Program and User does not have access to it, return empty set
-        if (
-            program
-            and not RoleAssignment.objects.filter(
-                (Q(partner=user.partner) | Q(user=user))
-                & Q(business_area=business_area)
-                & (Q(program=None) | Q(program=program))
-            )
-            .exclude(expiry_date__lt=timezone.now())
-            .exists()
-        ):
+        # no role in the Business Area/Program, the User's Groups do not grant anything there either
+        if permissions is None:
             return set()
-
-        """
-        The permissions are fetched from:
-        * the user's Groups
-        * RoleAssignment - where they can be stored either on the Group or on the Role
-          and assigned either to the User or to their Partner
-        """
-
-        # role assignments from the User or their Partner
-        role_assignments = RoleAssignment.objects.filter(
-            (Q(user=user) | Q(partner__user=user))
-            & (Q(business_area=filters.get("business_area"), program=None) | Q(**filters))
-        ).exclude(expiry_date__lt=timezone.now())
-
-        role_assignment_ids = list(role_assignments.values_list("id", flat=True))
-
-        if business_area and not role_assignment_ids:
-            return set()
-
-        permissions_set = set()
-
-        # permissions from the RoleAssignments' Groups
-        role_assignment_group_permissions = Permission.objects.filter(
-            group__role_assignments__id__in=role_assignment_ids
-        ).values_list("content_type__app_label", "codename")
-        permissions_set.update(f"{app}.{codename}" for app, codename in role_assignment_group_permissions)
-
-        # permissions from RoleAssignment's Roles
-        role_assignment_role_permissions = Role.objects.filter(
-            role_assignments__id__in=role_assignment_ids, permissions__isnull=False
-        ).values_list("permissions", flat=True)
-        permissions_set.update(
-            permission for permission_list in role_assignment_role_permissions for permission in permission_list
-        )
-
-        # permissions from the User's Group
-        user_group_permissions = Permission.objects.filter(group__user=user).values_list(
-            "content_type__app_label", "codename"
-        )
-        permissions_set.update(f"{app}.{codename}" for app, codename in user_group_permissions)
-
-        cache.set(cache_key, permissions_set, timeout=config.REST_API_TTL)
-
-        return permissions_set
+        return set(permissions | matrix.user_group_permissions)
 
     def get_user(self, user_id: int) -> User | None:
         try:
@@ -0,0 +1,66 @@
+"""Tag based invalidation of cache entries.
+
+Cache entries that have to be removed as a group are registered in the set of their tag when they are
+written. Invalidating the tag deletes exactly the registered keys, so no command ever walks the whole
+keyspace (Redis `KEYS` blocks the server, and with it the Celery broker, for every other client).
+
+On django-redis the tag is a Redis set updated with SADD and read and deleted in one MULTI block.
+Other backends (LocMemCache in tests and local development) keep the set as a plain cache value.
+"""
+
+from typing import Any
+
+from django.core.cache import cache
+
+CACHE_TAG_KEY = "cache_tag:{tag}"
+
+
+def _get_redis_client() -> Any | None:
+    get_client = getattr(getattr(cache, "client", None), "get_client", None)
+    return get_client(write=True) if get_client else None
+
+
+def tag_cache_key(key: str, *tags: str, timeout: int | None) -> None:
+    """Register `key` in `tags`, `timeout` must not be shorter than the timeout of the entry."""
+    for tag in tags:
+        tag_key = CACHE_TAG_KEY.format(tag=tag)
+        if client := _get_redis_client():
+            redis_tag_key = cache.make_key(tag_key)
+            pipeline = client.pipeline()
+            pipeline.sadd(redis_tag_key, key)
+            if timeout is not None:
+                pipeline.expire(redis_tag_key, timeout)
+            pipeline.execute()
+        else:
+            cache.set(tag_key, cache.get(tag_key, set()) | {key}, timeout)
+
+
+def invalidate_cache_tags(*tags: str) -> None:
+    """Delete the entries registered in `tags` and the tags themselves."""
+    for tag in tags:
+        tag_key = CACHE_TAG_KEY.format(tag=tag)
+        if client := _get_redis_client():
+            pipeline = client.pipeline()
+            pipeline.smembers(cache.make_key(tag_key))
+            pipeline.delete(cache.make_key(tag_key))
+            members, _ = pipeline.execute()
+            keys = [member.decode() for member in members]
+        else:
+            keys = [*cache.get(tag_key, set()), tag_key]
+        if keys:
+            cache.delete_many(keys)
+
+
+class TaggedCache:
+    """Cache proxy registering every entry it writes in `tags`."""
+
+    def __init__(self, cache: Any, tags: tuple[str, ...]) -> None:
+        self.cache = cache
+        self.tags = tags
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.cache, name)
+
+    def set(self, key: str, value: Any, timeout: int | None = None) -> None:
+        self.cache.set(key, value, timeout)
+        tag_cache_key(key, *self.tags, timeout=timeout)
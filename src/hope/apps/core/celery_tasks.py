@@ -8,6 +8,7 @@ from django.utils import timezone
 from sentry_sdk import set_tag
 
 from hope.apps.core.celery import app
+from hope.apps.core.exchange_rates import ExchangeRates
 from hope.apps.utils.logs import log_start_and_end
 from hope.apps.utils.sentry import set_sentry_business_area_tag
 from hope.models import AsyncJob, AsyncRetryJob, PeriodicAsyncJob, XLSXKoboTemplate
@@ -263,3 +264,12 @@ def cleanup_old_periodic_async_jobs_async_task(
     retention_days: int = DEFAULT_PERIODIC_ASYNC_JOBS_RETENTION_DAYS,
 ) -> int:
     return cleanup_old_periodic_async_jobs_async_task_action(retention_days=retention_days)
+
+
+def refresh_exchange_rates_async_task_action() -> None:
+    ExchangeRates.refresh_shared()
+
+
+@app.task()
+def refresh_exchange_rates_async_task() -> None:
+    refresh_exchange_rates_async_task_action()
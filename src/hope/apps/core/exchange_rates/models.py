@@ -1,5 +1,8 @@
+from bisect import bisect_right
 import dataclasses
 from datetime import datetime
+import time
+from typing import ClassVar
 
 from dateutil.parser import parse
 from django.conf import settings
@@ -46,6 +49,19 @@ class SingleExchangeRate:
     ratio: float
     no_of_decimal: int
     historical_exchange_rates: list[HistoryExchangeRate]
+    # historical rates sorted by valid_from, None when their ranges overlap and the first match in
+    # historical_exchange_rates order has to be found with a linear scan
+    _sorted_history: tuple[HistoryExchangeRate, ...] | None = dataclasses.field(init=False, repr=False, compare=False)
+    _sorted_history_valid_from: tuple[datetime, ...] = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        sorted_history = tuple(sorted(self.historical_exchange_rates, key=lambda rate: rate.valid_from))
+        overlapping = any(
+            previous.valid_to >= following.valid_from
+            for previous, following in zip(sorted_history, sorted_history[1:], strict=False)
+        )
+        object.__setattr__(self, "_sorted_history", None if overlapping else sorted_history)
+        object.__setattr__(self, "_sorted_history_valid_from", tuple(rate.valid_from for rate in sorted_history))
 
     @classmethod
     def from_dict(cls, data: dict) -> "SingleExchangeRate":
@@ -71,10 +87,15 @@ class SingleExchangeRate:
         if self.is_valid(dispersion_date):
             return self.calc_exchange_rate()
 
-        for historical_exchange_rate in self.historical_exchange_rates:
-            if historical_exchange_rate.is_valid(dispersion_date):
-                return historical_exchange_rate.calc_exchange_rate()
+        if self._sorted_history is None:
+            for historical_exchange_rate in self.historical_exchange_rates:
+                if historical_exchange_rate.is_valid(dispersion_date):
+                    return historical_exchange_rate.calc_exchange_rate()
+            return None
 
+        index = bisect_right(self._sorted_history_valid_from, datetime.combine(dispersion_date, datetime.min.time()))
+        if index and self._sorted_history[index - 1].is_valid(dispersion_date):
+            return self._sorted_history[index - 1].calc_exchange_rate()
         return None
 
     def calc_exchange_rate(self) -> float:
@@ -91,11 +112,37 @@ class SingleExchangeRate:
 
 class ExchangeRates:
     CACHE_KEY = "exchange_rates"
+    # how long a process keeps its table before rebuilding it from the cached response
+    SHARED_TTL = 60 * 60
+
+    _shared: ClassVar["ExchangeRates | None"] = None
+    _shared_expires_at: ClassVar[float] = 0.0
 
     def __init__(self, api_client: ExchangeRateClient | None = None) -> None:
         self.api_client = api_client or get_exchange_rate_client()
         self.exchange_rates_dict = self._convert_response_json_to_exchange_rates()
 
+    @classmethod
+    def get_shared(cls) -> "ExchangeRates":
+        """Process wide exchange rates table, rebuilt every SHARED_TTL seconds.
+
+        Without caching (EXCHANGE_RATE_CACHE_EXPIRY <= 0) a fresh table is built on every call.
+        """
+        if settings.EXCHANGE_RATE_CACHE_EXPIRY <= 0:
+            return cls()
+        now = time.monotonic()
+        if cls._shared is None or now >= cls._shared_expires_at:
+            cls._shared = cls()
+            cls._shared_expires_at = now + min(cls.SHARED_TTL, settings.EXCHANGE_RATE_CACHE_EXPIRY)
+        return cls._shared
+
+    @classmethod
+    def refresh_shared(cls) -> "ExchangeRates":
+        """Fetch the rates from the API again and rebuild this process' table."""
+        cache.delete(cls.CACHE_KEY)
+        cls._shared = None
+        return cls.get_shared()
+
     def _convert_response_json_to_exchange_rates(self) -> dict[str, SingleExchangeRate]:
         response_json = self._get_response()
         raw_exchange_rates = response_json.get("ROWSET", {}).get("ROW", [])
@@ -64,8 +64,14 @@ TASKS_SCHEDULES = {
         "options": periodic_queue_options(),
     },
     "update_dashboard_figures_async_task": {
+        "task": "hope.apps.dashboard.celery_tasks.update_dashboard_figures",
+        "schedule": crontab(minute="*/30"),
+        "options": periodic_queue_options(),
+    },
+    "full_update_dashboard_figures_async_task": {
         "task": "hope.apps.dashboard.celery_tasks.update_dashboard_figures",
         "schedule": crontab(minute=0, hour=23),
+        "kwargs": {"full_refresh": True},
         "options": periodic_queue_options(),
     },
     "invalidate_permissions_cache_for_user_if_expired_role_async_task": {
@@ -88,6 +94,11 @@ TASKS_SCHEDULES = {
         "schedule": crontab(minute=0, hour=1),
         "options": periodic_queue_options(),
     },
+    "flush_elasticsearch_index_queue_async_task": {
+        "task": "hope.apps.household.celery_tasks.flush_elasticsearch_index_queue_async_task",
+        "schedule": crontab(minute="*"),
+        "options": periodic_queue_options(),
+    },
     "recover_missing_async_jobs_async_task": {
         "task": "hope.apps.core.celery_tasks.recover_missing_async_jobs_async_task",
         "schedule": crontab(minute="*/10"),
@@ -98,6 +109,11 @@ TASKS_SCHEDULES = {
         "schedule": crontab(minute=0, hour=2),
         "options": periodic_queue_options(),
     },
+    "refresh_exchange_rates_async_task": {
+        "task": "hope.apps.core.celery_tasks.refresh_exchange_rates_async_task",
+        "schedule": crontab(minute=0, hour="*/6"),
+        "options": periodic_queue_options(),
+    },
     "interval_recalculate_population_fields_async_task": {
         "task": "hope.apps.household.celery_tasks.interval_recalculate_population_fields_async_task",
         "schedule": crontab(minute=0, hour=0),
@@ -20,7 +20,6 @@ from typing import (
 )
 
 from adminfilters.autocomplete import AutoCompleteFilter
-from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.files.storage import default_storage
 from django.db import transaction
@@ -33,10 +32,12 @@ from PIL import Image
 import pytz
 from rest_framework.exceptions import ValidationError
 
+from hope.apps.core.cache_tags import invalidate_cache_tags
 from hope.apps.utils.exceptions import log_and_raise
 
 if TYPE_CHECKING:
     from django.db.models import Model, QuerySet
+    from openpyxl.worksheet._read_only import ReadOnlyWorksheet
     from openpyxl.worksheet.worksheet import Worksheet
 
     from hope.models import User
@@ -499,10 +500,21 @@ def resolve_flex_fields_choices_to_string(parent: Any) -> dict:
 
 
 class SheetImageLoader:
-    """Load all images in a sheet."""
+    """Load all images in a sheet.
 
-    def __init__(self, sheet: "Worksheet") -> None:
-        self._images = {}
+    For a `StreamingWorksheet` only the drawing anchors are indexed, on first use, and the image bytes
+    are read from the workbook archive when the image is requested.
+    """
+
+    def __init__(self, sheet: "Worksheet | StreamingWorksheet") -> None:
+        self._sheet = sheet
+
+    @functools.cached_property
+    def _images(self) -> dict[str, Callable[[], bytes]]:
+        if isinstance(self._sheet, StreamingWorksheet):
+            return self._index_archive_images(self._sheet.worksheet)
+
+        images = {}
         # Holds an array of A-ZZ
         col_holder = list(
             itertools.chain(
@@ -511,11 +523,47 @@ class SheetImageLoader:
             )
         )
         """Loads all sheet images"""
-        sheet_images = sheet._images
+        sheet_images = self._sheet._images
         for image in sheet_images:
             row = image.anchor._from.row + 1
             col = col_holder[image.anchor._from.col]
-            self._images[f"{col}{row}"] = image._data
+            images[f"{col}{row}"] = image._data
+        return images
+
+    @staticmethod
+    def _index_archive_images(sheet: "ReadOnlyWorksheet") -> dict[str, Callable[[], bytes]]:
+        from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
+        from openpyxl.packaging.relationship import get_dependents, get_rels_path
+        from openpyxl.utils import get_column_letter
+        from openpyxl.xml.constants import IMAGE_NS
+        from openpyxl.xml.functions import fromstring
+
+        archive = sheet.parent._archive
+        archive_files = set(archive.namelist())
+        images: dict[str, Callable[[], bytes]] = {}
+        sheet_rels_path = get_rels_path(sheet._worksheet_path)
+        if sheet_rels_path not in archive_files:
+            return images
+
+        for drawing_rel in get_dependents(archive, sheet_rels_path).find(SpreadsheetDrawing._rel_type):
+            drawing_rels_path = get_rels_path(drawing_rel.target)
+            if drawing_rel.target not in archive_files or drawing_rels_path not in archive_files:
+                continue
+            try:
+                drawing = SpreadsheetDrawing.from_tree(fromstring(archive.read(drawing_rel.target)))
+            except TypeError:  # pragma: no cover
+                logger.warning(f"Unsupported drawing {drawing_rel.target}, its images are skipped")
+                continue
+            image_rels = get_dependents(archive, drawing_rels_path)
+            for blip_rel in drawing._blip_rels:
+                image_rel = image_rels.get(blip_rel.embed)
+                # same as openpyxl, WMF images cannot be read
+                if image_rel.Type != IMAGE_NS or image_rel.target.lower().endswith(".wmf"):
+                    continue
+                anchor = blip_rel.anchor._from
+                cell = f"{get_column_letter(anchor.col + 1)}{anchor.row + 1}"
+                images[cell] = functools.partial(archive.read, image_rel.target)
+        return images
 
     def image_in(self, cell: str) -> bool:
         """Check if there's an image in specified cell."""
@@ -529,6 +577,101 @@ class SheetImageLoader:
         return Image.open(image)
 
 
+class SheetCell:
+    """Cell of a `StreamingWorksheet`, with the part of openpyxl's Cell API used by the XLSX importers."""
+
+    __slots__ = ("column", "row", "value")
+
+    def __init__(self, value: Any, row: int, column: int) -> None:
+        self.value = value
+        self.row = row
+        self.column = column
+
+    @property
+    def column_letter(self) -> str:
+        from openpyxl.utils import get_column_letter
+
+        return get_column_letter(self.column)
+
+    @property
+    def coordinate(self) -> str:
+        return f"{self.column_letter}{self.row}"
+
+    def __repr__(self) -> str:
+        return f"<SheetCell {self.coordinate}>"
+
+
+class StreamingWorksheet:
+    """Worksheet read row by row from the workbook archive, memory does not grow with the number of rows.
+
+    Mirrors the part of openpyxl's Worksheet API the XLSX importers use: `sheet[1]` for the header row,
+    `sheet["A"]` for a column, `iter_rows` and `iter_cols`. Rows are cut or padded to the header width.
+    """
+
+    def __init__(self, worksheet: "ReadOnlyWorksheet") -> None:
+        self.worksheet = worksheet
+        # dimensions stored by the spreadsheet applications are not reliable
+        worksheet.reset_dimensions()
+        self.title = worksheet.title
+        header = next(worksheet.iter_rows(min_row=1, max_row=1, values_only=True), ())
+        self.max_column = len(header)
+
+    def iter_rows(
+        self, min_row: int = 1, max_row: int | None = None, values_only: bool = False
+    ) -> Iterator[tuple[Any, ...]]:
+        padding = (None,) * self.max_column
+        rows = self.worksheet.iter_rows(min_row=min_row, max_row=max_row, values_only=True)
+        for row_number, row_values in enumerate(rows, start=min_row):
+            # missing rows come as empty lists
+            values = (tuple(row_values) + padding)[: self.max_column]
+            if values_only:
+                yield values
+            else:
+                yield tuple(SheetCell(value, row_number, column) for column, value in enumerate(values, start=1))
+
+    def iter_cols(
+        self, min_col: int, max_col: int, min_row: int = 1, values_only: bool = False
+    ) -> Iterator[tuple[Any, ...]]:
+        columns: list[list] = [[] for _ in range(min_col, max_col + 1)]
+        for row in self.iter_rows(min_row=min_row, values_only=values_only):
+            for column, cell in zip(columns, row[min_col - 1 : max_col], strict=True):
+                column.append(cell)
+        yield from (tuple(column) for column in columns)
+
+    def __getitem__(self, key: int | str) -> tuple[Any, ...]:
+        if isinstance(key, int):
+            return next(self.iter_rows(min_row=key, max_row=key), ())
+        from openpyxl.utils import column_index_from_string
+
+        column = column_index_from_string(key)
+        return next(self.iter_cols(min_col=column, max_col=column))
+
+
+class StreamingWorkbook:
+    """Read-only workbook handing out `StreamingWorksheet`s, use as a context manager to release the file."""
+
+    def __init__(self, file: Any, data_only: bool = True) -> None:
+        from openpyxl import load_workbook
+
+        self.workbook = load_workbook(file, read_only=True, data_only=data_only)
+
+    @property
+    def sheetnames(self) -> list[str]:
+        return self.workbook.sheetnames
+
+    def __getitem__(self, name: str) -> StreamingWorksheet:
+        return StreamingWorksheet(self.workbook[name])
+
+    def close(self) -> None:
+        self.workbook.close()
+
+    def __enter__(self) -> "StreamingWorkbook":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
 def map_unicef_ids_to_households_unicef_ids(excluded_ids_string: str) -> list:
     excluded_ids_array = excluded_ids_string.split(",") if excluded_ids_string else []
     excluded_ids_array = [excluded_id.strip() for excluded_id in excluded_ids_array]
@@ -559,11 +702,8 @@ def timezone_datetime(value: Any) -> datetime:
 
 
 def clear_cache_for_key(key: str) -> None:
-    """Remove cache if key starts with."""
-    if hasattr(cache, "keys"):
-        all_cache_keys = cache.keys(f"{key}*")
-        for k in all_cache_keys:
-            cache.delete(k)
+    """Remove the cache entries tagged with `key` (see `hope.apps.core.cache_tags`)."""
+    invalidate_cache_tags(key)
 
 
 # Constants for the identification type field to key mapping, used until other systems are updated to use the new keys
@@ -5,13 +5,17 @@ from celery import Task
 from django.conf import settings
 from django.core.cache import cache
 from django.db import OperationalError, ProgrammingError
+from django.utils import timezone
 import psycopg2
 
 from hope.apps.core.celery import app
 from hope.apps.dashboard.services import (
+    DASHBOARD_WATERMARK_CACHE_KEY,
     GLOBAL_SLUG,
+    WATERMARK_OVERLAP,
     DashboardDataCache,
     DashboardGlobalDataCache,
+    get_changed_dashboard_years,
 )
 from hope.apps.utils.logs import log_start_and_end
 from hope.apps.utils.sentry import sentry_tags, set_sentry_business_area_tag
@@ -19,6 +23,8 @@ from hope.models import BusinessArea
 
 logger = logging.getLogger(__name__)
 
+DASHBOARD_UPDATE_LOCK_KEY = "dash_report_update_running"
+
 
 @app.task(
     autoretry_for=(OperationalError, ProgrammingError, psycopg2.errors.InvalidCursorName),
@@ -26,16 +32,42 @@ logger = logging.getLogger(__name__)
 )
 @log_start_and_end
 @sentry_tags
-def update_dashboard_figures() -> None:
-    """Celery task that runs periodically (e.g., daily) to refresh all dashboard data."""
+def update_dashboard_figures(full_refresh: bool = False) -> None:
+    """Celery task that runs periodically to refresh the dashboard data changed since its previous run.
+
+    Only the years of the business areas with changed payments (see `get_changed_dashboard_years`) are
+    recomputed. The first run and the daily `full_refresh` recompute everything, which also picks up the
+    changes that are not tracked, e.g. renamed areas or service providers.
+    """
+    if not cache.add(DASHBOARD_UPDATE_LOCK_KEY, True, timeout=60 * 60 * 6):
+        logger.info("Dashboard update skipped, the previous one is still running")
+        return
+    try:
+        _update_dashboard_figures(full_refresh)
+    finally:
+        cache.delete(DASHBOARD_UPDATE_LOCK_KEY)
+
+
+def _update_dashboard_figures(full_refresh: bool) -> None:
+    started_at = timezone.now()
+    watermark = None if full_refresh else cache.get(DASHBOARD_WATERMARK_CACHE_KEY)
+    changed_years = get_changed_dashboard_years(watermark - WATERMARK_OVERLAP) if watermark else None
+
     business_areas_with_households = BusinessArea.objects.using(settings.DASHBOARD_DB).filter(active=True)
+    if changed_years is not None:
+        business_areas_with_households = business_areas_with_households.filter(slug__in=changed_years.keys())
 
     for business_area in business_areas_with_households:
         set_sentry_business_area_tag(business_area.slug)
         lock_key = f"dash_report_task_running_{business_area.slug}"
         lock_acquired = cache.add(lock_key, True, timeout=60 * 60)
         try:
-            DashboardDataCache.refresh_data(business_area.slug)
+            if changed_years is None:
+                DashboardDataCache.refresh_data(business_area.slug)
+            else:
+                DashboardDataCache.refresh_data(
+                    business_area.slug, years_to_refresh=sorted(changed_years[business_area.slug])
+                )
         finally:
             if lock_acquired:
                 cache.delete(lock_key)
@@ -44,11 +76,17 @@ def update_dashboard_figures() -> None:
     global_lock_key = f"dash_report_task_running_{GLOBAL_SLUG}"
     global_lock_acquired = cache.add(global_lock_key, True, timeout=60 * 60)
     try:
-        DashboardGlobalDataCache.refresh_data()
+        if changed_years is None:
+            DashboardGlobalDataCache.refresh_data()
+        elif global_years := sorted(set().union(*changed_years.values())):
+            DashboardGlobalDataCache.refresh_data(years_to_refresh=global_years)
     finally:
         if global_lock_acquired:
             cache.delete(global_lock_key)
 
+    # a failed run keeps the previous watermark, its changes are refreshed by the retry or the next run
+    cache.set(DASHBOARD_WATERMARK_CACHE_KEY, started_at, None)
+
 
 @app.task(
     autoretry_for=(OperationalError, ProgrammingError, psycopg2.errors.InvalidCursorName),
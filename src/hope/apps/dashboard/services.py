@@ -1,6 +1,7 @@
 import calendar
 from collections import defaultdict
 from collections.abc import Iterable
+from datetime import datetime, timedelta
 from itertools import batched
 import json
 import logging
@@ -104,6 +105,44 @@ def get_fertility_rate(country: str, year: int) -> float:
 GLOBAL_SLUG = "global"
 DEFAULT_ITERATOR_CHUNK_SIZE = 2500
 HOUSEHOLD_BATCH_SIZE = 2500
+DASHBOARD_WATERMARK_CACHE_KEY = "dashboard_data_watermark"
+# changes committed while the previous update was reading the dashboard database are picked up again
+WATERMARK_OVERLAP = timedelta(minutes=10)
+# a change of the payment or of these relations alters the figures the payment contributes to
+PAYMENT_CHANGE_LOOKUPS = (
+    "updated_at",
+    "parent__updated_at",
+    "program__updated_at",
+    "household__updated_at",
+    "payment_verifications__updated_at",
+    "parent__payment_verification_plans__updated_at",
+)
+
+
+def get_changed_dashboard_years(since: datetime) -> dict[str, set[int]]:
+    """Return the years of the dashboard figures changed since `since`, per business area slug.
+
+    The figures of a business area are recomputed per year, the smallest slice in which the distinct
+    household and payment plan counts stay exact. A change is mapped to the years of the current dates of
+    the payment, removed payments included. The year a payment was moved away from keeps its old figures
+    until the daily full refresh, as do writes that don't bump `updated_at` (queryset `update()`).
+    """
+    changed_years: dict[str, set[int]] = defaultdict(set)
+    for lookup in PAYMENT_CHANGE_LOOKUPS:
+        changed_payments = (
+            Payment.all_objects.using(settings.DASHBOARD_DB)
+            .filter(**{f"{lookup}__gte": since})
+            .values_list(
+                "business_area__slug",
+                ExtractYear("delivery_date"),
+                ExtractYear("entitlement_date"),
+                ExtractYear("status_date"),
+            )
+            .distinct()
+        )
+        for business_area_slug, *years in changed_payments:
+            changed_years[business_area_slug].update(year for year in years if year)
+    return {slug: years for slug, years in changed_years.items() if years}
 
 
 class CountrySummaryDict(TypedDict):
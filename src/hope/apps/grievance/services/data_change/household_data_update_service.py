@@ -196,8 +196,8 @@ class HouseholdDataUpdateService(DataChangeService):
 
         Household.objects.filter(id=household.id).update(flex_fields=merged_flex_fields, **only_approved_data)
 
-        invalidate_household_list_cache(household.program_id)
         updated_household = Household.objects.get(id=household.id)
+        invalidate_household_list_cache(household.program_id, [household, updated_household])
 
         if admin_area_title.get("value") is not None and is_approved(admin_area_title):
             area = Area.objects.filter(p_code=admin_area_title.get("value")).first()
@@ -302,8 +302,8 @@ class IndividualDataUpdateService(DataChangeService):
             admin_area_title = hh_approved_data.pop("admin_area_title", None)
             Household.objects.filter(id=household.id).update(**hh_approved_data, updated_at=timezone.now())
 
-            invalidate_household_list_cache(household.program_id)
             updated_household = Household.objects.get(id=household.id)
+            invalidate_household_list_cache(household.program_id, [household, updated_household])
             if admin_area_title:
                 area = Area.objects.filter(p_code=admin_area_title).first()
                 updated_household.set_admin_areas(area)
@@ -362,7 +362,7 @@ class IndividualDataUpdateService(DataChangeService):
             updated_at=timezone.now(),
         )
 
-        invalidate_household_and_individual_list_cache(new_individual.program_id)
+        invalidate_household_and_individual_list_cache(new_individual.program_id, [household])
         relationship_to_head_of_household = individual_data.get("relationship")
         if (
             household
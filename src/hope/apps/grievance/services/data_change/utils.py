@@ -26,13 +26,14 @@ from hope.apps.household.const import (
     ROLE_ALTERNATE,
     ROLE_PRIMARY,
 )
-from hope.apps.household.documents import get_household_doc, get_individual_doc
+from hope.apps.household.services.index_queue import enqueue_for_indexing
 from hope.models import (
     Account,
     AccountType,
     Country,
     Document,
     DocumentType,
+    ElasticsearchIndexQueue,
     FlexibleAttribute,
     Household,
     Individual,
@@ -473,6 +474,8 @@ def save_images(flex_fields: dict, associated_with: str) -> None:
 def update_es(individual: Individual) -> None:
     if not config.IS_ELASTICSEARCH_ENABLED:
         return
-    get_individual_doc(str(individual.program.id))().update(individual)
-    if individual.household:
-        get_household_doc(str(individual.program.id))().update(individual.household)
+    enqueue_for_indexing(ElasticsearchIndexQueue.DocumentType.INDIVIDUAL, individual.program_id, [individual.pk])
+    if individual.household_id:
+        enqueue_for_indexing(
+            ElasticsearchIndexQueue.DocumentType.HOUSEHOLD, individual.program_id, [individual.household_id]
+        )
@@ -2,11 +2,11 @@ import logging
 import os
 
 from django.contrib.auth.models import AbstractUser
-from django.core.cache import cache
 from django.core.exceptions import PermissionDenied
 from django.db.models import Q, QuerySet
 from rest_framework.exceptions import ValidationError
 
+from hope.apps.core.utils import clear_cache_for_key
 from hope.apps.grievance.models import (
     GrievanceDocument,
     GrievanceTicket,
@@ -62,13 +62,13 @@ def clear_cache(
     business_area_slug: str,
 ) -> None:
     if isinstance(ticket_details, TicketHouseholdDataUpdateDetails | TicketDeleteHouseholdDetails):
-        cache.delete_pattern(f"count_{business_area_slug}_HouseholdNodeConnection_*")
+        clear_cache_for_key(f"count_{business_area_slug}_HouseholdNodeConnection_")
 
     if isinstance(
         ticket_details,
         TicketAddIndividualDetails | TicketIndividualDataUpdateDetails | TicketDeleteIndividualDetails,
     ):
-        cache.delete_pattern(f"count_{business_area_slug}_IndividualNodeConnection_*")
+        clear_cache_for_key(f"count_{business_area_slug}_IndividualNodeConnection_")
 
 
 def create_grievance_documents(user: AbstractUser, grievance_ticket: GrievanceTicket, documents: list[dict]) -> None:
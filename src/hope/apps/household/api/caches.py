@@ -1,6 +1,16 @@
-from typing import Any
+"""Versions of the cached household and individual lists of a program.
+
+Every change bumps the program version of the list, which keys the unfiltered responses. Responses filtered
+by an admin area (`admin1` / `admin2`) are keyed by the version of that area partition instead, bumped only
+by the changes of the records located in it, so an edit in one area keeps the filtered pages of the others.
+Changes whose areas are unknown (`.update()`, bulk operations) bump the partitions version of the program,
+which invalidates all the partitions at once.
+"""
+
+from typing import Any, Iterable
 from uuid import UUID
 
+from django.core.cache import cache
 from django.db import transaction
 from rest_framework_extensions.key_constructor.bits import KeyBitBase
 
@@ -13,6 +23,38 @@ from hope.api.caches import (
 
 HOUSEHOLD_LIST_PROGRAM_KEY = "{program_id}:households_list:version"
 INDIVIDUAL_LIST_PROGRAM_KEY = "{program_id}:individuals_list:version"
+HOUSEHOLD_LIST_PARTITION_KEY = "{program_id}:households_list:{partition}:version"
+INDIVIDUAL_LIST_PARTITION_KEY = "{program_id}:individuals_list:{partition}:version"
+ALL_PARTITIONS = "partitions"
+# the most specific filter present in the request selects the partition
+LIST_PARTITION_FILTERS = ("admin2", "admin1")
+
+
+def get_list_partitions(admin_area_ids: dict[str, Any]) -> set[str]:
+    """Return the partitions of a record located in `admin_area_ids`, e.g. {"admin1": id, "admin2": id}."""
+    return {f"{admin_field}:{area_id}" for admin_field, area_id in admin_area_ids.items() if area_id}
+
+
+def get_household_list_partitions(household: Any) -> set[str]:
+    return get_list_partitions({"admin1": household.admin1_id, "admin2": household.admin2_id})
+
+
+def get_households_list_partitions(households: Iterable[Any] | None) -> set[str] | None:
+    if households is None:
+        return None
+    return set().union(*(get_household_list_partitions(household) for household in households if household))
+
+
+def get_request_list_partition(request: Any) -> str | None:
+    """Return the partition selected by the filters, None (program version) without a valid area filter."""
+    for admin_field in LIST_PARTITION_FILTERS:
+        if value := request.query_params.get(admin_field):
+            try:
+                # the signals bump the canonical form of the id
+                return f"{admin_field}:{UUID(value)}"
+            except ValueError:
+                return None
+    return None
 
 
 def get_household_list_program_key(program_id: Any) -> Any:
@@ -31,34 +73,73 @@ def increment_individual_list_program_key(program_id: Any) -> int:
     return increment_cache_key(INDIVIDUAL_LIST_PROGRAM_KEY.format(program_id=program_id))
 
 
-def invalidate_household_list_cache(program_id: UUID) -> None:
+def increment_household_list_partition_keys(program_id: Any, partitions: Iterable[str]) -> None:
+    for partition in partitions:
+        increment_cache_key(HOUSEHOLD_LIST_PARTITION_KEY.format(program_id=program_id, partition=partition))
+
+
+def increment_individual_list_partition_keys(program_id: Any, partitions: Iterable[str]) -> None:
+    for partition in partitions:
+        increment_cache_key(INDIVIDUAL_LIST_PARTITION_KEY.format(program_id=program_id, partition=partition))
+
+
+def increment_household_list_keys(program_id: Any, partitions: Iterable[str] | None) -> None:
+    """Bump the program version and `partitions`, all the partitions when they are None."""
+    increment_household_list_program_key(program_id)
+    increment_household_list_partition_keys(program_id, [ALL_PARTITIONS] if partitions is None else partitions)
+
+
+def increment_individual_list_keys(program_id: Any, partitions: Iterable[str] | None) -> None:
+    """Bump the program version and `partitions`, all the partitions when they are None."""
+    increment_individual_list_program_key(program_id)
+    increment_individual_list_partition_keys(program_id, [ALL_PARTITIONS] if partitions is None else partitions)
+
+
+def invalidate_household_list_cache(program_id: UUID, households: Iterable[Any] | None = None) -> None:
     """Invalidate household list cache for a program.
 
     Call explicitly after Household.objects.filter(...).update(...)
     since .update() bypasses post_save signals.
+    Pass the updated `households` to invalidate only their areas, as loaded both before and after
+    the update when it can move them.
     """
-    transaction.on_commit(lambda: increment_household_list_program_key(program_id))
+    partitions = get_households_list_partitions(households)
+    transaction.on_commit(lambda: increment_household_list_keys(program_id, partitions))
 
 
-def invalidate_individual_list_cache(program_id: UUID) -> None:
+def invalidate_individual_list_cache(program_id: UUID, households: Iterable[Any] | None = None) -> None:
     """Invalidate individual list cache for a program.
 
     Call explicitly after Individual.objects.filter(...).update(...)
     since .update() bypasses post_save signals.
+    Pass the households of the updated individuals to invalidate only their areas.
     """
-    transaction.on_commit(lambda: increment_individual_list_program_key(program_id))
+    partitions = get_households_list_partitions(households)
+    transaction.on_commit(lambda: increment_individual_list_keys(program_id, partitions))
 
 
-def invalidate_household_and_individual_list_cache(program_id: UUID) -> None:
+def invalidate_household_and_individual_list_cache(program_id: UUID, households: Iterable[Any] | None = None) -> None:
     """Invalidate both household and individual list caches for a program."""
-    invalidate_household_list_cache(program_id)
-    invalidate_individual_list_cache(program_id)
+    households = None if households is None else list(households)
+    invalidate_household_list_cache(program_id, households)
+    invalidate_individual_list_cache(program_id, households)
+
+
+def get_list_partition_version(partition_key: str, program_id: Any, partition: str) -> str:
+    keys = [
+        partition_key.format(program_id=program_id, partition=ALL_PARTITIONS),
+        partition_key.format(program_id=program_id, partition=partition),
+    ]
+    versions = cache.get_many(keys)
+    return ":".join(str(versions.get(key, 0)) for key in keys)
 
 
 class HouseholdListKeyBit(KeyBitBase):
     def get_data(  # noqa: PLR0913 – override of base method signature
         self, params: Any, view_instance: Any, view_method: Any, request: Any, args: tuple, kwargs: dict
     ) -> str:
+        if partition := get_request_list_partition(request):
+            return get_list_partition_version(HOUSEHOLD_LIST_PARTITION_KEY, view_instance.program.id, partition)
         return str(get_household_list_program_key(view_instance.program.id))
 
 
@@ -66,6 +147,8 @@ class IndividualListKeyBit(KeyBitBase):
     def get_data(  # noqa: PLR0913 – override of base method signature
         self, params: Any, view_instance: Any, view_method: Any, request: Any, args: tuple, kwargs: dict
     ) -> str:
+        if partition := get_request_list_partition(request):
+            return get_list_partition_version(INDIVIDUAL_LIST_PARTITION_KEY, view_instance.program.id, partition)
         return str(get_individual_list_program_key(view_instance.program.id))
 
 
@@ -18,11 +18,12 @@ from hope.apps.household.documents import (
 )
 from hope.apps.household.services.household_recalculate_data import recalculate_data
 from hope.apps.household.services.index_management import delete_program_indexes
+from hope.apps.household.services.index_queue import flush_index_queue
 from hope.apps.program.utils import enroll_households_to_program
 from hope.apps.utils.elasticsearch_utils import populate_index
 from hope.apps.utils.phone import calculate_phone_numbers_validity
 from hope.apps.utils.sentry import set_sentry_business_area_tag
-from hope.models import AsyncJob, Household, Individual, PeriodicAsyncJob, Program
+from hope.models import AsyncJob, ElasticsearchIndexQueue, Household, Individual, PeriodicAsyncJob, Program
 
 logger = logging.getLogger(__name__)
 
@@ -332,3 +333,20 @@ def cleanup_indexes_in_inactive_programs_async_task() -> None:
         group_key="household",
         description="Cleanup indexes in inactive programs",
     )
+
+
+def flush_elasticsearch_index_queue_async_task_action(job: AsyncJob) -> None:
+    flush_index_queue()
+
+
+@app.task()
+def flush_elasticsearch_index_queue_async_task() -> None:
+    if not ElasticsearchIndexQueue.objects.exists():
+        return
+    PeriodicAsyncJob.queue_task(
+        job_name=flush_elasticsearch_index_queue_async_task.__name__,
+        action="hope.apps.household.celery_tasks.flush_elasticsearch_index_queue_async_task_action",
+        config={},
+        group_key="household",
+        description="Sync queued individuals and households to Elasticsearch",
+    )
@@ -1,10 +1,14 @@
+from functools import partial
+from typing import Any, Iterable, Iterator
+
 from django.conf import settings
-from django.db.models import QuerySet
+from django.db import transaction
+from django.db.models import Model, QuerySet
 from django_elasticsearch_dsl import Document, fields
 from elasticsearch.dsl import AttrDict
 
 from hope.apps.core.es_analyzers import name_synonym_analyzer, phonetic_analyzer
-from hope.apps.utils.elasticsearch_utils import DEFAULT_SCRIPT
+from hope.apps.utils.elasticsearch_utils import DEFAULT_SCRIPT, is_index_rebuilding, record_index_writes
 from hope.models import Household, Individual, IndividualIdentity, IndividualRoleInHousehold
 
 type RelatedInstanceType = Document | Household | IndividualIdentity | IndividualRoleInHousehold
@@ -42,7 +46,26 @@ class _PreparedFieldsFix:
         self._d_["_prepared_fields"] = value
 
 
-class IndividualDocument(_PreparedFieldsFix, Document):
+class _RecordWritesDuringRebuild:
+    """Mixin that logs the ids of every bulk action while the index is rebuilt, see `capture_index_writes`.
+
+    A rebuild fills a new index from the database, writes arriving meanwhile are re-synced from the database
+    before the alias is swapped. The ids are logged once the writing transaction committed.
+    """
+
+    def _get_actions(self, object_list: Iterable[Model], action: str) -> Iterator[dict[str, Any]]:
+        alias = self._index._name
+        if not is_index_rebuilding(alias):
+            yield from super()._get_actions(object_list, action)
+            return
+        written_ids = []
+        for bulk_action in super()._get_actions(object_list, action):
+            written_ids.append(bulk_action["_id"])
+            yield bulk_action
+        transaction.on_commit(partial(record_index_writes, alias, written_ids))
+
+
+class IndividualDocument(_RecordWritesDuringRebuild, _PreparedFieldsFix, Document):
     id = fields.KeywordField()  # The boost parameter on field mappings has been removed
     given_name = fields.TextField(
         analyzer=name_synonym_analyzer,
@@ -108,6 +131,11 @@ class IndividualDocument(_PreparedFieldsFix, Document):
     def prepare_business_area(self, instance: Individual) -> str:
         return instance.business_area.slug
 
+    def optimize_queryset(self, queryset: QuerySet[Individual]) -> QuerySet[Individual]:
+        return queryset.select_related("household__admin1", "household__admin2", "business_area").prefetch_related(
+            "documents__type", "documents__country", "identities__partner"
+        )
+
     class Django:
         model = Individual
 
@@ -131,7 +159,7 @@ class IndividualDocument(_PreparedFieldsFix, Document):
         return None
 
 
-class HouseholdDocument(_PreparedFieldsFix, Document):
+class HouseholdDocument(_RecordWritesDuringRebuild, _PreparedFieldsFix, Document):
     head_of_household = fields.ObjectField(
         properties={
             "unicef_id": fields.TextField(),
@@ -172,6 +200,11 @@ class HouseholdDocument(_PreparedFieldsFix, Document):
     def prepare_business_area(self, instance: Household) -> str:
         return instance.business_area.slug
 
+    def optimize_queryset(self, queryset: QuerySet[Household]) -> QuerySet[Household]:
+        return queryset.select_related("head_of_household", "admin1", "admin2", "business_area").prefetch_related(
+            "head_of_household__documents__type", "head_of_household__documents__country"
+        )
+
     class Django:
         model = Household
         fields = []
@@ -3,7 +3,7 @@ import logging
 from typing import Any
 
 from constance import config
-from django.db.models import Exists, OuterRef, Q, QuerySet, Value
+from django.db.models import Case, Exists, IntegerField, OuterRef, Q, QuerySet, Value, When
 from django.db.models.functions import Lower, Replace
 from django.utils import timezone
 from django_filters import (
@@ -39,6 +39,32 @@ from hope.models.utils import MergeStatusModel
 
 logger = logging.getLogger(__name__)
 
+ES_SEARCH_MAX_HITS = 100
+
+
+def _search_es_ids(document: Any, query_dict: dict) -> list[str]:
+    response = document.search().params(search_type="dfs_query_then_fetch").update_from_dict(query_dict).execute()
+    return [hit.meta["id"] for hit in response]
+
+
+def _filter_by_es_hits(qs: QuerySet, es_ids: list[str], data: Any, extra_query: Q | None = None) -> QuerySet:
+    """Limit `qs` to the Elasticsearch hits, ordered by relevance unless the request sorts the list.
+
+    At most `ES_SEARCH_MAX_HITS` primary keys reach PostgreSQL and no join is added, so no DISTINCT is needed.
+    """
+    query = Q(id__in=es_ids)
+    if extra_query:
+        query |= extra_query
+    qs = qs.filter(query)
+    if not es_ids or data.get("ordering") or data.get("order_by"):
+        return qs
+    relevance = Case(
+        *(When(id=es_id, then=Value(position)) for position, es_id in enumerate(es_ids)),
+        default=Value(len(es_ids)),
+        output_field=IntegerField(),
+    )
+    return qs.order_by(relevance, "created_at")
+
 
 def _prepare_kobo_asset_id_value(code: str) -> str:  # pragma: no cover
     """Prepare value for filter by kobo_asset_id.
@@ -166,22 +192,16 @@ class HouseholdFilter(UpdatedAtFilter):
                 inner_query |= Q(detail_id__endswith=_value)
 
         query_dict = self._get_elasticsearch_query_for_households(search, program)
-        es_response = (
-            get_household_doc(str(program.id))
-            .search()
-            .params(search_type="dfs_query_then_fetch")
-            .update_from_dict(query_dict)
-            .execute()
-        )
-        es_ids = [x.meta["id"] for x in es_response]
-        return qs.filter(Q(id__in=es_ids) | inner_query).distinct()
+        es_ids = _search_es_ids(get_household_doc(str(program.id)), query_dict)
+        return _filter_by_es_hits(qs, es_ids, self.data, inner_query)
 
     def _get_elasticsearch_query_for_households(self, search: str, program: Program) -> dict:
         business_area = self.request.parser_context["kwargs"]["business_area_slug"]
         es_filters = [{"term": {"business_area": business_area}}, {"term": {"program_id": str(program.pk)}}]
         query: dict[str, Any] = {
-            "size": "100",
+            "size": ES_SEARCH_MAX_HITS,
             "_source": False,
+            "track_total_hits": False,
             "query": {
                 "bool": {
                     "minimum_should_match": 1,
@@ -361,24 +381,16 @@ class IndividualFilter(UpdatedAtFilter):
     def _search_es(self, qs: QuerySet[Individual], value: str, program: Program) -> QuerySet[Individual]:
         search = value.strip()
         query_dict = self._get_elasticsearch_query_for_individuals(search, program)
-
-        individual_doc_class = get_individual_doc(str(program.id))
-        es_response = (
-            individual_doc_class.search()
-            .params(search_type="dfs_query_then_fetch")
-            .update_from_dict(query_dict)
-            .execute()
-        )
-
-        es_ids = [x.meta["id"] for x in es_response]
-        return qs.filter(Q(id__in=es_ids)).distinct()
+        es_ids = _search_es_ids(get_individual_doc(str(program.id)), query_dict)
+        return _filter_by_es_hits(qs, es_ids, self.data)
 
     def _get_elasticsearch_query_for_individuals(self, search: str, program: Program) -> dict:
         business_area = self.request.parser_context["kwargs"]["business_area_slug"]
         es_filters = [{"term": {"business_area": business_area}}, {"term": {"program_id": str(program.pk)}}]
         return {
-            "size": 100,
+            "size": ES_SEARCH_MAX_HITS,
             "_source": False,
+            "track_total_hits": False,
             "query": {
                 "bool": {
                     "filter": es_filters,
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.14 on 2026-10-18 09:12
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("household", "0045_migration"),
+        ("program", "0020_migration"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ElasticsearchIndexQueue",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "document_type",
+                    models.CharField(choices=[("individual", "Individual"), ("household", "Household")], max_length=16),
+                ),
+                ("object_id", models.UUIDField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "program",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="program.program",
+                    ),
+                ),
+            ],
+        ),
+    ]
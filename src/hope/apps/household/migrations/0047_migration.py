@@ -0,0 +1,25 @@
+# Generated by Django 5.2.14 on 2026-10-18 10:41
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("household", "0046_migration"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name="document",
+            index=GinIndex(
+                OpClass(django.db.models.functions.text.Upper("document_number"), name="gin_trgm_ops"),
+                name="doc_number_upper_trgm_idx",
+            ),
+        ),
+    ]
@@ -1,16 +1,23 @@
 """Elasticsearch Index Management for Per-Program Indexes.
 
 Simple utilities for managing per-program Elasticsearch indexes.
+
+The documents read and write through an alias (`Document._index._name`) that points to a versioned
+concrete index. A rebuild fills a new concrete index next to the live one and swaps the alias in a
+single request, so searches never see a missing or half filled index.
 """
 
+from itertools import batched
 import logging
+from typing import Any
 
 from constance import config
+from django.utils import timezone
 from elasticsearch import Elasticsearch
 from elasticsearch.dsl import connections
 
 from hope.apps.household.documents import get_household_doc, get_individual_doc
-from hope.apps.utils.elasticsearch_utils import populate_index
+from hope.apps.utils.elasticsearch_utils import bulk_populate_index, capture_index_writes
 
 logger = logging.getLogger(__name__)
 
@@ -27,19 +34,24 @@ def delete_es_index(es: Elasticsearch, index_name: str) -> None:
         es.options(ignore_status=[400, 404]).indices.delete(index=concrete)
 
 
+def _create_versioned_index(doc_class: Any, using: str, with_alias: bool) -> str:
+    """Create a new concrete index with the document mapping, optionally already behind the document alias."""
+    alias = doc_class._index._name
+    index_name = f"{alias}-{timezone.now():%Y%m%d%H%M%S%f}"
+    index = doc_class._index.clone(name=index_name)
+    if with_alias:
+        index.aliases(**{alias: {}})
+    index.create(using=using)
+    return index_name
+
+
 def create_program_indexes(program_id: str, using: str = "default") -> tuple[bool, str]:
     """Create Elasticsearch indexes for a program."""
     try:
-        individual_doc_class = get_individual_doc(program_id)
-        household_doc_class = get_household_doc(program_id)
-
         es: Elasticsearch = connections.get_connection(using)
-
-        if not es.indices.exists(index=individual_doc_class._index._name):
-            individual_doc_class._index.create()
-
-        if not es.indices.exists(index=household_doc_class._index._name):
-            household_doc_class._index.create()
+        for doc_class in (get_individual_doc(program_id), get_household_doc(program_id)):
+            if not es.indices.exists(index=doc_class._index._name):
+                _create_versioned_index(doc_class, using, with_alias=True)
 
         return True, ""
     except Exception as e:  # pragma: no cover  # noqa
@@ -66,20 +78,22 @@ def delete_program_indexes(program_id: str, using: str = "default") -> tuple[boo
 def populate_program_indexes(
     program_id: str,
     batch_size: int = 2000,
-    parallel: bool = False,
+    parallel: bool = True,
     thread_count: int = 4,
     using: str = "default",
 ) -> tuple[bool, str]:
     """Populate Elasticsearch indexes for a program."""
     try:
-        individual_doc_class = get_individual_doc(program_id)
-        household_doc_class = get_household_doc(program_id)
-
-        individuals = individual_doc_class().get_queryset()
-        households = household_doc_class().get_queryset()
-
-        populate_index(individuals, individual_doc_class, parallel=parallel, chunk_size=batch_size)
-        populate_index(households, household_doc_class, parallel=parallel, chunk_size=batch_size)
+        for doc_class in (get_individual_doc(program_id), get_household_doc(program_id)):
+            _, failed = bulk_populate_index(
+                doc_class().get_queryset(),
+                doc_class,
+                chunk_size=batch_size,
+                thread_count=thread_count if parallel else 1,
+                using=using,
+            )
+            if failed:
+                return False, f"{failed} documents failed to index into {doc_class._index._name}"
 
         return True, ""
     except Exception as e:  # pragma: no cover  # noqa
@@ -87,27 +101,86 @@ def populate_program_indexes(
         return False, str(e)
 
 
+def _sync_written_documents(doc_class: Any, index_name: str, object_ids: set[str], batch_size: int, using: str) -> None:
+    """Re-read the records written during a rebuild from the database into `index_name`."""
+    es: Elasticsearch = connections.get_connection(using)
+    for ids in batched(sorted(object_ids), batch_size, strict=False):
+        queryset = doc_class().get_queryset().filter(id__in=ids)
+        existing_ids = {str(pk) for pk in queryset.values_list("id", flat=True)}
+        if existing_ids:
+            _, failed = bulk_populate_index(
+                queryset, doc_class, chunk_size=batch_size, using=using, index_name=index_name
+            )
+            if failed:
+                raise ValueError(f"{failed} documents failed to index into {index_name}")
+        if removed_ids := set(ids) - existing_ids:
+            es.delete_by_query(
+                index=index_name, query={"terms": {"_id": sorted(removed_ids)}}, conflicts="proceed", refresh=True
+            )
+
+
+def _rebuild_index(doc_class: Any, batch_size: int, thread_count: int, using: str) -> str:
+    """Build a new index for `doc_class` and swap the alias to it, return an error message on failure.
+
+    The ids written to the alias during the build are recorded and re-read from the database into the new
+    index once the bulk load is done. The old index stays live until then, the alias is moved and the old
+    index dropped in one `update_aliases` call. Writes recorded while catching up are synced once more after
+    the swap, later ones reach the new index through the alias.
+    """
+    es: Elasticsearch = connections.get_connection(using)
+    alias = doc_class._index._name
+    new_index = _create_versioned_index(doc_class, using, with_alias=False)
+    with capture_index_writes(alias) as written_ids:
+        try:
+            indexed, failed = bulk_populate_index(
+                doc_class().get_queryset(),
+                doc_class,
+                chunk_size=batch_size,
+                thread_count=thread_count,
+                using=using,
+                index_name=new_index,
+            )
+            if failed:
+                raise ValueError(f"{failed} documents failed to index into {new_index}")
+            # nothing else writes into the new index before the swap, the counts can't drift
+            es_count = es.count(index=new_index)["count"]
+            if es_count != indexed:
+                raise ValueError(f"Index {new_index} holds {es_count} documents, expected {indexed}")
+            _sync_written_documents(doc_class, new_index, written_ids(), batch_size, using)
+
+            actions: list[dict] = [{"add": {"index": new_index, "alias": alias}}]
+            if es.indices.exists(index=alias):
+                # `remove_index` also replaces a concrete index created under the alias name
+                actions.extend({"remove_index": {"index": old}} for old in _resolve_to_concrete_indexes(es, alias))
+            es.indices.update_aliases(actions=actions)
+        except Exception as e:  # noqa
+            logger.error(f"Failed to rebuild index {alias}: {e}")
+            es.options(ignore_status=[404]).indices.delete(index=new_index)
+            return str(e)
+        try:
+            _sync_written_documents(doc_class, new_index, written_ids(), batch_size, using)
+        except Exception as e:  # noqa
+            # the new index is live and kept, the records left behind are synced again by their next write
+            logger.error(f"Failed to sync the writes made while swapping index {alias}: {e}")
+            return str(e)
+    return ""
+
+
 def rebuild_program_indexes(
     program_id: str,
     batch_size: int = 2000,
-    parallel: bool = False,
+    parallel: bool = True,
     thread_count: int = 4,
     using: str = "default",
 ) -> tuple[bool, str]:
-    """Rebuild Elasticsearch indexes for a program (delete, create, populate)."""
-    success, msg = delete_program_indexes(program_id, using=using)
-    if not success:  # pragma: no cover
-        return False, f"Delete failed: {msg}"
-
-    success, msg = create_program_indexes(program_id, using=using)
-    if not success:  # pragma: no cover
-        return False, f"Create failed: {msg}"
-
-    success, msg = populate_program_indexes(
-        program_id, batch_size, parallel=parallel, thread_count=thread_count, using=using
-    )
-    if not success:  # pragma: no cover
-        return False, f"Populate failed: {msg}"
+    """Rebuild Elasticsearch indexes for a program without downtime, the live indexes are kept on failure."""
+    try:
+        for doc_class in (get_individual_doc(program_id), get_household_doc(program_id)):
+            if msg := _rebuild_index(doc_class, batch_size, thread_count if parallel else 1, using):
+                return False, f"Rebuild failed: {msg}"
+    except Exception as e:  # pragma: no cover  # noqa
+        logger.error(f"Failed to rebuild indexes for program {program_id}: {e}")
+        return False, str(e)
 
     return True, f"Rebuilt indexes for program {program_id}"
 
@@ -0,0 +1,92 @@
+"""Near real time indexing of Individuals and Households.
+
+Saving an Individual or Household only records it in `ElasticsearchIndexQueue`, in the same transaction as
+the change, so requests never wait for Elasticsearch. `flush_index_queue` runs every minute and coalesces the
+queued entries per program: records still matching the document queryset are reindexed in one bulk request,
+the others are deleted from the index. Flows that read their writes back from the index right away (RDI
+merge) flush their own records with `flush_index_queue(object_ids=...)` once their transaction committed.
+
+Pending (not yet merged) records follow the document querysets. The household index only holds merged
+households, a queued pending household is removed from it and indexed when its RDI is merged. Individual
+documents cover all merge statuses, pending individuals are indexed like merged ones for deduplication.
+Saves through the `PendingHousehold`/`PendingIndividual` proxies are not queued at all, the merge indexes them.
+"""
+
+from collections import defaultdict
+import logging
+from typing import Any, Callable, Iterable
+from uuid import UUID
+
+from constance import config
+from django.db import transaction
+
+from hope.apps.household.documents import get_household_doc, get_individual_doc
+from hope.apps.utils.elasticsearch_utils import populate_index, remove_elasticsearch_documents_by_matching_ids
+from hope.models import ElasticsearchIndexQueue, Program
+
+logger = logging.getLogger(__name__)
+
+DOCUMENT_GETTERS: dict[str, Callable[[str], Any]] = {
+    ElasticsearchIndexQueue.DocumentType.INDIVIDUAL: get_individual_doc,
+    ElasticsearchIndexQueue.DocumentType.HOUSEHOLD: get_household_doc,
+}
+
+
+def enqueue_for_indexing(document_type: str, program_id: Any, object_ids: Iterable[Any]) -> None:
+    if not config.IS_ELASTICSEARCH_ENABLED:
+        return
+    ElasticsearchIndexQueue.objects.bulk_create(
+        ElasticsearchIndexQueue(program_id=program_id, document_type=document_type, object_id=object_id)
+        for object_id in object_ids
+    )
+
+
+def _sync_documents(program_id: str, document_type: str, object_ids: set[UUID]) -> None:
+    doc_class = DOCUMENT_GETTERS[document_type](program_id)
+    queryset = doc_class().get_queryset().filter(id__in=object_ids)
+    existing_ids = set(queryset.values_list("id", flat=True))
+    if existing_ids:
+        populate_index(queryset.filter(id__in=existing_ids), doc_class)
+    if removed_ids := object_ids - existing_ids:
+        remove_elasticsearch_documents_by_matching_ids([str(_id) for _id in removed_ids], doc_class)
+
+
+def flush_index_queue(
+    program_id: str | None = None, object_ids: Iterable[Any] | None = None, batch_size: int = 2000
+) -> int:
+    """Sync the queued records to their indexes, return the number of processed queue entries.
+
+    `program_id` and `object_ids` limit the flush to those entries, the rest stays for the periodic flush.
+
+    Entries are locked with `skip_locked`, concurrent flushes work on different entries. An entry is deleted
+    only once its record was synced, a failed batch stays queued for the next flush.
+    """
+    if not config.IS_ELASTICSEARCH_ENABLED:
+        return 0
+    processed = 0
+    while True:
+        with transaction.atomic():
+            queued = ElasticsearchIndexQueue.objects.select_for_update(skip_locked=True).order_by("id")
+            if program_id:
+                queued = queued.filter(program_id=program_id)
+            if object_ids is not None:
+                queued = queued.filter(object_id__in=object_ids)
+            entries = list(queued.values_list("id", "program_id", "document_type", "object_id")[:batch_size])
+            if not entries:
+                return processed
+
+            pending: dict[tuple[UUID, str], set[UUID]] = defaultdict(set)
+            for _, entry_program_id, document_type, object_id in entries:
+                pending[entry_program_id, document_type].add(object_id)
+            active_program_ids = set(
+                Program.objects.filter(id__in={key[0] for key in pending}, status=Program.ACTIVE).values_list(
+                    "id", flat=True
+                )
+            )
+            for (entry_program_id, document_type), queued_ids in pending.items():
+                if entry_program_id in active_program_ids:
+                    _sync_documents(str(entry_program_id), document_type, queued_ids)
+
+            ElasticsearchIndexQueue.objects.filter(id__in=[entry[0] for entry in entries]).delete()
+        processed += len(entries)
+        logger.info(f"Synced {len(entries)} queued records to Elasticsearch")
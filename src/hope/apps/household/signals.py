@@ -20,44 +20,119 @@ individual_deleted = Signal()
 logger = logging.getLogger(__name__)
 
 
+ADMIN_AREA_UPDATE_FIELDS = frozenset({"admin1", "admin1_id", "admin2", "admin2_id"})
+HOUSEHOLD_UPDATE_FIELDS = frozenset({"household", "household_id"})
+
+
+def get_households_list_partitions_by_id(household_ids: set[Any]) -> set[str]:
+    from hope.apps.household.api.caches import get_households_list_partitions
+    from hope.models import Household
+
+    return get_households_list_partitions(Household.all_objects.filter(id__in=household_ids).only("admin1", "admin2"))
+
+
 @receiver(post_save, sender="household.Household")
 @receiver(pre_delete, sender="household.Household")
-@receiver(post_save, sender="household.Individual")
-@receiver(pre_delete, sender="household.Individual")
 @receiver(post_save, sender="household.PendingHousehold")
 @receiver(pre_delete, sender="household.PendingHousehold")
-@receiver(post_save, sender="household.PendingIndividual")
-@receiver(pre_delete, sender="household.PendingIndividual")
 def increment_household_list_cache_version(
-    sender: type[Household | Individual], instance: Household | Individual, **kwargs: Any
+    sender: type[Household], instance: Household, signal: Signal, **kwargs: Any
 ) -> None:
-    from hope.apps.household.api.caches import increment_household_list_program_key
+    """Bump the household list versions of the areas the household is and was located in.
+
+    Moving the household also changes the individuals listed in its areas. When the previous areas are
+    unknown (instance not loaded from the database) all the partitions of the program are bumped.
+    """
+    from hope.apps.household.api.caches import (
+        get_list_partitions,
+        increment_household_list_keys,
+        increment_individual_list_keys,
+    )
 
     program_id = instance.program_id
-    transaction.on_commit(lambda: increment_household_list_program_key(program_id))
+    current_areas = {"admin1": instance.admin1_id, "admin2": instance.admin2_id}
+    update_fields = kwargs.get("update_fields")
+    loaded_areas = getattr(instance, "_loaded_admin_area_ids", None)
+    if signal is pre_delete:
+        loaded_areas = loaded_areas or current_areas
+    elif kwargs.get("created") or (update_fields is not None and not ADMIN_AREA_UPDATE_FIELDS & update_fields):
+        loaded_areas = current_areas
+    if signal is post_save:
+        instance._loaded_admin_area_ids = current_areas
+
+    moved = loaded_areas != current_areas
+    partitions = (
+        get_list_partitions(current_areas) | get_list_partitions(loaded_areas) if loaded_areas is not None else None
+    )
+
+    def _increment() -> None:
+        increment_household_list_keys(program_id, partitions)
+        if moved:
+            increment_individual_list_keys(program_id, partitions)
+
+    transaction.on_commit(_increment)
 
 
 @receiver(post_save, sender="household.Individual")
 @receiver(pre_delete, sender="household.Individual")
 @receiver(post_save, sender="household.PendingIndividual")
 @receiver(pre_delete, sender="household.PendingIndividual")
-def increment_individual_list_cache_version(sender: type[Individual], instance: Individual, **kwargs: Any) -> None:
-    from hope.apps.household.api.caches import increment_individual_list_program_key
+def increment_individual_list_cache_version(
+    sender: type[Individual], instance: Individual, signal: Signal, **kwargs: Any
+) -> None:
+    """Bump the household and individual list versions of the areas of the household of the individual.
+
+    Moving the individual to another household also bumps the areas of the previous one. When it is unknown
+    (instance not loaded from the database) all the partitions of the program are bumped.
+    """
+    from hope.apps.household.api.caches import (
+        get_household_list_partitions,
+        increment_household_list_keys,
+        increment_individual_list_keys,
+    )
 
     program_id = instance.program_id
-    transaction.on_commit(lambda: increment_individual_list_program_key(program_id))
+    update_fields = kwargs.get("update_fields")
+    household_ids: set[Any] | None = {instance.household_id}
+    if signal is pre_delete or not (
+        kwargs.get("created") or (update_fields is not None and not HOUSEHOLD_UPDATE_FIELDS & update_fields)
+    ):
+        if hasattr(instance, "_loaded_household_id"):
+            household_ids.add(instance._loaded_household_id)
+        elif signal is post_save:
+            household_ids = None
+    if signal is post_save:
+        instance._loaded_household_id = instance.household_id
+
+    partitions: set[str] | None = None
+    if household_ids is not None:
+        household_ids.discard(None)
+        partitions = set()
+        if instance.household_id in household_ids and sender.household.is_cached(instance):
+            # the loaded household resolves its areas without a query
+            household_ids.discard(instance.household_id)
+            partitions = get_household_list_partitions(instance.household)
+
+    def _increment() -> None:
+        all_partitions = partitions
+        if partitions is not None and household_ids:
+            all_partitions = partitions | get_households_list_partitions_by_id(household_ids)
+        increment_household_list_keys(program_id, all_partitions)
+        increment_individual_list_keys(program_id, all_partitions)
+
+    transaction.on_commit(_increment)
 
 
 def increment_household_list_cache_version_from_bulk(
     sender: type[Household | Individual], instances: list[Any], **kwargs: Any
 ) -> None:
-    from hope.apps.household.api.caches import increment_household_list_program_key
+    from hope.apps.household.api.caches import increment_household_list_keys
 
     program_ids = {instance.program_id for instance in instances}
 
     def _increment() -> None:
         for program_id in program_ids:
-            increment_household_list_program_key(program_id)
+            increment_household_list_keys(program_id, None)
 
     transaction.on_commit(_increment)
 
@@ -65,13 +140,13 @@ def increment_household_list_cache_version_from_bulk(
 def increment_individual_list_cache_version_from_bulk(
     sender: type[Individual], instances: list[Any], **kwargs: Any
 ) -> None:
-    from hope.apps.household.api.caches import increment_individual_list_program_key
+    from hope.apps.household.api.caches import increment_individual_list_keys
 
     program_ids = {instance.program_id for instance in instances}
 
     def _increment() -> None:
         for program_id in program_ids:
-            increment_individual_list_program_key(program_id)
+            increment_individual_list_keys(program_id, None)
 
     transaction.on_commit(_increment)
 
@@ -135,98 +210,22 @@ def handle_program_status_change(sender: type[Program], instance: Program, creat
     instance.__dict__.pop("_old_status", None)
 
 
-@receiver(pre_save, sender="household.Individual")
-@receiver(pre_save, sender="household.Household")
-def capture_old_is_removed(
-    sender: type[Household | Individual], instance: Household | Individual, **kwargs: Any
-) -> None:
-    if not _is_elasticsearch_enabled():
-        return
-
-    if instance.pk:
-        try:
-            instance._old_is_removed = sender.all_objects.get(pk=instance.pk).is_removed
-        except sender.DoesNotExist:
-            instance._old_is_removed = False
-    else:  # pragma: no cover
-        instance._old_is_removed = False
-
-
 @receiver(post_save, sender="household.Individual")
-def sync_individual_to_elasticsearch(sender: type[Individual], instance: Individual, **kwargs: Any) -> None:
-    """Auto-sync Individual to Elasticsearch when saved."""
-    if not _is_elasticsearch_enabled():
-        return
-
-    from hope.apps.household.documents import get_individual_doc
-    from hope.apps.utils.elasticsearch_utils import remove_elasticsearch_documents_by_matching_ids
-    from hope.models import Program
-
-    if instance.program.status == Program.ACTIVE:
-        try:
-            removed_now = instance.is_removed and not getattr(instance, "_old_is_removed", True)
-            if removed_now:
-                remove_elasticsearch_documents_by_matching_ids(
-                    [instance.id], get_individual_doc(str(instance.program_id))
-                )
-            elif not instance.is_removed:
-                get_individual_doc(str(instance.program_id))().update(instance)
-        except Exception as e:  # pragma: no cover  # noqa
-            logger.error(f"Failed to sync Individual {instance.id} to Elasticsearch: {e}")
-    instance.__dict__.pop("_old_is_removed", None)
-
-
 @receiver(post_delete, sender="household.Individual")
-def remove_individual_from_elasticsearch(sender: type[Individual], instance: Individual, **kwargs: Any) -> None:
-    if not _is_elasticsearch_enabled():
-        return
-
-    from hope.apps.household.documents import get_individual_doc
-    from hope.apps.utils.elasticsearch_utils import remove_elasticsearch_documents_by_matching_ids
-    from hope.models import Program
+def enqueue_individual_for_indexing(sender: type[Individual], instance: Individual, **kwargs: Any) -> None:
+    """Queue the Individual for the next Elasticsearch sync, see `hope.apps.household.services.index_queue`."""
+    from hope.apps.household.services.index_queue import enqueue_for_indexing
+    from hope.models import ElasticsearchIndexQueue
 
-    if instance.program.status == Program.ACTIVE:
-        try:
-            remove_elasticsearch_documents_by_matching_ids([instance.id], get_individual_doc(str(instance.program_id)))
-        except Exception as e:  # pragma: no cover  # noqa
-            logger.error(f"Failed to remove Individual {instance.id} from Elasticsearch: {e}")
+    enqueue_for_indexing(ElasticsearchIndexQueue.DocumentType.INDIVIDUAL, instance.program_id, [instance.pk])
 
 
 @receiver(post_save, sender="household.Household")
-def sync_household_to_elasticsearch(sender: type[Household], instance: Household, **kwargs: Any) -> None:
-    """Auto-sync Household to Elasticsearch when saved."""
-    if not _is_elasticsearch_enabled():
-        return
-
-    from hope.apps.household.documents import get_household_doc
-    from hope.apps.utils.elasticsearch_utils import remove_elasticsearch_documents_by_matching_ids
-    from hope.models import Program
-
-    if instance.program.status == Program.ACTIVE:
-        try:
-            removed_now = instance.is_removed and not getattr(instance, "_old_is_removed", True)
-            if removed_now:
-                remove_elasticsearch_documents_by_matching_ids(
-                    [instance.id], get_household_doc(str(instance.program_id))
-                )
-            elif not instance.is_removed:
-                get_household_doc(str(instance.program_id))().update(instance)
-        except Exception as e:  # pragma: no cover  # noqa
-            logger.error(f"Failed to sync Household {instance.id} to Elasticsearch: {e}")
-    instance.__dict__.pop("_old_is_removed", None)
-
-
 @receiver(post_delete, sender="household.Household")
-def remove_household_from_elasticsearch(sender: type[Household], instance: Household, **kwargs: Any) -> None:
-    if not _is_elasticsearch_enabled():
-        return
+def enqueue_household_for_indexing(sender: type[Household], instance: Household, **kwargs: Any) -> None:
+    """Queue the Household for the next Elasticsearch sync, see `hope.apps.household.services.index_queue`."""
+    from hope.apps.household.services.index_queue import enqueue_for_indexing
+    from hope.models import ElasticsearchIndexQueue
 
-    from hope.apps.household.documents import get_household_doc
-    from hope.apps.utils.elasticsearch_utils import remove_elasticsearch_documents_by_matching_ids
-    from hope.models import Program
-
-    if instance.program and instance.program.status == Program.ACTIVE:
-        try:
-            remove_elasticsearch_documents_by_matching_ids([instance.id], get_household_doc(str(instance.program_id)))
-        except Exception as e:  # pragma: no cover  # noqa
-            logger.error(f"Failed to remove Household {instance.id} from Elasticsearch: {e}")
+    if instance.program_id:
+        enqueue_for_indexing(ElasticsearchIndexQueue.DocumentType.HOUSEHOLD, instance.program_id, [instance.pk])
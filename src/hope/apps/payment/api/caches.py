@@ -4,20 +4,21 @@ from rest_framework_extensions.key_constructor.bits import KeyBitBase
 
 from hope.api.caches import (
     BusinessAreaAndProgramKeyBitMixin,
-    BusinessAreaAndProgramLastUpdatedKeyBit,
+    BusinessAreaAndProgramVersionKeyBit,
     BusinessAreaKeyBitMixin,
     KeyConstructorMixin,
     get_or_create_cache_key,
 )
-from hope.models import BusinessArea
+from hope.models import BusinessArea, PaymentPlan
 
 
 class ManagerialPaymentPlanListVersionsKeyBit(BusinessAreaKeyBitMixin):
     specific_view_cache_key = "management_payment_plans_list"
 
 
-class PaymentPlanListKeyBit(BusinessAreaAndProgramLastUpdatedKeyBit):
+class PaymentPlanListKeyBit(BusinessAreaAndProgramVersionKeyBit):
     specific_view_cache_key = "payment_plans_list"
+    versioned_model = PaymentPlan
 
 
 class PaymentPlanGroupListKeyBit(BusinessAreaAndProgramKeyBitMixin):
@@ -38,12 +39,14 @@ class PaymentPlanPurposeListVersionsKeyBit(KeyBitBase):
         return str(version)
 
 
-class PaymentVerificationListKeyBit(BusinessAreaAndProgramLastUpdatedKeyBit):
+class PaymentVerificationListKeyBit(BusinessAreaAndProgramVersionKeyBit):
     specific_view_cache_key = "payment_verifications_list"
+    versioned_model = PaymentPlan
 
 
-class TargetPopulationListKeyBit(BusinessAreaAndProgramLastUpdatedKeyBit):
+class TargetPopulationListKeyBit(BusinessAreaAndProgramVersionKeyBit):
     specific_view_cache_key = "target_populations_list"
+    versioned_model = PaymentPlan
 
 
 class PaymentPlanProgramsPermissionsKeyBit(KeyBitBase):
@@ -1,5 +1,6 @@
 import datetime
 from decimal import Decimal
+from itertools import batched
 import logging
 from typing import Any
 
@@ -36,6 +37,7 @@ from hope.apps.payment.xlsx.xlsx_payment_plan_delivery_import_service import (
 from hope.apps.payment.xlsx.xlsx_verification_export_service import (
     XlsxVerificationExportService,
 )
+from hope.apps.steficon.cache import rule_cache
 from hope.apps.utils.phone import is_valid_phone_number
 from hope.apps.utils.sentry import set_sentry_business_area_tag
 from hope.models import (
@@ -698,31 +700,23 @@ def payment_plan_apply_engine_rule_async_task_action(job: AsyncRetryJob) -> None
         pp_exchange_rate = payment_plan.exchange_rate
         pp_currency_exchange_date = payment_plan.currency_exchange_date
 
-        updates_buffer = []
-        with transaction.atomic():
-            for payment in qs.iterator(chunk_size=bulk_size):
-                result = rule.execute({"household": payment.household, "payment_plan": payment_plan})
-
-                payment.entitlement_quantity = result.value
-                payment.entitlement_quantity_usd = get_quantity_in_usd(
-                    amount=result.value,
-                    currency=pp_currency,
-                    exchange_rate=pp_exchange_rate,
-                    currency_exchange_date=pp_currency_exchange_date,
+        with transaction.atomic(), rule_cache():
+            for payments in batched(qs.iterator(chunk_size=bulk_size), bulk_size, strict=False):
+                results = rule.execute_many(
+                    {"household": payment.household, "payment_plan": payment_plan} for payment in payments
                 )
-                payment.entitlement_date = now
-                updates_buffer.append(payment)
-
-                if len(updates_buffer) >= bulk_size:  # pragma: no cover
-                    Payment.signature_manager.bulk_update_with_signature(
-                        updates_buffer,
-                        ["entitlement_quantity", "entitlement_date", "entitlement_quantity_usd"],
+                for payment, result in zip(payments, results, strict=True):
+                    payment.entitlement_quantity = result.value
+                    payment.entitlement_quantity_usd = get_quantity_in_usd(
+                        amount=result.value,
+                        currency=pp_currency,
+                        exchange_rate=pp_exchange_rate,
+                        currency_exchange_date=pp_currency_exchange_date,
                     )
-                    updates_buffer.clear()
+                    payment.entitlement_date = now
 
-            if updates_buffer:
                 Payment.signature_manager.bulk_update_with_signature(
-                    updates_buffer,
+                    list(payments),
                     ["entitlement_quantity", "entitlement_date", "entitlement_quantity_usd"],
                 )
 
@@ -1310,24 +1304,23 @@ def payment_plan_apply_steficon_hh_selection_async_task_action(job: AsyncRetryJo
         payment_plan.steficon_targeting_applied_date = timezone.now()
         payment_plan.save(update_fields=["status", "steficon_targeting_applied_date"])
         bulk_size = 1000
-        updates = []
 
-        with transaction.atomic():
-            for payment in payment_plan.payment_items.select_related("household").iterator(chunk_size=bulk_size):
-                result = rule.execute(
+        with transaction.atomic(), rule_cache():
+            for payments in batched(
+                payment_plan.payment_items.select_related("household").iterator(chunk_size=bulk_size),
+                bulk_size,
+                strict=False,
+            ):
+                results = rule.execute_many(
                     {
                         "household": payment.household,
                         "payment_plan": payment_plan,
                     }
+                    for payment in payments
                 )
-                payment.vulnerability_score = normalize_score(result.value)
-                updates.append(payment)
-                if len(updates) >= bulk_size:
-                    Payment.objects.bulk_update(updates, ["vulnerability_score"], batch_size=bulk_size)
-                    updates.clear()
-
-            if updates:
-                Payment.objects.bulk_update(updates, ["vulnerability_score"], batch_size=bulk_size)
+                for payment, result in zip(payments, results, strict=True):
+                    payment.vulnerability_score = normalize_score(result.value)
+                Payment.objects.bulk_update(payments, ["vulnerability_score"], batch_size=bulk_size)
 
         if payment_plan.vulnerability_score_min is not None or payment_plan.vulnerability_score_max is not None:
             params = {}
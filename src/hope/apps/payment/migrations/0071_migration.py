@@ -0,0 +1,32 @@
+import secrets
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("payment", "0070_migration"),
+        ("program", "0020_migration"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PaymentNumberSequence",
+            fields=[
+                (
+                    "program",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="payment_number_sequence",
+                        serialize=False,
+                        to="program.program",
+                    ),
+                ),
+                ("key", models.CharField(default=secrets.token_hex, max_length=64)),
+                ("order_number_position", models.PositiveBigIntegerField(default=0)),
+                ("token_number_position", models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+    ]
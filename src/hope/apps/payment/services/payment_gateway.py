@@ -1,8 +1,11 @@
 from _decimal import Decimal
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import dataclasses
 from enum import Enum
+from itertools import batched
 import logging
-from typing import Any, cast
+from typing import Any, Iterable, cast
 
 from django.db import transaction
 from django.db.models import Exists, OuterRef, Prefetch, Q, QuerySet
@@ -432,6 +435,12 @@ class PaymentGatewayAPI(BaseAPI):
 
 class PaymentGatewayService:
     ADD_RECORDS_CHUNK_SIZE = 500
+    UPDATE_PAYMENTS_CHUNK_SIZE = 1000
+    # stays below the default connection pool size of the shared requests session
+    GET_RECORD_MAX_WORKERS = 8
+    # updated_at is listed and set explicitly, bulk_update skips auto_now and the dashboard refresh relies on it
+    SYNC_STATUS_FIELDS = ("status", "status_date", "fsp_auth_code", "reason_for_unsuccessful_payment", "updated_at")
+    SYNC_DELIVERY_FIELDS = (*SYNC_STATUS_FIELDS, "delivered_quantity", "delivered_quantity_usd", "delivery_date")
     PENDING_UPDATE_PAYMENT_STATUSES = [
         Payment.STATUS_PENDING,
         Payment.STATUS_SENT_TO_PG,
@@ -475,14 +484,15 @@ class PaymentGatewayService:
         for idx, payment in enumerate(payments):
             payment.status = Payment.STATUS_ERROR
             payment.reason_for_unsuccessful_payment = response.errors.get(str(idx), "")
-        Payment.objects.bulk_update(payments, ["status", "reason_for_unsuccessful_payment"])
+            payment.updated_at = timezone.now()
+        Payment.objects.bulk_update(payments, ["status", "reason_for_unsuccessful_payment", "updated_at"])
 
     @staticmethod
     def _handle_pg_success(response: AddRecordsResponseData, payments: list[Payment]) -> None:
         for payment in payments:
             payment.status = Payment.STATUS_SENT_TO_PG
-            payment.sent_to_fsp_date = timezone.now()
-        Payment.objects.bulk_update(payments, ["status", "sent_to_fsp_date"])
+            payment.sent_to_fsp_date = payment.updated_at = timezone.now()
+        Payment.objects.bulk_update(payments, ["status", "sent_to_fsp_date", "updated_at"])
 
     def _add_records_to_container(self, payments: QuerySet[Payment], container: PaymentPlanSplit) -> None:
         add_records_error = None
@@ -616,6 +626,41 @@ class PaymentGatewayService:
                 },
             )
 
+    @staticmethod
+    def _apply_pg_record(
+        payment: Payment,
+        pg_payment_record: PaymentRecordData,
+        payment_plan: PaymentPlan,
+        exchange_rate: Decimal | float | None,
+    ) -> tuple[str, ...]:
+        payment.status = pg_payment_record.get_hope_status(payment.entitlement_quantity)  # type: ignore[arg-type]
+        payment.status_date = payment.updated_at = now()
+        payment.fsp_auth_code = pg_payment_record.auth_code
+        payment.reason_for_unsuccessful_payment = pg_payment_record.message
+
+        delivered_quantity = pg_payment_record.payout_amount
+        delivery_date = pg_payment_record.payout_date
+        if payment.status not in [
+            Payment.STATUS_DISTRIBUTION_SUCCESS,
+            Payment.STATUS_DISTRIBUTION_PARTIAL,
+            Payment.STATUS_NOT_DISTRIBUTED,
+        ]:
+            return PaymentGatewayService.SYNC_STATUS_FIELDS
+
+        if payment.status == Payment.STATUS_NOT_DISTRIBUTED and delivered_quantity is None:  # pragma no cover
+            delivered_quantity = 0
+            delivery_date = None
+
+        payment.delivery_date = delivery_date
+        payment.delivered_quantity = to_decimal(delivered_quantity)
+        payment.delivered_quantity_usd = get_quantity_in_usd(
+            amount=Decimal(delivered_quantity),  # type: ignore[arg-type]
+            currency=payment_plan.currency,
+            exchange_rate=Decimal(exchange_rate),  # type: ignore[arg-type]
+            currency_exchange_date=payment_plan.currency_exchange_date,
+        )
+        return PaymentGatewayService.SYNC_DELIVERY_FIELDS
+
     @staticmethod
     def update_payment(
         payment: Payment,
@@ -630,39 +675,43 @@ class PaymentGatewayService:
             logger.warning(f"Payment {payment.id} for Payment Instruction {container.id} not found in Payment Gateway")
             return
 
-        payment.status = matching_pg_payment.get_hope_status(payment.entitlement_quantity)  # type: ignore[arg-type]
-        payment.status_date = now()
-        payment.fsp_auth_code = matching_pg_payment.auth_code
-        payment.reason_for_unsuccessful_payment = matching_pg_payment.message
-        update_fields = [
-            "status",
-            "status_date",
-            "fsp_auth_code",
-            "reason_for_unsuccessful_payment",
-        ]
+        update_fields = PaymentGatewayService._apply_pg_record(
+            payment, matching_pg_payment, payment_plan, exchange_rate
+        )
+        payment.save(update_fields=update_fields)
 
-        delivered_quantity = matching_pg_payment.payout_amount
-        delivery_date = matching_pg_payment.payout_date
-        if payment.status in [
-            Payment.STATUS_DISTRIBUTION_SUCCESS,
-            Payment.STATUS_DISTRIBUTION_PARTIAL,
-            Payment.STATUS_NOT_DISTRIBUTED,
-        ]:
-            if payment.status == Payment.STATUS_NOT_DISTRIBUTED and delivered_quantity is None:  # pragma no cover
-                delivered_quantity = 0
-                delivery_date = None
-
-            update_fields.extend(["delivered_quantity", "delivered_quantity_usd", "delivery_date"])
-            payment.delivery_date = delivery_date
-            payment.delivered_quantity = to_decimal(delivered_quantity)
-            payment.delivered_quantity_usd = get_quantity_in_usd(
-                amount=Decimal(delivered_quantity),  # type: ignore[arg-type]
-                currency=payment_plan.currency,
-                exchange_rate=Decimal(exchange_rate),  # type: ignore[arg-type]
-                currency_exchange_date=payment_plan.currency_exchange_date,
-            )
+    @classmethod
+    def update_payments(
+        cls,
+        payments: Iterable[Payment],
+        pg_payment_records: list[PaymentRecordData],
+        container: PaymentPlanSplit,
+        payment_plan: PaymentPlan,
+        exchange_rate: Decimal | float | None,
+    ) -> None:
+        """Bulk variant of `update_payment` for a whole Payment Instruction.
+
+        PG records are indexed by remote_id once and the payments are persisted with one bulk_update per chunk
+        and set of updated fields, instead of a scan of the records and an UPDATE per payment.
+        """
+        pg_payment_records_by_remote_id: dict[str, PaymentRecordData] = {}
+        for pg_payment_record in pg_payment_records:
+            pg_payment_records_by_remote_id.setdefault(pg_payment_record.remote_id, pg_payment_record)
+
+        for payments_chunk in batched(payments, cls.UPDATE_PAYMENTS_CHUNK_SIZE, strict=False):
+            payments_by_update_fields: dict[tuple[str, ...], list[Payment]] = defaultdict(list)
+            for payment in payments_chunk:
+                matching_pg_payment = pg_payment_records_by_remote_id.get(str(payment.id))
+                if matching_pg_payment is None:
+                    logger.warning(
+                        f"Payment {payment.id} for Payment Instruction {container.id} not found in Payment Gateway"
+                    )
+                    continue
+                update_fields = cls._apply_pg_record(payment, matching_pg_payment, payment_plan, exchange_rate)
+                payments_by_update_fields[update_fields].append(payment)
 
-        payment.save(update_fields=update_fields)
+            for update_fields, payments_to_update in payments_by_update_fields.items():
+                Payment.objects.bulk_update(payments_to_update, update_fields)
 
     def sync_records(self) -> None:
         payment_plans = PaymentPlan.objects.prefetch_related(
@@ -693,14 +742,13 @@ class PaymentGatewayService:
                     pending_payments = getattr(instruction, "eligible_items", [])
                     if pending_payments:
                         pg_payment_records = self.api.get_records_for_payment_instruction(instruction.id)
-                        for payment in pending_payments:
-                            self.update_payment(
-                                payment,
-                                pg_payment_records,
-                                instruction,
-                                payment_plan,
-                                exchange_rate,
-                            )
+                        self.update_payments(
+                            pending_payments,
+                            pg_payment_records,
+                            instruction,
+                            payment_plan,
+                            exchange_rate,
+                        )
 
                 payment_plan.update_money_fields()
                 if payment_plan.is_reconciled:
@@ -751,14 +799,13 @@ class PaymentGatewayService:
                 .select_related("household_snapshot", "delivery_type", "currency")
             )
             pg_payment_records = self.api.get_records_for_payment_instruction(instruction.id)
-            for payment in payments:
-                self.update_payment(
-                    payment,
-                    pg_payment_records,
-                    instruction,
-                    payment_plan,
-                    exchange_rate,
-                )
+            self.update_payments(
+                payments.iterator(chunk_size=self.UPDATE_PAYMENTS_CHUNK_SIZE),
+                pg_payment_records,
+                instruction,
+                payment_plan,
+                exchange_rate,
+            )
 
         if payment_plan.is_reconciled:
             flow = PaymentPlanFlow(payment_plan)
@@ -793,11 +840,31 @@ class PaymentGatewayService:
             )
 
     def add_missing_records_to_payment_instructions(self, payment_plan: PaymentPlan) -> None:
+        payments_ids_by_split: dict[Any, list[str]] = defaultdict(list)
+        for payment_id, split_id in payment_plan.eligible_payments.values_list("id", "parent_split_id"):
+            payments_ids_by_split[split_id].append(str(payment_id))
+
         record_ids: list[str] = []
-        for payment in payment_plan.eligible_payments.all():
-            pg_payment_record = self.api.get_record(payment.id)
-            if not pg_payment_record:
-                record_ids.append(str(payment.pk))
+        for split_id, payments_ids in payments_ids_by_split.items():
+            record_ids.extend(self._get_missing_record_ids(split_id, payments_ids))
 
         if record_ids:
             self.add_records_to_payment_instructions(payment_plan, record_ids)
+
+    def _get_missing_record_ids(self, split_id: Any, payments_ids: list[str]) -> list[str]:
+        if split_id is not None:
+            try:
+                pg_payment_records = self.api.get_records_for_payment_instruction(split_id)
+            except PaymentGatewayAPI.PaymentGatewayAPIError:
+                logger.warning(f"Cannot list records of Payment Instruction {split_id}, checking records one by one")
+            else:
+                existing_remote_ids = {pg_payment_record.remote_id for pg_payment_record in pg_payment_records}
+                return [payment_id for payment_id in payments_ids if payment_id not in existing_remote_ids]
+
+        with ThreadPoolExecutor(max_workers=self.GET_RECORD_MAX_WORKERS) as executor:
+            pg_payment_records = executor.map(self.api.get_record, payments_ids)
+            return [
+                payment_id
+                for payment_id, pg_payment_record in zip(payments_ids, pg_payment_records, strict=True)
+                if pg_payment_record is None
+            ]
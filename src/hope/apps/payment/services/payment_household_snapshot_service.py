@@ -1,9 +1,9 @@
 import datetime
 from decimal import Decimal
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, Iterator
 from uuid import UUID
 
-from django.core.paginator import Paginator
+from django.db.models import Count, Prefetch, QuerySet
 from phonenumber_field.phonenumber import PhoneNumber
 
 from hope.apps.grievance.models import TicketNeedsAdjudicationDetails
@@ -13,6 +13,7 @@ from hope.apps.household.const import (
 )
 from hope.models import (
     Country,
+    Document,
     Household,
     Individual,
     IndividualRoleInHousehold,
@@ -22,8 +23,8 @@ from hope.models import (
     PaymentPlan,
 )
 
-excluded_individual_fields = ["_state", "_prefetched_objects_cache"]
-excluded_household_fields = ["_state", "_prefetched_objects_cache"]
+excluded_individual_fields = frozenset(["_state", "_prefetched_objects_cache"])
+excluded_household_fields = frozenset(["_state", "_prefetched_objects_cache"])
 
 encode_typedict: dict[type, Callable[[Any], Any]] = {
     UUID: str,
@@ -38,102 +39,131 @@ page_size = 100
 
 
 def handle_type_mapping(value: Any) -> Any:
-    value_type = type(value)
-    if value_type in encode_typedict:
-        value = encode_typedict[value_type](value)
-    return value
+    encoder = encode_typedict.get(type(value))
+    return encoder(value) if encoder else value
+
+
+def encode_instance_dict(instance_dict: dict[str, Any], excluded_fields: frozenset[str]) -> dict[str, Any]:
+    return {key: handle_type_mapping(value) for key, value in instance_dict.items() if key not in excluded_fields}
+
+
+class SnapshotPrefetch:
+    """Lookups shared by all snapshots of a page, computed with grouped queries instead of per individual ones."""
+
+    def __init__(self, households: Iterable[Household]) -> None:
+        individual_ids = set()
+        for household in households:
+            individual_ids.update(individual.id for individual in household.individuals.all())
+            individual_ids.update(role.individual_id for role in household.individuals_and_roles.all())
+        self.needs_adjudication_tickets_counts = get_needs_adjudication_tickets_counts(individual_ids)
+        self.collectors = set(
+            IndividualRoleInHousehold.objects.filter(
+                role__in=[ROLE_PRIMARY, ROLE_ALTERNATE],
+                individual_id__in=individual_ids,
+            ).values_list("household_id", "individual_id")
+        )
+
+    def is_hh_collector(self, individual: Individual) -> bool:
+        return (individual.household_id, individual.id) in self.collectors
 
 
 def create_payment_plan_snapshot_data(payment_plan: PaymentPlan) -> None:
-    payments_ids = list(
-        payment_plan.eligible_payments.filter(household_snapshot__isnull=True)
-        .values_list("id", flat=True)
-        .order_by("id")
-    )
-    bulk_create_payment_snapshot_data(payments_ids)
+    _create_payment_snapshot_data(payment_plan.eligible_payments.filter(household_snapshot__isnull=True))
 
 
 def bulk_create_payment_snapshot_data(payments_ids: list[str]) -> None:
-    base_queryset = Payment.objects.filter(id__in=payments_ids).order_by("id")
-    paginator = Paginator(base_queryset, page_size)
+    _create_payment_snapshot_data(Payment.objects.filter(id__in=payments_ids))
 
-    for page_number in paginator.page_range:
-        # Slice without prefetch
-        page_ids = list(paginator.page(page_number).object_list.values_list("id", flat=True))
 
-        # Re-fetch with select/prefetch
+def _create_payment_snapshot_data(queryset: QuerySet[Payment]) -> None:
+    documents_queryset = Document.objects.select_related("type", "country")
+    for page_ids in _iterate_keyset_pages(queryset):
         payments = (
             Payment.objects.filter(id__in=page_ids)
-            .select_related("household")
+            .select_related("household", "financial_service_provider", "delivery_type")
             .prefetch_related(
                 "household__individuals",
-                "household__individuals__documents",
-                "household__individuals_and_roles",
+                Prefetch("household__individuals__documents", queryset=documents_queryset),
+                Prefetch(
+                    "household__individuals_and_roles",
+                    queryset=IndividualRoleInHousehold.objects.select_related("individual"),
+                ),
+                Prefetch("household__individuals_and_roles__individual__documents", queryset=documents_queryset),
             )
             .order_by("id")
         )
-
-        to_create = [create_payment_snapshot_data(payment) for payment in payments]
+        prefetch = SnapshotPrefetch(payment.household for payment in payments)
+        to_create = [create_payment_snapshot_data(payment, prefetch) for payment in payments]
         PaymentHouseholdSnapshot.objects.bulk_create(to_create)
 
 
-def create_payment_snapshot_data(payment: Payment) -> PaymentHouseholdSnapshot:
+def _iterate_keyset_pages(queryset: QuerySet[Payment]) -> Iterator[list[Any]]:
+    queryset = queryset.order_by("id")
+    page_ids = list(queryset.values_list("id", flat=True)[:page_size])
+    while page_ids:
+        yield page_ids
+        page_ids = list(queryset.filter(id__gt=page_ids[-1]).values_list("id", flat=True)[:page_size])
+
+
+def create_payment_snapshot_data(
+    payment: Payment, prefetch: SnapshotPrefetch | None = None
+) -> PaymentHouseholdSnapshot:
     household = payment.household
-    household_data = get_household_snapshot(household, payment)
+    household_data = get_household_snapshot(household, payment, prefetch)
     return PaymentHouseholdSnapshot(payment=payment, snapshot_data=household_data, household_id=household.id)
 
 
-def get_household_snapshot(household: Household, payment: Payment | None = None) -> dict[Any, Any]:
-    household_data = {}
-    all_household_data_dict = household.__dict__
-    keys = [key for key in all_household_data_dict if key not in excluded_household_fields]
+def get_household_snapshot(
+    household: Household, payment: Payment | None = None, prefetch: SnapshotPrefetch | None = None
+) -> dict[Any, Any]:
+    if prefetch is None:
+        prefetch = SnapshotPrefetch([household])
+    household_data = encode_instance_dict(household.__dict__, excluded_household_fields)
     household_data["individuals"] = []
     household_data["roles"] = []
-    for key in keys:
-        value = all_household_data_dict[key]
-        household_data[key] = handle_type_mapping(value)
     household_data["needs_adjudication_tickets_count"] = 0
     individuals_dict = {}
     for individual in household.individuals.all():
-        individual_data = get_individual_snapshot(individual, payment)
+        individual_data = get_individual_snapshot(individual, payment, prefetch)
         individuals_dict[str(individual.id)] = individual_data
         household_data["individuals"].append(individual_data)
         household_data["needs_adjudication_tickets_count"] += individual_data["needs_adjudication_tickets_count"]
-    if household.primary_collector:
-        if str(household.primary_collector.id) in individuals_dict:
-            household_data["primary_collector"] = individuals_dict[str(household.primary_collector.id)]
-        else:
-            household_data["primary_collector"] = get_individual_snapshot(household.primary_collector, payment)
-            household_data["needs_adjudication_tickets_count"] += household_data["primary_collector"][
-                "needs_adjudication_tickets_count"
-            ]
-    if household.alternate_collector:
-        if str(household.alternate_collector.id) in individuals_dict:
-            household_data["alternate_collector"] = individuals_dict[str(household.alternate_collector.id)]
-        else:
-            household_data["alternate_collector"] = get_individual_snapshot(household.alternate_collector, payment)
-            household_data["needs_adjudication_tickets_count"] += household_data["alternate_collector"][
-                "needs_adjudication_tickets_count"
-            ]
-    for role in household.individuals_and_roles.all():
+
+    roles = household.individuals_and_roles.all()
+    for role in roles:
+        if str(role.individual_id) not in individuals_dict:
+            individuals_dict[str(role.individual_id)] = get_individual_snapshot(role.individual, payment, prefetch)
         household_data["roles"].append(
             {
                 "role": role.role,
-                "individual": get_individual_snapshot(role.individual, payment),
+                "individual": individuals_dict[str(role.individual_id)],
             }
         )
+
+    household_individual_ids = {individual["id"] for individual in household_data["individuals"]}
+    for collector_key, collector_role in (("primary_collector", ROLE_PRIMARY), ("alternate_collector", ROLE_ALTERNATE)):
+        collector_id = next((str(role.individual_id) for role in roles if role.role == collector_role), None)
+        if collector_id is None:
+            continue
+        household_data[collector_key] = individuals_dict[collector_id]
+        if collector_id not in household_individual_ids:
+            household_data["needs_adjudication_tickets_count"] += individuals_dict[collector_id][
+                "needs_adjudication_tickets_count"
+            ]
     return household_data
 
 
-def get_individual_snapshot(individual: Individual, payment: Payment | None = None) -> dict:
-    all_individual_data_dict = individual.__dict__
-    keys = [key for key in all_individual_data_dict if key not in excluded_individual_fields]
-    individual_data = {}
-    for key in keys:
-        value = all_individual_data_dict[key]
-        individual_data[key] = handle_type_mapping(value)
+def get_individual_snapshot(
+    individual: Individual, payment: Payment | None = None, prefetch: SnapshotPrefetch | None = None
+) -> dict:
+    individual_data = encode_instance_dict(individual.__dict__, excluded_individual_fields)
     individual_data["documents"] = []
-    individual_data["needs_adjudication_tickets_count"] = get_needs_adjudication_tickets_count(individual)
+    if prefetch is None:
+        individual_data["needs_adjudication_tickets_count"] = get_needs_adjudication_tickets_count(individual)
+    else:
+        individual_data["needs_adjudication_tickets_count"] = prefetch.needs_adjudication_tickets_counts.get(
+            individual.id, 0
+        )
 
     for document in individual.documents.all():
         document_data = {
@@ -150,11 +180,14 @@ def get_individual_snapshot(individual: Individual, payment: Payment | None = No
         }
         individual_data["documents"].append(document_data)
 
-    is_hh_collector = IndividualRoleInHousehold.objects.filter(
-        role__in=[ROLE_PRIMARY, ROLE_ALTERNATE],
-        household=individual.household,
-        individual=individual,
-    ).exists()
+    if prefetch is None:
+        is_hh_collector = IndividualRoleInHousehold.objects.filter(
+            role__in=[ROLE_PRIMARY, ROLE_ALTERNATE],
+            household=individual.household,
+            individual=individual,
+        ).exists()
+    else:
+        is_hh_collector = prefetch.is_hh_collector(individual)
 
     if is_hh_collector and payment and payment.delivery_type and payment.financial_service_provider:
         individual_data["account_data"] = PaymentDataCollector.delivery_data(
@@ -167,11 +200,24 @@ def get_individual_snapshot(individual: Individual, payment: Payment | None = No
 
 
 def get_needs_adjudication_tickets_count(individual: Individual) -> int:
-    golden_records_count = TicketNeedsAdjudicationDetails.objects.filter(golden_records_individual=individual).count()
+    return get_needs_adjudication_tickets_counts([individual.id]).get(individual.id, 0)
+
+
+def get_needs_adjudication_tickets_counts(individual_ids: Iterable[Any]) -> dict[Any, int]:
+    individual_ids = list(individual_ids)
+    counts: dict[Any, int] = dict(
+        TicketNeedsAdjudicationDetails.objects.filter(golden_records_individual_id__in=individual_ids)
+        .values("golden_records_individual_id")
+        .annotate(count=Count("id"))
+        .values_list("golden_records_individual_id", "count")
+    )
     PossibleDuplicateThrough = TicketNeedsAdjudicationDetails.possible_duplicates.through  # noqa
-    possible_duplicates_count = (
-        PossibleDuplicateThrough.objects.filter(individual=individual)
-        .distinct("ticketneedsadjudicationdetails")
-        .count()
+    possible_duplicates_counts = (
+        PossibleDuplicateThrough.objects.filter(individual_id__in=individual_ids)
+        .values("individual_id")
+        .annotate(count=Count("ticketneedsadjudicationdetails", distinct=True))
+        .values_list("individual_id", "count")
     )
-    return golden_records_count + possible_duplicates_count
+    for individual_id, count in possible_duplicates_counts:
+        counts[individual_id] = counts.get(individual_id, 0) + count
+    return counts
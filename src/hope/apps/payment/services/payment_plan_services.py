@@ -1,5 +1,5 @@
 import datetime
-from itertools import groupby
+from itertools import batched, groupby
 import logging
 from typing import TYPE_CHECKING, Any, Callable, Union, cast
 
@@ -78,6 +78,8 @@ if TYPE_CHECKING:
 
     from hope.models import FollowUpInstruction
 
+CREATE_PAYMENTS_BATCH_SIZE = 5000
+
 
 class PaymentPlanService:
     def __init__(self, payment_plan: "PaymentPlan"):
@@ -475,36 +477,46 @@ class PaymentPlanService:
             .values("pk", "pr_collector", "alt_collector", "unicef_id", "head_of_household", "use_alt_collector")
         )
 
-        for household in households:
-            collector, collector_type = PaymentPlanService._get_collector(household)
-
-            has_valid_wallet = True
-            if payment_plan.delivery_mechanism and payment_plan.financial_service_provider:
-                has_valid_wallet = PaymentDataCollector.validate_account(
-                    payment_plan.financial_service_provider,
-                    payment_plan.delivery_mechanism,
-                    collector,
-                )
-
-            payments_to_create.append(
-                Payment(
-                    parent=payment_plan,
-                    parent_split=pp_split,
-                    program_id=payment_plan.program_cycle.program_id,
-                    business_area_id=payment_plan.business_area_id,
-                    status=Payment.STATUS_PENDING,
-                    status_date=timezone.now(),
-                    household_id=household["pk"],
-                    head_of_household_id=household["head_of_household"],
-                    collector=collector,
-                    collector_type=collector_type,
-                    financial_service_provider=payment_plan.financial_service_provider,
-                    delivery_type=payment_plan.delivery_mechanism,
-                    has_valid_wallet=has_valid_wallet,
-                )
+        fsp = payment_plan.financial_service_provider
+        delivery_mechanism = payment_plan.delivery_mechanism
+        program_id = payment_plan.program_cycle.program_id
+        status_date = timezone.now()
+        for households_batch in batched(
+            households.iterator(chunk_size=CREATE_PAYMENTS_BATCH_SIZE), CREATE_PAYMENTS_BATCH_SIZE, strict=False
+        ):
+            collector_ids = {
+                household["pk"]: PaymentPlanService._get_collector_id(household) for household in households_batch
+            }
+            collectors = Individual.objects.select_related("household").in_bulk(
+                {collector_id for collector_id, _ in collector_ids.values()}
             )
+            valid_wallets = {}
+            if delivery_mechanism and fsp:
+                valid_wallets = PaymentDataCollector.validate_accounts(fsp, delivery_mechanism, collectors.values())
+
+            for household in households_batch:
+                collector_id, collector_type = collector_ids[household["pk"]]
+                if collector_id not in collectors:
+                    raise Individual.DoesNotExist(f"Collector {collector_id} for {household['unicef_id']} not found")
+                payments_to_create.append(
+                    Payment(
+                        parent=payment_plan,
+                        parent_split=pp_split,
+                        program_id=program_id,
+                        business_area_id=payment_plan.business_area_id,
+                        status=Payment.STATUS_PENDING,
+                        status_date=status_date,
+                        household_id=household["pk"],
+                        head_of_household_id=household["head_of_household"],
+                        collector_id=collector_id,
+                        collector_type=collector_type,
+                        financial_service_provider=fsp,
+                        delivery_type=delivery_mechanism,
+                        has_valid_wallet=valid_wallets.get(collector_id, True),
+                    )
+                )
         try:
-            Payment.objects.bulk_create(payments_to_create)
+            Payment.objects.bulk_create(payments_to_create, batch_size=CREATE_PAYMENTS_BATCH_SIZE)
         except IntegrityError as e:
             raise ValidationError("Duplicated Households in provided Targeting List") from e
         payment_plan.refresh_from_db()
@@ -513,6 +525,11 @@ class PaymentPlanService:
 
     @staticmethod
     def _get_collector(household: dict[str, Any]) -> tuple[Individual, str]:
+        collector_id, collector_type = PaymentPlanService._get_collector_id(household)
+        return Individual.objects.get(id=collector_id), collector_type
+
+    @staticmethod
+    def _get_collector_id(household: dict[str, Any]) -> tuple[Any, str]:
         use_alt_collector = household.get("use_alt_collector", False)
         if use_alt_collector:
             collector_id = household.get("alt_collector")
@@ -526,7 +543,7 @@ class PaymentPlanService:
             logging.exception(msg)
             raise ValidationError(msg)
 
-        return Individual.objects.get(id=collector_id), collector_type
+        return collector_id, collector_type
 
     @staticmethod
     def generate_signature(payment_plan: PaymentPlan) -> None:
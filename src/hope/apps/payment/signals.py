@@ -4,7 +4,7 @@ from django.db import transaction
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from hope.api.caches import get_or_create_cache_key, increment_cache_key
+from hope.api.caches import get_or_create_cache_key, increment_cache_key, invalidate_program_model_cache
 from hope.models import PaymentPlan, PaymentPlanGroup, ProgramCycle
 from hope.models.payment_plan_purpose import PaymentPlanPurpose
 
@@ -56,3 +56,12 @@ def increment_payment_plan_version_cache(sender: Any, instance: PaymentPlan, cre
             increment_cache_key(version_key)
 
         transaction.on_commit(_increment)
+
+
+@receiver(post_save, sender=PaymentPlan)
+@receiver(post_delete, sender=PaymentPlan)
+def increment_payment_plan_program_version_cache(sender: Any, instance: PaymentPlan, **kwargs: dict) -> None:
+    if kwargs.get("raw"):
+        return
+    # cycle list totals are computed from the payment plans
+    invalidate_program_model_cache([instance.program_cycle.program_id], PaymentPlan, ProgramCycle)
@@ -107,7 +107,7 @@ def get_quantity_in_usd(
 
     if not exchange_rate:
         if not exchange_rates_client:
-            exchange_rates_client = ExchangeRates()
+            exchange_rates_client = ExchangeRates.get_shared()
         exchange_rate = exchange_rates_client.get_exchange_rate_for_currency_code(currency_code, currency_exchange_date)
 
     if exchange_rate is None:
@@ -1,20 +1,8 @@
 import re
-import secrets
 
 from django.core.exceptions import ValidationError
 
 
-def generate_numeric_token(digit_number: int = 3) -> int:
-    while True:
-        # Token and Order Number must not start with 0
-        lower = 10 ** (digit_number - 1)
-        upper = (10**digit_number) - 1
-        token = secrets.randbelow(upper - lower + 1) + lower
-        # Token and Order Number must not have the same digit more than 3 times in a row
-        if not has_repeated_digits_more_than_3_times(token):
-            return token
-
-
 def has_repeated_digits_more_than_3_times(token: int) -> bool:
     """Check if the token has the same digit repeated more than 3 times in a row (like 1111)."""
     pattern = r"(\d)\1{3,}"
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any
 
 from django.urls import reverse
 import openpyxl
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Border, PatternFill, Side
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.dimensions import ColumnDimension, DimensionHolder
@@ -23,12 +24,23 @@ class XlsxExportBaseService:
     text_template = "payment/xlsx_file_generated_email.txt"
     html_template = "payment/xlsx_file_generated_email.html"
 
-    def _create_workbook(self) -> openpyxl.Workbook:
-        wb = openpyxl.Workbook()
-        ws_active = wb.active
-        ws_active.title = self.TITLE
+    def _create_workbook(self, write_only: bool = False) -> openpyxl.Workbook:
+        """Create the export workbook.
+
+        With `write_only` rows are streamed to disk as they are appended, so column widths and
+        cell styles have to be set up before the first row is written (see `_set_column_widths`
+        and `_highlight_columns`), and the workbook can be saved only once.
+        """
+        if write_only:
+            wb = openpyxl.Workbook(write_only=True)
+            ws_active = wb.create_sheet(self.TITLE)
+        else:
+            wb = openpyxl.Workbook()
+            ws_active = wb.active
+            ws_active.title = self.TITLE
         self.wb = wb
         self.ws_export_list = ws_active
+        self.highlighted_columns: dict[int, tuple[PatternFill, Border]] = {}
         return wb
 
     def _add_headers(self) -> None:
@@ -53,6 +65,30 @@ class XlsxExportBaseService:
 
         ws.column_dimensions = dim_holder
 
+    def _set_column_widths(self, column_count: int) -> None:
+        """Set the same widths as `_adjust_column_width_from_col` upfront, from the header length."""
+        ws = self.ws_export_list
+        for col in range(1, max(column_count, 1) + 1):
+            ws.column_dimensions[get_column_letter(col)] = ColumnDimension(ws, min=col, max=col, width=20)
+
+    def _highlight_columns(self, columns: list[int], hex_code: str = "A0FDB0") -> None:
+        """Style the given columns like `_add_col_bgcolor`, for every row appended with `_append_row`."""
+        fill = PatternFill(bgColor=hex_code, fgColor=hex_code, fill_type="lightUp")
+        bd = Side(style="thin", color="999999")
+        border = Border(left=bd, top=bd, right=bd, bottom=bd)
+        self.highlighted_columns = {column - 1: (fill, border) for column in columns}
+
+    def _append_row(self, row: list) -> None:
+        if self.highlighted_columns:
+            row = list(row)
+        for index, (fill, border) in self.highlighted_columns.items():
+            if index < len(row):
+                cell = WriteOnlyCell(self.ws_export_list, value=row[index])
+                cell.fill = fill
+                cell.border = border
+                row[index] = cell
+        self.ws_export_list.append(row)
+
     def _add_col_bgcolor(
         self,
         col: list | None = None,
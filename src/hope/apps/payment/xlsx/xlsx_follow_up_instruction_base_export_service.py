@@ -111,23 +111,24 @@ class XlsxFollowUpInstructionBaseExportService(XlsxExportBaseService, ABC):
             aggregated_rows[household_id] = self._merge_rows(aggregated_rows[household_id], payment_row)
         return [aggregated_rows[household_id] for household_id in sorted(aggregated_rows)]
 
-    def generate_workbook(self) -> Workbook:
-        self._create_workbook()
-        self.ws_export_list.append(self.headers)
+    def generate_workbook(self, write_only: bool = False) -> Workbook:
+        self._create_workbook(write_only=write_only)
+        self._set_column_widths(len(self.headers))
+        self._highlight_columns(
+            [
+                self.headers.index(header) + 1
+                for header in ("entitlement_quantity", "delivered_quantity")
+                if header in self.headers
+            ]
+        )
+        self._append_row(self.headers)
         for payment_row in self._iter_aggregated_rows():
-            self.ws_export_list.append([self.right_format_for_xlsx(payment_row.get(header)) for header in self.headers])
-        self._adjust_column_width_from_col(self.ws_export_list)
-        highlighted_columns = [
-            self.headers.index(header) + 1
-            for header in ("entitlement_quantity", "delivered_quantity")
-            if header in self.headers
-        ]
-        self._add_col_bgcolor(highlighted_columns)
+            self._append_row([self.right_format_for_xlsx(payment_row.get(header)) for header in self.headers])
         return self.wb
 
     def save_xlsx_file(self, user: User) -> None:
         filename = f"{self.filename_prefix}_{self.instruction.unicef_id}.xlsx"
-        self.generate_workbook()
+        self.generate_workbook(write_only=True)
         with NamedTemporaryFile(suffix=".xlsx") as tmp:
             xlsx_obj = FileTemp(
                 object_id=str(self.instruction.pk),
@@ -216,7 +216,7 @@ class XlsxFollowUpInstructionReconciliationImportService(XlsxImportBaseService):
 
             if payment_verification.status != verification_status:
                 payment_verification.status = verification_status
-                payment_verification.status_date = timezone.now()
+                payment_verification.status_date = payment_verification.updated_at = timezone.now()
                 self.payment_verifications_to_save.append(payment_verification)
                 self.payment_verification_plans_to_update[str(payment_verification.payment_verification_plan_id)] = (
                     payment_verification.payment_verification_plan
@@ -253,6 +253,8 @@ class XlsxFollowUpInstructionReconciliationImportService(XlsxImportBaseService):
                 payment.delivered_quantity_usd = delivered_quantity_usd
                 payment.status = status
                 payment.delivery_date = delivery_date
+                # bulk_update skips auto_now, the dashboard refresh picks changed payments by updated_at
+                payment.updated_at = timezone.now()
                 self.payments_to_save.append(payment)
                 self.payment_plans_to_update[str(payment.parent_id)] = payment.parent
                 self._update_payment_verification(payment, delivered_quantity_value)
@@ -265,11 +267,13 @@ class XlsxFollowUpInstructionReconciliationImportService(XlsxImportBaseService):
 
         Payment.objects.bulk_update(
             self.payments_to_save,
-            ("delivered_quantity", "delivered_quantity_usd", "status", "delivery_date"),
+            ("delivered_quantity", "delivered_quantity_usd", "status", "delivery_date", "updated_at"),
             batch_size=500,
         )
         handle_total_cash_in_specific_households([payment.household_id for payment in self.payments_to_save])
-        PaymentVerification.objects.bulk_update(self.payment_verifications_to_save, ("status", "status_date"))
+        PaymentVerification.objects.bulk_update(
+            self.payment_verifications_to_save, ("status", "status_date", "updated_at")
+        )
         for payment_verification_plan in self.payment_verification_plans_to_update.values():
             calculate_counts(payment_verification_plan)
             payment_verification_plan.save()
@@ -1,7 +1,7 @@
-from io import BytesIO
+from itertools import batched
 import logging
 from tempfile import NamedTemporaryFile
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING
 import zipfile
 
 from django.db.models import Q, QuerySet
@@ -16,7 +16,7 @@ from hope.apps.core.field_attributes.core_fields_attributes import (
     FieldFactory,
     get_core_fields_attributes,
 )
-from hope.apps.payment.validators import generate_numeric_token
+from hope.apps.payment.services.payment_number_allocator import PaymentNumberAllocator
 from hope.apps.payment.xlsx.base_xlsx_export_service import XlsxExportBaseService
 from hope.apps.utils.exceptions import log_and_raise
 from hope.models import (
@@ -36,6 +36,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+TOKEN_AND_ORDER_NUMBERS_BATCH_SIZE = 2000
+
 
 class XlsxPaymentPlanDeliveryExportService(XlsxExportBaseService):
     @staticmethod
@@ -92,62 +94,29 @@ class XlsxPaymentPlanDeliveryExportService(XlsxExportBaseService):
         program: Program,
     ) -> None:
         """Ensure order_number/token_number for all rows in qs."""
-        existing_orders: set[int] = cast(
-            "set[int]",
-            set(
-                Payment.objects.filter(order_number__isnull=False, parent__program_cycle__program=program).values_list(
-                    "order_number", flat=True
-                )
-            ),
+        missing_qs = (
+            qs.filter(Q(order_number__isnull=True) | Q(token_number__isnull=True))
+            .only("id", "order_number", "token_number")
+            .order_by("id")
         )
-        existing_tokens: set[int] = cast(
-            "set[int]",
-            set(
-                Payment.objects.filter(token_number__isnull=False, parent__program_cycle__program=program).values_list(
-                    "token_number", flat=True
-                )
-            ),
-        )
-
-        missing_qs = qs.filter(Q(order_number__isnull=True) | Q(token_number__isnull=True))
-        payments_ids = list(missing_qs.order_by("id").values_list("id", flat=True))
-
-        if not payments_ids:
-            return
-
-        payments: list[Payment] = list(
-            cast("QuerySet[Payment, Payment]", qs.only("id", "order_number", "token_number"))
-        )
-        if not payments:  # pragma: no cover
-            return
-
-        to_update: list[Payment] = []
-
-        for payment in payments:
-            need_order = payment.order_number is None
-            need_token = payment.token_number is None
-
-            if not (need_order or need_token):  # pragma: no cover
-                continue
-
-            if need_order:
-                n9 = generate_numeric_token(9)
-                while n9 in existing_orders:  # pragma: no cover
-                    n9 = generate_numeric_token(9)
-                payment.order_number = n9
-                existing_orders.add(n9)
-
-            if need_token:
-                n7 = generate_numeric_token(7)
-                while n7 in existing_tokens:  # pragma: no cover
-                    n7 = generate_numeric_token(7)
-                payment.token_number = n7
-                existing_tokens.add(n7)
-
-            to_update.append(payment)
-
-        if to_update:
-            Payment.objects.bulk_update(to_update, ["order_number", "token_number"])
+        allocator = PaymentNumberAllocator(program)
+        for payments in batched(
+            missing_qs.iterator(chunk_size=TOKEN_AND_ORDER_NUMBERS_BATCH_SIZE),
+            TOKEN_AND_ORDER_NUMBERS_BATCH_SIZE,
+            strict=False,
+        ):
+            order_numbers = iter(
+                allocator.allocate("order_number", sum(payment.order_number is None for payment in payments))
+            )
+            token_numbers = iter(
+                allocator.allocate("token_number", sum(payment.token_number is None for payment in payments))
+            )
+            for payment in payments:
+                if payment.order_number is None:
+                    payment.order_number = next(order_numbers)
+                if payment.token_number is None:
+                    payment.token_number = next(token_numbers)
+            Payment.objects.bulk_update(payments, ["order_number", "token_number"])
 
     def get_account_fields_headers(self) -> list[str]:
         # Iterate over eligible payments to find the first with valid account_data.
@@ -329,22 +298,23 @@ class XlsxPaymentPlanDeliveryExportService(XlsxExportBaseService):
         filename: str,
         password: str | None = None,
     ) -> None:
-        with NamedTemporaryFile() as tmp:
+        # the workbook and its encrypted copy go through temporary files, zip_file.write streams them in chunks
+        with NamedTemporaryFile(suffix=".xlsx") as tmp:
             wb.save(tmp.name)
             tmp.seek(0)
 
             if password:
                 # encrypt workbook
-                output = BytesIO()
-                office_file = msoffcrypto.OfficeFile(tmp)
-                office_file.load_key(password=password)
-                office_file.encrypt(password, output)
-                output.seek(0)
-                # add xlsx to zip
-                zip_file.writestr(filename, output.getvalue())
+                with NamedTemporaryFile(suffix=".xlsx") as encrypted:
+                    office_file = msoffcrypto.OfficeFile(tmp)
+                    office_file.load_key(password=password)
+                    office_file.encrypt(password, encrypted)
+                    encrypted.flush()
+                    # add xlsx to zip
+                    zip_file.write(encrypted.name, arcname=filename)
             else:
                 # add xlsx to zip
-                zip_file.writestr(filename, tmp.read())
+                zip_file.write(tmp.name, arcname=filename)
 
     @staticmethod
     def _send_file_passwords(user: "User", file_temp: FileTemp | None, title: str) -> None:
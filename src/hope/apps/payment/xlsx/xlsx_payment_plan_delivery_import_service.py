@@ -288,13 +288,16 @@ class XlsxPaymentPlanDeliveryImportService(XlsxImportBaseService):
                 "additional_document_number",
                 "transaction_status_blockchain_link",
                 "extras",
+                "updated_at",
             ),
             batch_size=500,
         )
         self.logger.info("Update total cash in households")
         handle_total_cash_in_specific_households([payment.household_id for payment in self.payments_to_save])
         self.logger.info("Updating status and status date in payment verifications")
-        PaymentVerification.objects.bulk_update(self.payment_verifications_to_save, ("status", "status_date"))
+        PaymentVerification.objects.bulk_update(
+            self.payment_verifications_to_save, ("status", "status_date", "updated_at")
+        )
         self.logger.info("Finished import payment list")
 
     def _get_delivered_quantity_status_and_value(
@@ -329,7 +332,7 @@ class XlsxPaymentPlanDeliveryImportService(XlsxImportBaseService):
                 pv_status = PaymentVerification.STATUS_RECEIVED_WITH_ISSUES
 
             payment_verification.status = pv_status
-            payment_verification.status_date = timezone.now()
+            payment_verification.status_date = payment_verification.updated_at = timezone.now()
             self.payment_verifications_to_save.append(payment_verification)
 
             payment_verification_plan = payment_verification.payment_verification_plan
@@ -408,6 +411,8 @@ class XlsxPaymentPlanDeliveryImportService(XlsxImportBaseService):
                 payment.transaction_reference_id = reference_id
                 payment.transaction_status_blockchain_link = transaction_status_blockchain_link
                 payment.extras = new_extras
+                # bulk_update skips auto_now, the dashboard refresh picks changed payments by updated_at
+                payment.updated_at = timezone.now()
 
                 self.payments_to_save.append(payment)
                 self._update_payment_verification(payment, delivered_quantity)
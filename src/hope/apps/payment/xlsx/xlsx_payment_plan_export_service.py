@@ -46,7 +46,7 @@ class XlsxPaymentPlanExportService(XlsxPaymentPlanBaseService, XlsxExportBaseSer
             )
             for column_name in self.headers
         ]
-        self.ws_export_list.append(payment_row)
+        self._append_row(payment_row)
 
     def _add_payment_list(self) -> None:
         qs = (
@@ -63,23 +63,23 @@ class XlsxPaymentPlanExportService(XlsxPaymentPlanBaseService, XlsxExportBaseSer
             self._add_payment_row(payment)
 
     def _add_headers(self) -> None:
-        self.ws_export_list.append(self.headers)
+        self._append_row(self.headers)
 
-    def generate_workbook(self) -> openpyxl.Workbook:
-        self._create_workbook()
-        self._add_headers()
-        self._add_payment_list()
-        self._adjust_column_width_from_col(ws=self.ws_export_list)
-        self._add_col_bgcolor(
+    def generate_workbook(self, write_only: bool = False) -> openpyxl.Workbook:
+        self._create_workbook(write_only=write_only)
+        self._set_column_widths(len(self.headers))
+        self._highlight_columns(
             [
                 self.headers.index("entitlement_quantity") + 1,
             ],
         )
+        self._add_headers()
+        self._add_payment_list()
         return self.wb
 
     def save_xlsx_file(self, user: "User") -> None:
         filename = f"payment_plan_payment_list_{self.payment_plan.unicef_id or self.payment_plan.id}.xlsx"
-        self.generate_workbook()
+        self.generate_workbook(write_only=True)
         with NamedTemporaryFile() as tmp:
             xlsx_obj = FileTemp(
                 object_id=str(self.payment_plan.pk),
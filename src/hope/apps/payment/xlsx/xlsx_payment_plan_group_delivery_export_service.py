@@ -13,6 +13,7 @@ from django.utils.crypto import get_random_string
 import openpyxl
 import pyzipper
 
+from hope.api.caches import invalidate_program_model_cache
 from hope.apps.payment.xlsx.base_xlsx_export_service import XlsxExportBaseService
 from hope.apps.payment.xlsx.xlsx_payment_plan_delivery_export_service import XlsxPaymentPlanDeliveryExportService
 from hope.models import (
@@ -178,8 +179,8 @@ class XlsxPaymentPlanGroupDeliveryExportService(XlsxExportBaseService):
         current_max = self.payment_plan_group.payment_plans.aggregate(max_tag=Max("export_tag"))["max_tag"]
         return (current_max or 0) + 1
 
-    def generate_workbook(self) -> openpyxl.Workbook:
-        self._create_workbook()
+    def generate_workbook(self, write_only: bool = False) -> openpyxl.Workbook:
+        self._create_workbook(write_only=write_only)
 
         header: list[str] = []
         prepared_services: list[XlsxPaymentPlanDeliveryExportService] = []
@@ -203,6 +204,7 @@ class XlsxPaymentPlanGroupDeliveryExportService(XlsxExportBaseService):
             prepared_services.append(per_fsp_service)
             self.exported_plan_ids.append(payment_plan.id)
 
+        self._set_column_widths(len(header))
         self.ws_export_list.append(header)
 
         for per_fsp_service in prepared_services:
@@ -212,12 +214,11 @@ class XlsxPaymentPlanGroupDeliveryExportService(XlsxExportBaseService):
             for payment in payments.iterator(chunk_size=self.batch_size):
                 self.ws_export_list.append(per_fsp_service.get_payment_row(payment))
 
-        self._adjust_column_width_from_col(ws=self.ws_export_list)
         return self.wb
 
     def save_xlsx_file(self, user: "User") -> None:
         group = self.payment_plan_group
-        self.generate_workbook()
+        self.generate_workbook(write_only=True)
         if not self.exported_plan_ids:
             raise EmptyDeliveryExportError(self.skipped_reasons)
         if self.export_tag is not None:
@@ -243,7 +244,7 @@ class XlsxPaymentPlanGroupDeliveryExportService(XlsxExportBaseService):
             tmp.seek(0)
             file_temp.file.save(filename, File(tmp))
             with transaction.atomic():
-                # bump updated_at so the payment-plan list cache invalidates
+                # .update() skips the post_save signals, invalidate the payment-plan list cache explicitly
                 if self.export_tag is not None:
                     PaymentPlan.objects.filter(id__in=self.exported_plan_ids).update(
                         export_file_delivery=file_temp, updated_at=timezone.now()
@@ -252,6 +253,7 @@ class XlsxPaymentPlanGroupDeliveryExportService(XlsxExportBaseService):
                     PaymentPlan.objects.filter(id__in=self.exported_plan_ids).update(
                         export_tag=tag, export_file_delivery=file_temp, updated_at=timezone.now()
                     )
+                invalidate_program_model_cache([group.cycle.program_id], PaymentPlan)
 
     def _save_xlsx_file_with_auth_code(self, group: "PaymentPlanGroup", tag: int, user: "User") -> None:
         zip_password = get_random_string(12)
@@ -276,7 +278,7 @@ class XlsxPaymentPlanGroupDeliveryExportService(XlsxExportBaseService):
             tmp_zip.seek(0)
             file_temp.file.save(zip_filename, File(tmp_zip))
             with transaction.atomic():
-                # bump updated_at so the payment-plan list cache invalidates
+                # .update() skips the post_save signals, invalidate the payment-plan list cache explicitly
                 if self.export_tag is not None:
                     PaymentPlan.objects.filter(id__in=self.exported_plan_ids).update(
                         export_file_delivery=file_temp, updated_at=timezone.now()
@@ -285,3 +287,4 @@ class XlsxPaymentPlanGroupDeliveryExportService(XlsxExportBaseService):
                     PaymentPlan.objects.filter(id__in=self.exported_plan_ids).update(
                         export_tag=tag, export_file_delivery=file_temp, updated_at=timezone.now()
                     )
+                invalidate_program_model_cache([group.cycle.program_id], PaymentPlan)
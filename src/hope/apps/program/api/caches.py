@@ -5,15 +5,17 @@ from rest_framework_extensions.key_constructor.bits import KeyBitBase
 from rest_framework_extensions.key_constructor.constructors import KeyConstructor
 
 from hope.api.caches import (
-    BusinessAreaAndProgramLastUpdatedKeyBit,
+    BusinessAreaAndProgramVersionKeyBit,
     BusinessAreaVersionKeyBit,
     KeyConstructorMixin,
     get_or_create_cache_key,
 )
+from hope.models import ProgramCycle
 
 
-class ProgramCycleListVersionsKeyBit(BusinessAreaAndProgramLastUpdatedKeyBit):
+class ProgramCycleListVersionsKeyBit(BusinessAreaAndProgramVersionKeyBit):
     specific_view_cache_key = "program_cycle_list"
+    versioned_model = ProgramCycle
 
 
 class ProgramCycleKeyConstructor(KeyConstructorMixin):
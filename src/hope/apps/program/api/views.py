@@ -23,7 +23,7 @@ from rest_framework.response import Response
 from rest_framework.serializers import BaseSerializer
 from rest_framework.viewsets import GenericViewSet, ModelViewSet
 
-from hope.api.caches import cached_response, etag_decorator
+from hope.api.caches import cached_response, etag_decorator, invalidate_program_model_cache
 from hope.apps.account.permissions import ALL_GRIEVANCES_CREATE_MODIFY, Permissions
 from hope.apps.core.api.filters import UpdatedAtFilter
 from hope.apps.core.api.mixins import (
@@ -544,6 +544,8 @@ class ProgramCycleViewSet(
             PaymentPlan.objects.filter(program_cycle=cycle).update(start_date=updated_cycle.start_date)
         if previous_end_date != updated_cycle.end_date:
             PaymentPlan.objects.filter(program_cycle=cycle).update(end_date=updated_cycle.end_date)
+        if (previous_start_date, previous_end_date) != (updated_cycle.start_date, updated_cycle.end_date):
+            invalidate_program_model_cache([cycle.program_id], PaymentPlan)
 
     def perform_destroy(self, program_cycle: ProgramCycle) -> None:
         if program_cycle.program.status != Program.ACTIVE:
@@ -4,12 +4,12 @@ from django.db import transaction
 from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import Signal, receiver
 
-from hope.api.caches import get_or_create_cache_key, increment_cache_key
+from hope.api.caches import get_or_create_cache_key, increment_cache_key, invalidate_program_model_cache
 from hope.apps.program.utils import (
     create_program_partner_access,
     remove_program_partner_access,
 )
-from hope.models import BeneficiaryGroup, Program
+from hope.models import BeneficiaryGroup, Program, ProgramCycle
 
 program_copied = Signal()
 
@@ -55,3 +55,10 @@ def increase_program_version_cache(sender: Any, instance: Program, **kwargs: dic
         increment_cache_key(version_key)
 
     transaction.on_commit(_increment)
+
+
+@receiver([post_save, post_delete], sender=ProgramCycle)
+def increase_program_cycle_version_cache(sender: Any, instance: ProgramCycle, **kwargs: dict) -> None:
+    if kwargs.get("raw"):
+        return
+    invalidate_program_model_cache([instance.program_id], ProgramCycle)
@@ -389,6 +389,59 @@ def rdi_deduplication_async_task(registration_data_import: RegistrationDataImpor
     )
 
 
+def rdi_deduplication_shard_async_task_action(job: AsyncRetryJob) -> None:
+    try:
+        from hope.apps.registration_data.tasks.deduplicate import DeduplicateTask
+
+        rdi_obj = RegistrationDataImport.objects.get(id=job.config["registration_data_import_id"])
+        set_sentry_business_area_tag(rdi_obj.business_area.slug)
+        task = DeduplicateTask(rdi_obj.business_area.slug, rdi_obj.program_id)
+        with transaction.atomic():
+            task.deduplicate_pending_individuals_shard(
+                rdi_obj,
+                job.config["first_individual_id"],
+                job.config["last_individual_id"],
+            )
+            AsyncRetryJob.objects.filter(pk=job.pk).update(config={**job.config, "finished": True})
+            # lock the RDI so only the shard finishing last merges the results
+            rdi_obj = RegistrationDataImport.objects.select_for_update().get(id=rdi_obj.id)
+            finished_shards_count = AsyncRetryJob.objects.filter(
+                config__sharding_run_id=job.config["sharding_run_id"],
+                config__finished=True,
+            ).count()
+            if finished_shards_count == job.config["shards_count"]:
+                task.finalize_sharded_deduplication(rdi_obj)
+    except Exception as exc:  # noqa
+        handle_rdi_exception(job.config["registration_data_import_id"], exc)
+        raise
+
+
+def rdi_deduplication_shard_async_task(
+    registration_data_import: RegistrationDataImport,
+    sharding_run_id: str,
+    shards_count: int,
+    first_individual_id: str,
+    last_individual_id: str,
+) -> None:
+    config = {
+        "registration_data_import_id": str(registration_data_import.id),
+        "sharding_run_id": sharding_run_id,
+        "shards_count": shards_count,
+        "first_individual_id": first_individual_id,
+        "last_individual_id": last_individual_id,
+    }
+    AsyncRetryJob.queue_task(
+        instance=registration_data_import,
+        job_name=rdi_deduplication_shard_async_task.__name__,
+        program=registration_data_import.program,
+        action="hope.apps.registration_data.celery_tasks.rdi_deduplication_shard_async_task_action",
+        config=config,
+        group_key="registration_data",
+        description=f"Deduplicate registration data import {str(registration_data_import.id)} "
+        f"individuals {first_individual_id} - {last_individual_id}",
+    )
+
+
 def pull_kobo_submissions_async_task_action(job: AsyncRetryJob) -> dict:
     from hope.models import KoboImportData
 
@@ -1,5 +1,7 @@
+from collections import defaultdict
 import logging
 from typing import cast
+from uuid import UUID
 
 from django.conf import settings
 from django.db import transaction
@@ -177,69 +179,61 @@ class BiometricDeduplicationService:
     def mark_rdis_as_error(rdis: QuerySet[RegistrationDataImport]) -> None:
         rdis.update(deduplication_engine_status=RegistrationDataImport.DEDUP_ENGINE_ERROR)
 
+    @staticmethod
+    def _group_pairs_by_individual(
+        similarity_pairs: QuerySet[DeduplicationEngineSimilarityPair], individuals_ids: set[UUID]
+    ) -> dict[UUID, list[DeduplicationEngineSimilarityPair]]:
+        """Collect the pairs of every given individual in one pass over the pairs."""
+        pairs_by_individual: dict[UUID, list[DeduplicationEngineSimilarityPair]] = defaultdict(list)
+        for pair in similarity_pairs.prefetch_related(
+            "individual1__household__admin2", "individual2__household__admin2"
+        ):
+            for individual_id in (pair.individual1_id, pair.individual2_id):
+                if individual_id in individuals_ids:
+                    pairs_by_individual[individual_id].append(pair)
+        return pairs_by_individual
+
     def store_rdi_deduplication_statistics(self, rdi: RegistrationDataImport) -> None:
-        rdi_individuals = PendingIndividual.objects.filter(registration_data_import=rdi)
-        rdi_individuals_ids = rdi_individuals.values_list("id", flat=True)
-
-        batch_duplicates = self.get_duplicates_for_rdi_against_batch(rdi)
-        batch_unique_individuals = set()
-        for pair in batch_duplicates:
-            batch_unique_individuals.add(pair.individual1_id)
-            batch_unique_individuals.add(pair.individual2_id)
-        rdi.dedup_engine_batch_duplicates = len(batch_unique_individuals)
-
-        population_duplicates = self.get_duplicates_for_rdi_against_population(rdi, rdi_merged=False)
-        population_unique_individuals = set()
-        for pair in population_duplicates:
-            if pair.individual1_id in rdi_individuals_ids:
-                population_unique_individuals.add(pair.individual1_id)
-            if pair.individual2_id in rdi_individuals_ids:
-                population_unique_individuals.add(pair.individual2_id)  # pragma: no cover
-        rdi.dedup_engine_golden_record_duplicates = len(population_unique_individuals)
+        rdi_individuals = list(PendingIndividual.objects.filter(registration_data_import=rdi).only("id", "program"))
+        rdi_individuals_ids = {individual.id for individual in rdi_individuals}
+
+        batch_duplicates = self._group_pairs_by_individual(
+            self.get_duplicates_for_rdi_against_batch(rdi), rdi_individuals_ids
+        )
+        rdi.dedup_engine_batch_duplicates = len(batch_duplicates)
+
+        population_duplicates = self._group_pairs_by_individual(
+            self.get_duplicates_for_rdi_against_population(rdi, rdi_merged=False), rdi_individuals_ids
+        )
+        rdi.dedup_engine_golden_record_duplicates = len(population_duplicates)
 
         rdi.save(update_fields=["dedup_engine_batch_duplicates", "dedup_engine_golden_record_duplicates"])
 
         for individual in rdi_individuals:
-            population_ind_duplicates = population_duplicates.filter(
-                Q(individual1=individual) | Q(individual2=individual),
-            )
+            population_ind_duplicates = population_duplicates.get(individual.id, [])
             individual.biometric_deduplication_golden_record_results = (
-                DeduplicationEngineSimilarityPair.serialize_for_individual(
-                    individual,
-                    cast(
-                        "QuerySet[DeduplicationEngineSimilarityPair, DeduplicationEngineSimilarityPair]",
-                        population_ind_duplicates,
-                    ),
-                )
-            )
-            individual.biometric_deduplication_golden_record_status = (
-                DUPLICATE if population_ind_duplicates.exists() else UNIQUE
+                DeduplicationEngineSimilarityPair.serialize_for_individual(individual, population_ind_duplicates)
             )
+            individual.biometric_deduplication_golden_record_status = DUPLICATE if population_ind_duplicates else UNIQUE
 
-            batch_ind_duplicates = batch_duplicates.filter(
-                Q(individual1=individual) | Q(individual2=individual),
-            )
+            batch_ind_duplicates = batch_duplicates.get(individual.id, [])
             individual.biometric_deduplication_batch_results = (
-                DeduplicationEngineSimilarityPair.serialize_for_individual(
-                    individual,
-                    cast(
-                        "QuerySet[DeduplicationEngineSimilarityPair, DeduplicationEngineSimilarityPair]",
-                        batch_ind_duplicates,
-                    ),
-                )
+                DeduplicationEngineSimilarityPair.serialize_for_individual(individual, batch_ind_duplicates)
             )
             individual.biometric_deduplication_batch_status = (
-                DUPLICATE_IN_BATCH if batch_ind_duplicates.exists() else UNIQUE_IN_BATCH
+                DUPLICATE_IN_BATCH if batch_ind_duplicates else UNIQUE_IN_BATCH
             )
 
-            individual.save(
-                update_fields=[
-                    "biometric_deduplication_golden_record_results",
-                    "biometric_deduplication_golden_record_status",
-                    "biometric_deduplication_batch_results",
-                    "biometric_deduplication_batch_status",
-                ]
-            )
+        PendingIndividual.objects.bulk_update(
+            rdi_individuals,
+            [
+                "biometric_deduplication_golden_record_results",
+                "biometric_deduplication_golden_record_status",
+                "biometric_deduplication_batch_results",
+                "biometric_deduplication_batch_status",
+            ],
+            batch_size=1000,
+        )
 
     def store_rdis_deduplication_statistics(self, rdis: QuerySet[RegistrationDataImport]) -> None:
         for rdi in rdis:
@@ -252,42 +246,32 @@ class BiometricDeduplicationService:
             deduplication_engine_status=RegistrationDataImport.DEDUP_ENGINE_FINISHED,
         ).exclude(id=exclude_rdi.id)
         for rdi in rdis:
-            rdi_individuals = PendingIndividual.objects.filter(registration_data_import=rdi)
-            rdi_individuals_ids = rdi_individuals.values_list("id", flat=True)
-            population_duplicates = self.get_duplicates_for_rdi_against_population(rdi, rdi_merged=False)
-            population_unique_individuals = set()
-            for pair in population_duplicates:
-                if pair.individual1_id in rdi_individuals_ids:
-                    population_unique_individuals.add(pair.individual1_id)
-                if pair.individual2_id in rdi_individuals_ids:
-                    population_unique_individuals.add(pair.individual2_id)  # pragma: no cover
-
-            rdi.dedup_engine_golden_record_duplicates = len(population_unique_individuals)
+            rdi_individuals = list(PendingIndividual.objects.filter(registration_data_import=rdi).only("id", "program"))
+            population_duplicates = self._group_pairs_by_individual(
+                self.get_duplicates_for_rdi_against_population(rdi, rdi_merged=False),
+                {individual.id for individual in rdi_individuals},
+            )
+
+            rdi.dedup_engine_golden_record_duplicates = len(population_duplicates)
             rdi.save(update_fields=["dedup_engine_golden_record_duplicates"])
 
             for individual in rdi_individuals:
-                population_ind_duplicates = population_duplicates.filter(
-                    Q(individual1=individual) | Q(individual2=individual),
-                )
+                population_ind_duplicates = population_duplicates.get(individual.id, [])
                 individual.biometric_deduplication_golden_record_results = (
-                    DeduplicationEngineSimilarityPair.serialize_for_individual(
-                        individual,
-                        cast(
-                            "QuerySet[DeduplicationEngineSimilarityPair, DeduplicationEngineSimilarityPair]",
-                            population_ind_duplicates,
-                        ),
-                    )
+                    DeduplicationEngineSimilarityPair.serialize_for_individual(individual, population_ind_duplicates)
                 )
                 individual.biometric_deduplication_golden_record_status = (
-                    DUPLICATE if population_ind_duplicates.exists() else UNIQUE
+                    DUPLICATE if population_ind_duplicates else UNIQUE
                 )
 
-                individual.save(
-                    update_fields=[
-                        "biometric_deduplication_golden_record_results",
-                        "biometric_deduplication_golden_record_status",
-                    ]
-                )
+            PendingIndividual.objects.bulk_update(
+                rdi_individuals,
+                [
+                    "biometric_deduplication_golden_record_results",
+                    "biometric_deduplication_golden_record_status",
+                ],
+                batch_size=1000,
+            )
 
     def get_duplicates_for_rdi_against_batch(
         self, rdi: RegistrationDataImport
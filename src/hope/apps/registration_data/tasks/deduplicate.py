@@ -1,13 +1,16 @@
-from collections import defaultdict
-from dataclasses import dataclass, fields
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field, fields
 import itertools
+from itertools import batched
 import logging
-from typing import Any, Iterable, cast
+from typing import Any, Iterable, Iterator, cast
+import uuid
 
 from constance import config
 from django.db import transaction
 from django.db.models import Case, CharField, F, Prefetch, Q, QuerySet, Value, When
 from django.db.models.functions import Concat
+from elasticsearch.dsl import MultiSearch
 from psycopg2._psycopg import IntegrityError
 
 from hope.apps.core.utils import to_dict
@@ -78,6 +81,16 @@ class TicketData:
     possible_duplicates_throughs: list[Any]
 
 
+@dataclass
+class PendingDeduplicationState:
+    to_bulk_update_results: list[PendingIndividual] = field(default_factory=list)
+    duplicates_in_batch: set = field(default_factory=set)
+    possible_duplicates_in_batch: set = field(default_factory=set)
+    duplicates_in_population: set = field(default_factory=set)
+    possible_duplicates_in_population: set = field(default_factory=set)
+    checked_individuals_ids: set = field(default_factory=set)
+
+
 @dataclass
 class DeduplicationResult:
     duplicates: list
@@ -102,6 +115,9 @@ class DeduplicateTask:
         self.program: Program = Program.objects.get(id=program_id)
         self.thresholds: Thresholds = Thresholds.from_business_area(self.business_area)
         self.individual_doc_class = get_individual_doc(str(self.program.id))
+        # batched mode sends the ES queries of a whole window of individuals in a single `_msearch` request
+        self.use_batched_search: bool = bool(self.business_area.get_sys_option("batched_deduplication"))
+        self.search_window_size: int = max(config.DEDUPLICATION_MSEARCH_WINDOW_SIZE, 1)
 
     def deduplicate_individuals_against_population(self, individuals: QuerySet[Individual]) -> None:
         ensure_index_ready(self.individual_doc_class._index._name)
@@ -126,8 +142,9 @@ class DeduplicateTask:
             "program_id",
         ]
         individual_qs = individuals.only(*individual_fields).prefetch_related("identities")
-        for index, individual in enumerate(individual_qs):
-            deduplication_result = self._deduplicate_single_individual(cast("Individual", individual))
+        for index, (individual, deduplication_result) in enumerate(
+            self._iter_population_deduplication_results(individual_qs)
+        ):
             if index % 100 == 0:
                 log.info(f"RDI:{rdi_id} Deduplicated {index} individuals against population")
             individual.deduplication_golden_record_results = deduplication_result.results_data
@@ -175,9 +192,9 @@ class DeduplicateTask:
             "program_id",
         ]
         individual_qs = individuals.only(*individual_fields).prefetch_related("identities")
-        for individual in evaluate_qs(individual_qs.select_for_update().order_by("pk")):
-            deduplication_result = self._deduplicate_single_individual(cast("Individual", individual))
-
+        for individual, deduplication_result in self._iter_population_deduplication_results(
+            evaluate_qs(individual_qs.select_for_update().order_by("pk"))
+        ):
             individual.deduplication_golden_record_results = deduplication_result.results_data
             if deduplication_result.duplicates:
                 all_duplicates.append(individual.id)
@@ -294,8 +311,10 @@ class DeduplicateTask:
             new_object=registration_data_import,
         )
 
-    def deduplicate_pending_individuals(self, registration_data_import: RegistrationDataImport) -> None:
-        pending_individuals = (
+    def _get_pending_individuals_queryset(
+        self, registration_data_import: RegistrationDataImport
+    ) -> QuerySet[PendingIndividual]:
+        return (
             PendingIndividual.objects.filter(registration_data_import=registration_data_import)
             .select_related(
                 "business_area",
@@ -311,51 +330,197 @@ class DeduplicateTask:
             )
         )
 
+    def _get_allowed_duplicates_count(self, individuals_count: int, threshold_percentage: float) -> int:
+        return round((individuals_count or 1) * (threshold_percentage / 100))
+
+    def deduplicate_pending_individuals(self, registration_data_import: RegistrationDataImport) -> None:
+        pending_individuals = self._get_pending_individuals_queryset(registration_data_import)
+
         populate_index(pending_individuals, self.individual_doc_class)
         ensure_index_ready(self.individual_doc_class._index._name)
 
         individuals_count = pending_individuals.count()
-        allowed_duplicates_in_batch = round(
-            (individuals_count or 1) * (self.thresholds.DEDUPLICATION_BATCH_DUPLICATES_PERCENTAGE / 100)
+        if self._should_shard_deduplication(individuals_count):
+            self._queue_deduplication_shards(registration_data_import, pending_individuals)
+            return
+
+        state = self._run_pending_deduplication(pending_individuals, registration_data_import, individuals_count)
+        self._save_pending_deduplication_results(state, pending_individuals, registration_data_import)
+        if registration_data_import.status != RegistrationDataImport.DEDUPLICATION_FAILED:
+            self._finalize_successful_deduplication(
+                registration_data_import,
+                state.duplicates_in_batch,
+                state.possible_duplicates_in_batch,
+                state.duplicates_in_population,
+                state.possible_duplicates_in_population,
+            )
+
+        remove_elasticsearch_documents_by_matching_ids(
+            list(pending_individuals.values_list("id", flat=True)), self.individual_doc_class
         )
-        allowed_duplicates_in_population = round(
-            (individuals_count or 1) * (self.thresholds.DEDUPLICATION_GOLDEN_RECORD_DUPLICATES_PERCENTAGE / 100)
+
+    def deduplicate_pending_individuals_shard(
+        self,
+        registration_data_import: RegistrationDataImport,
+        first_individual_id: str,
+        last_individual_id: str,
+    ) -> None:
+        """Deduplicate a single ID-range shard of the RDI pending individuals.
+
+        Only the per-individual duplicates limits are checked here, the duplicates percentage thresholds
+        need the results of all shards and are checked in `finalize_sharded_deduplication`.
+        """
+        pending_individuals = self._get_pending_individuals_queryset(registration_data_import).filter(
+            id__gte=first_individual_id, id__lte=last_individual_id
         )
+        if registration_data_import.status == RegistrationDataImport.DEDUPLICATION_FAILED:
+            # other shard already exceeded the limits, there is no need to deduplicate this one
+            state = PendingDeduplicationState()
+        else:
+            ensure_index_ready(self.individual_doc_class._index._name)
+            state = self._run_pending_deduplication(
+                pending_individuals,
+                registration_data_import,
+                pending_individuals.count(),
+                check_duplicates_percentage=False,
+            )
+        self._save_pending_deduplication_results(state, pending_individuals, registration_data_import)
+
+    def finalize_sharded_deduplication(self, registration_data_import: RegistrationDataImport) -> None:
+        """Merge the results stored by all deduplication shards and check the RDI-wide thresholds."""
+        pending_individuals = PendingIndividual.objects.filter(registration_data_import=registration_data_import)
+        if registration_data_import.status != RegistrationDataImport.DEDUPLICATION_FAILED:
+            duplicates_in_batch = set()
+            possible_duplicates_in_batch = set()
+            for batch_results in pending_individuals.values_list("deduplication_batch_results", flat=True).iterator(
+                chunk_size=2000
+            ):
+                duplicates_in_batch.update(hit["hit_id"] for hit in batch_results.get("duplicates", []))
+                possible_duplicates_in_batch.update(
+                    hit["hit_id"] for hit in batch_results.get("possible_duplicates", [])
+                )
+            duplicates_in_population = set(
+                pending_individuals.filter(deduplication_golden_record_status=DUPLICATE).values_list("id", flat=True)
+            )
+            possible_duplicates_in_population = set(
+                pending_individuals.filter(deduplication_golden_record_status=NEEDS_ADJUDICATION).values_list(
+                    "id", flat=True
+                )
+            )
 
-        to_bulk_update_results = []
-        duplicates_in_batch = set()
-        possible_duplicates_in_batch = set()
-        duplicates_in_population = set()
-        possible_duplicates_in_population = set()
-        checked_individuals_ids = set()
+            individuals_count = pending_individuals.count()
+            error_msg = self._check_duplicates_percentage(
+                len(duplicates_in_batch),
+                self._get_allowed_duplicates_count(
+                    individuals_count, self.thresholds.DEDUPLICATION_BATCH_DUPLICATES_PERCENTAGE
+                ),
+                individuals_count,
+                self.thresholds.DEDUPLICATION_BATCH_DUPLICATES_PERCENTAGE,
+                "batch",
+            ) or self._check_duplicates_percentage(
+                len(duplicates_in_population),
+                self._get_allowed_duplicates_count(
+                    individuals_count, self.thresholds.DEDUPLICATION_GOLDEN_RECORD_DUPLICATES_PERCENTAGE
+                ),
+                individuals_count,
+                self.thresholds.DEDUPLICATION_GOLDEN_RECORD_DUPLICATES_PERCENTAGE,
+                "population",
+            )
+            if error_msg:
+                self._set_error_message_and_status(registration_data_import, error_msg)
+            else:
+                self._finalize_successful_deduplication(
+                    registration_data_import,
+                    duplicates_in_batch,
+                    possible_duplicates_in_batch,
+                    duplicates_in_population,
+                    possible_duplicates_in_population,
+                )
+
+        remove_elasticsearch_documents_by_matching_ids(
+            list(pending_individuals.values_list("id", flat=True)), self.individual_doc_class
+        )
+
+    def _should_shard_deduplication(self, individuals_count: int) -> bool:
+        return (
+            bool(self.business_area.get_sys_option("sharded_deduplication"))
+            and individuals_count > config.DEDUPLICATION_SHARD_SIZE > 0
+        )
+
+    def _queue_deduplication_shards(
+        self,
+        registration_data_import: RegistrationDataImport,
+        pending_individuals: QuerySet[PendingIndividual],
+    ) -> None:
+        from hope.apps.registration_data.celery_tasks import rdi_deduplication_shard_async_task
+
+        individuals_ids = pending_individuals.order_by("id").values_list("id", flat=True)
+        shards = [
+            (str(shard_ids[0]), str(shard_ids[-1]))
+            for shard_ids in batched(individuals_ids, config.DEDUPLICATION_SHARD_SIZE, strict=False)
+        ]
+        registration_data_import.status = RegistrationDataImport.DEDUPLICATION
+        registration_data_import.save(update_fields=["status"])
+
+        sharding_run_id = str(uuid.uuid4())
+        log.info(f"RDI:{registration_data_import.id} Deduplicating in {len(shards)} shards")
+        for first_individual_id, last_individual_id in shards:
+            rdi_deduplication_shard_async_task(
+                registration_data_import,
+                sharding_run_id=sharding_run_id,
+                shards_count=len(shards),
+                first_individual_id=first_individual_id,
+                last_individual_id=last_individual_id,
+            )
+
+    def _run_pending_deduplication(
+        self,
+        pending_individuals: QuerySet[PendingIndividual],
+        registration_data_import: RegistrationDataImport,
+        individuals_count: int,
+        check_duplicates_percentage: bool = True,
+    ) -> PendingDeduplicationState:
+        allowed_duplicates_in_batch = self._get_allowed_duplicates_count(
+            individuals_count, self.thresholds.DEDUPLICATION_BATCH_DUPLICATES_PERCENTAGE
+        )
+        allowed_duplicates_in_population = self._get_allowed_duplicates_count(
+            individuals_count, self.thresholds.DEDUPLICATION_GOLDEN_RECORD_DUPLICATES_PERCENTAGE
+        )
+
+        state = PendingDeduplicationState()
         individual_ids_to_exclude = self.collided_individuals_ids_to_exclude(
             pending_individuals, registration_data_import
         )
-        for pending_individual in pending_individuals:
-            checked_individuals_ids.add(pending_individual.id)
-            to_bulk_update_results.append(pending_individual)
+        for pending_individual, batch_results, population_results in self._iter_pending_deduplication_windows(
+            pending_individuals, registration_data_import.id, individual_ids_to_exclude
+        ):
+            state.checked_individuals_ids.add(pending_individual.id)
+            state.to_bulk_update_results.append(pending_individual)
 
             # Check against the batch
-            pending_deduplication_result = self._deduplicate_single_pending_individual(
-                pending_individual, registration_data_import.id
-            )
+            pending_deduplication_result = batch_results.get(
+                pending_individual.id
+            ) or self._deduplicate_single_pending_individual(pending_individual, registration_data_import.id)
             pending_individual.deduplication_batch_results = pending_deduplication_result.results_data
             post_process_dedupe_results(pending_individual)
 
             self._set_deduplication_batch_status(pending_deduplication_result, pending_individual)
-            duplicates_in_batch.update(pending_deduplication_result.duplicates)
-            possible_duplicates_in_batch.update(pending_deduplication_result.possible_duplicates)
+            state.duplicates_in_batch.update(pending_deduplication_result.duplicates)
+            state.possible_duplicates_in_batch.update(pending_deduplication_result.possible_duplicates)
 
             error_msg = self._check_max_duplicates(
                 len(pending_deduplication_result.results_data["duplicates"]),
                 self.thresholds.DEDUPLICATION_BATCH_DUPLICATES_ALLOWED,
                 "batch",
-            ) or self._check_duplicates_percentage(
-                len(duplicates_in_batch),
-                allowed_duplicates_in_batch,
-                individuals_count,
-                self.thresholds.DEDUPLICATION_BATCH_DUPLICATES_PERCENTAGE,
-                "batch",
+            ) or (
+                check_duplicates_percentage
+                and self._check_duplicates_percentage(
+                    len(state.duplicates_in_batch),
+                    allowed_duplicates_in_batch,
+                    individuals_count,
+                    self.thresholds.DEDUPLICATION_BATCH_DUPLICATES_PERCENTAGE,
+                    "batch",
+                )
             )
             if error_msg:
                 self._set_error_message_and_status(registration_data_import, error_msg)
@@ -365,7 +530,9 @@ class DeduplicateTask:
             if str(pending_individual.id) in individual_ids_to_exclude:
                 continue
             # Check against the population
-            deduplication_result = self._deduplicate_single_individual(pending_individual)
+            deduplication_result = population_results.get(pending_individual.id) or self._deduplicate_single_individual(
+                pending_individual
+            )
             pending_individual.deduplication_golden_record_results = deduplication_result.results_data
             if deduplication_result.results_data["duplicates"]:
                 pending_individual.deduplication_golden_record_status = DUPLICATE
@@ -373,26 +540,38 @@ class DeduplicateTask:
                 pending_individual.deduplication_golden_record_status = NEEDS_ADJUDICATION
             else:
                 pending_individual.deduplication_golden_record_status = UNIQUE
-            duplicates_in_population.update(deduplication_result.original_individuals_ids_duplicates)
-            possible_duplicates_in_population.update(deduplication_result.original_individuals_ids_possible_duplicates)
+            state.duplicates_in_population.update(deduplication_result.original_individuals_ids_duplicates)
+            state.possible_duplicates_in_population.update(
+                deduplication_result.original_individuals_ids_possible_duplicates
+            )
 
             error_msg = self._check_max_duplicates(
                 len(deduplication_result.results_data["duplicates"]),
                 self.thresholds.DEDUPLICATION_GOLDEN_RECORD_DUPLICATES_ALLOWED,
                 "population",
-            ) or self._check_duplicates_percentage(
-                len(duplicates_in_population),
-                allowed_duplicates_in_population,
-                individuals_count,
-                self.thresholds.DEDUPLICATION_GOLDEN_RECORD_DUPLICATES_PERCENTAGE,
-                "population",
+            ) or (
+                check_duplicates_percentage
+                and self._check_duplicates_percentage(
+                    len(state.duplicates_in_population),
+                    allowed_duplicates_in_population,
+                    individuals_count,
+                    self.thresholds.DEDUPLICATION_GOLDEN_RECORD_DUPLICATES_PERCENTAGE,
+                    "population",
+                )
             )
             if error_msg:
                 self._set_error_message_and_status(registration_data_import, error_msg)
                 break
+        return state
 
+    def _save_pending_deduplication_results(
+        self,
+        state: PendingDeduplicationState,
+        pending_individuals: QuerySet[PendingIndividual],
+        registration_data_import: RegistrationDataImport,
+    ) -> None:
         PendingIndividual.objects.bulk_update(
-            to_bulk_update_results,
+            state.to_bulk_update_results,
             [
                 "deduplication_batch_results",
                 "deduplication_golden_record_results",
@@ -402,26 +581,92 @@ class DeduplicateTask:
             batch_size=1000,
         )
         if registration_data_import.status == RegistrationDataImport.DEDUPLICATION_FAILED:
-            PendingIndividual.objects.filter(
-                registration_data_import_id=registration_data_import.id,
+            pending_individuals.filter(
                 deduplication_batch_status=UNIQUE_IN_BATCH,
                 deduplication_golden_record_status=UNIQUE,
-            ).exclude(id__in=checked_individuals_ids).update(
+            ).exclude(id__in=state.checked_individuals_ids).update(
                 deduplication_batch_status=NOT_PROCESSED,
                 deduplication_golden_record_status=NOT_PROCESSED,
             )
-        else:
-            self._finalize_successful_deduplication(
-                registration_data_import,
-                duplicates_in_batch,
-                possible_duplicates_in_batch,
-                duplicates_in_population,
-                possible_duplicates_in_population,
+
+    def _iter_population_deduplication_results(
+        self, individuals: Iterable[Individual]
+    ) -> Iterator[tuple[Individual, DeduplicationResult]]:
+        if not self.use_batched_search:
+            for individual in individuals:
+                yield individual, self._deduplicate_single_individual(cast("Individual", individual))
+            return
+        for window in batched(individuals, self.search_window_size, strict=False):
+            window_results = self._multi_search_deduplicate_results(
+                [(individual, self._build_individual_query_dict(individual)) for individual in window]
             )
+            for individual in window:
+                yield individual, window_results[individual.id]
 
-        remove_elasticsearch_documents_by_matching_ids(
-            list(pending_individuals.values_list("id", flat=True)), self.individual_doc_class
+    def _iter_pending_deduplication_windows(
+        self,
+        pending_individuals: Iterable[PendingIndividual],
+        rdi_id: str,
+        individual_ids_to_exclude: list[str],
+    ) -> Iterator[tuple[PendingIndividual, dict[Any, DeduplicationResult], dict[Any, DeduplicationResult]]]:
+        """Yield pending individuals together with the batch and population results of their window.
+
+        The results are searched upfront for the whole window, so the per-individual threshold checks
+        still abort at exactly the same individual as the sequential mode. When batched search is
+        disabled the result dicts are empty and the caller queries ES per individual.
+        """
+        if not self.use_batched_search:
+            for pending_individual in pending_individuals:
+                yield pending_individual, {}, {}
+            return
+        excluded_ids = set(individual_ids_to_exclude)
+        for window in batched(pending_individuals, self.search_window_size, strict=False):
+            batch_results = self._multi_search_deduplicate_results(
+                [
+                    (pending_individual, self._build_pending_individual_query_dict(pending_individual, rdi_id))
+                    for pending_individual in window
+                ]
+            )
+            population_results = self._multi_search_deduplicate_results(
+                [
+                    (pending_individual, self._build_individual_query_dict(pending_individual))
+                    for pending_individual in window
+                    if str(pending_individual.id) not in excluded_ids
+                ]
+            )
+            for pending_individual in window:
+                yield pending_individual, batch_results, population_results
+
+    def _multi_search_deduplicate_results(
+        self, individuals_queries: list[tuple[Individual | PendingIndividual, dict]]
+    ) -> dict[Any, DeduplicationResult]:
+        if not individuals_queries:
+            return {}
+        multi_search = MultiSearch(index=self.individual_doc_class._index._name).params(
+            search_type="dfs_query_then_fetch"
         )
+        for _, query_dict in individuals_queries:
+            multi_search = multi_search.add(self.individual_doc_class.search().update_from_dict(query_dict))
+        responses = multi_search.execute()
+        withdrawn_hit_ids = self._get_withdrawn_hit_ids([hit.id for response in responses for hit in response])
+        return {
+            individual.id: self._build_deduplicate_result(
+                results,
+                withdrawn_hit_ids,
+                self.thresholds.DEDUPLICATION_DUPLICATE_SCORE,
+                self.individual_doc_class,
+                individual,
+            )
+            for (individual, _), results in zip(individuals_queries, responses, strict=True)
+        }
+
+    def _get_withdrawn_hit_ids(self, hit_ids: list[str]) -> set[str]:
+        if not self.business_area.deduplication_ignore_withdraw or not hit_ids:
+            return set()
+        return {
+            str(individual_id)
+            for individual_id in Individual.objects.filter(withdrawn=True, id__in=hit_ids).values_list("id", flat=True)
+        }
 
     def _set_deduplication_batch_status(
         self, pending_deduplication_result: DeduplicationResult, pending_individual: PendingIndividual
@@ -603,25 +848,32 @@ class DeduplicateTask:
         duplicate_score: float,
         document: type[IndividualDocument],
         individual: Individual | PendingIndividual,
+    ) -> DeduplicationResult:
+        query = document.search().params(search_type="dfs_query_then_fetch").update_from_dict(query_dict)
+        results = query.execute()
+        withdrawn_hit_ids = self._get_withdrawn_hit_ids([result.id for result in results])
+        return self._build_deduplicate_result(results, withdrawn_hit_ids, duplicate_score, document, individual)
+
+    def _build_deduplicate_result(
+        self,
+        results: Iterable[Any],
+        withdrawn_hit_ids: set[str],
+        duplicate_score: float,
+        document: type[IndividualDocument],
+        individual: Individual | PendingIndividual,
     ) -> DeduplicationResult:
         duplicates = []
         possible_duplicates = []
         original_individuals_ids_duplicates = []
         original_individuals_ids_possible_duplicates = []
-        query = document.search().params(search_type="dfs_query_then_fetch").update_from_dict(query_dict)
-        results = query.execute()
         results_data = {
             "duplicates": [],
             "possible_duplicates": [],
         }
         should_ignore_withdraw = isinstance(individual, Individual) and self.business_area.deduplication_ignore_withdraw
 
-        individual_hit_ids = Individual.objects.filter(
-            withdrawn=True, id__in=[result.id for result in results]
-        ).values_list("id", flat=True)
-
         for individual_hit in results:
-            if should_ignore_withdraw and individual_hit.id in individual_hit_ids:
+            if should_ignore_withdraw and str(individual_hit.id) in withdrawn_hit_ids:
                 continue
             score = individual_hit.meta.score
             results_core_data = {
@@ -652,6 +904,14 @@ class DeduplicateTask:
         )
 
     def _deduplicate_single_pending_individual(self, individual: PendingIndividual, rdi_id: str) -> DeduplicationResult:
+        return self._get_deduplicate_result(
+            self._build_pending_individual_query_dict(individual, rdi_id),
+            self.thresholds.DEDUPLICATION_DUPLICATE_SCORE,
+            self.individual_doc_class,
+            individual,
+        )
+
+    def _build_pending_individual_query_dict(self, individual: PendingIndividual, rdi_id: str) -> dict[str, Any]:
         fields_names: tuple[str, ...] = (
             "given_name",
             "full_name",
@@ -682,14 +942,17 @@ class DeduplicateTask:
                 ]
             }
         }
+        return query_dict
+
+    def _deduplicate_single_individual(self, individual: Individual | PendingIndividual) -> DeduplicationResult:
         return self._get_deduplicate_result(
-            query_dict,
+            self._build_individual_query_dict(individual),
             self.thresholds.DEDUPLICATION_DUPLICATE_SCORE,
             self.individual_doc_class,
             individual,
         )
 
-    def _deduplicate_single_individual(self, individual: Individual | PendingIndividual) -> DeduplicationResult:
+    def _build_individual_query_dict(self, individual: Individual | PendingIndividual) -> dict[str, Any]:
         fields_names = (
             "given_name",
             "full_name",
@@ -721,13 +984,7 @@ class DeduplicateTask:
                 ]
             }
         }
-
-        return self._get_deduplicate_result(
-            query_dict,
-            self.thresholds.DEDUPLICATION_DUPLICATE_SCORE,
-            self.individual_doc_class,
-            individual,
-        )
+        return query_dict
 
     def _set_error_message_and_status(self, registration_data_import: RegistrationDataImport, message: str) -> None:
         old_rdi = RegistrationDataImport.objects.get(id=registration_data_import.id)
@@ -817,7 +1074,6 @@ class HardDocumentDeduplication:
                 documents_to_dedup,  # type: ignore[arg-type]
                 new_document_signatures_duplicated_in_batch=new_document_signatures_duplicated_in_batch,
                 new_document_signatures_in_batch_per_individual_dict=new_document_signatures_in_batch_per_individual_dict,
-                new_documents=new_documents,
                 possible_duplicates_individuals_id_set=possible_duplicates_individuals_id_set,
                 ticket_data_dict=ticket_data_dict,
             )
@@ -841,18 +1097,22 @@ class HardDocumentDeduplication:
                 ticket_data_dict, possible_duplicates_through_dict, registration_data_import
             )
 
-    def _build_document_signatures(self, documents_to_dedup: list) -> tuple[list, list, dict, list]:
+    def _build_document_signatures(self, documents_to_dedup: list) -> tuple[list, list, dict, Counter]:
         documents_numbers = []
         new_document_signatures = []
-        new_document_signatures_in_batch_per_individual_dict = defaultdict(list)
+        new_document_signatures_in_batch_per_individual_dict: defaultdict[str, Counter] = defaultdict(Counter)
         for d in documents_to_dedup:
             new_document_signature = self._generate_signature(d)
             documents_numbers.append(d.document_number)
             new_document_signatures.append(new_document_signature)
-            new_document_signatures_in_batch_per_individual_dict[str(d.individual_id)].append(new_document_signature)
-        new_document_signatures_duplicated_in_batch = [
-            d for d in new_document_signatures if new_document_signatures.count(d) > 1
-        ]
+            new_document_signatures_in_batch_per_individual_dict[str(d.individual_id)][new_document_signature] += 1
+        new_document_signatures_duplicated_in_batch = Counter(
+            {
+                signature: count
+                for signature, count in Counter(new_document_signatures).items()
+                if count > 1  # keep only signatures duplicated in batch
+            }
+        )
         return (
             documents_numbers,
             new_document_signatures,
@@ -932,23 +1192,27 @@ class HardDocumentDeduplication:
         documents_to_dedup: Iterable[Document],
         **kwargs: Any,
     ) -> None:
-        new_document_signatures_duplicated_in_batch: list[Any] = kwargs.get(  # type: ignore[assignment]
+        new_document_signatures_duplicated_in_batch: Counter = kwargs.get(  # type: ignore[assignment]
             "new_document_signatures_duplicated_in_batch"
         )
-        new_document_signatures_in_batch_per_individual_dict: defaultdict[Any, list] = kwargs.get(  # type: ignore[assignment]
+        new_document_signatures_in_batch_per_individual_dict: defaultdict[Any, Counter] = kwargs.get(  # type: ignore[assignment]
             "new_document_signatures_in_batch_per_individual_dict"
         )
-        new_documents: QuerySet[Document, Document] = kwargs.get("new_documents")  # type: ignore[assignment]
         possible_duplicates_individuals_id_set: set[Any] = kwargs.get("possible_duplicates_individuals_id_set")  # type: ignore[assignment]
         ticket_data_dict: dict[Any, Any] = kwargs.get("ticket_data_dict")  # type: ignore[assignment]
+        # the same document number/type/individual_id triples in batch
+        documents_in_batch_counter = Counter(
+            (d.document_number, d.type_id, d.individual_id) for d in documents_to_dedup
+        )
         for new_document in documents_to_dedup:
             new_document_signature = self._generate_signature(new_document)
+            individual_document_signatures = new_document_signatures_in_batch_per_individual_dict[
+                str(new_document.individual_id)
+            ]
 
-            individual_document_duplicates_count = new_document_signatures_in_batch_per_individual_dict.get(
-                str(new_document.individual_id), []
-            ).count(new_document_signature)
-
-            is_duplicated_document_number_for_individual: bool = individual_document_duplicates_count > 1
+            is_duplicated_document_number_for_individual: bool = (
+                individual_document_signatures[new_document_signature] > 1
+            )
 
             if new_document_signature in all_matching_number_documents_signatures:
                 new_document.status = Document.STATUS_NEED_INVESTIGATION
@@ -963,29 +1227,21 @@ class HardDocumentDeduplication:
                 ticket_data_dict[new_document_signature] = ticket_data
                 possible_duplicates_individuals_id_set.add(str(new_document.individual_id))
 
-            elif new_document_signatures_duplicated_in_batch.count(new_document_signature) > 1:
+            elif new_document_signatures_duplicated_in_batch[new_document_signature] > 1:
                 if is_duplicated_document_number_for_individual:
                     # do not create ticket for the same Individual with the same doc number
-                    if new_document.type.valid_for_deduplication:
-                        new_document.status = Document.STATUS_INVALID
-                    elif (
-                        new_documents.filter(
-                            id__in=[d.id for d in documents_to_dedup],
-                            document_number=new_document.document_number,
-                            type=new_document.type,
-                            individual=new_document.individual,
-                        )
-                        .exclude(id=new_document.id)
-                        .exists()
+                    if new_document.type.valid_for_deduplication or (
+                        documents_in_batch_counter[
+                            (new_document.document_number, new_document.type_id, new_document.individual_id)
+                        ]
+                        > 1
                     ):
                         # same document number/type/individual_id exists in batch
                         new_document.status = Document.STATUS_INVALID
                     else:
                         new_document.status = Document.STATUS_VALID
-                    new_document_signatures_in_batch_per_individual_dict[str(new_document.individual_id)].remove(
-                        new_document_signature
-                    )
-                    new_document_signatures_duplicated_in_batch.remove(new_document_signature)
+                    individual_document_signatures[new_document_signature] -= 1
+                    new_document_signatures_duplicated_in_batch[new_document_signature] -= 1
                 elif new_document_signature not in already_processed_signatures:
                     # first occurrence of new document is considered valid, duplicated are added in next iterations
                     new_document.status = Document.STATUS_VALID
@@ -3,13 +3,12 @@ import logging
 from typing import Any
 
 from constance import config
-from django.core.cache import cache
 from django.db import transaction
 from django.db.models import Prefetch, QuerySet
 from django.utils import timezone
 
 from hope.apps.activity_log.utils import copy_model_object
-from hope.apps.core.utils import chunks
+from hope.apps.core.utils import chunks, clear_cache_for_key
 from hope.apps.grievance.models import GrievanceTicket
 from hope.apps.grievance.services.needs_adjudication_ticket_services import (
     create_needs_adjudication_tickets,
@@ -23,6 +22,7 @@ from hope.apps.household.documents import (
     get_household_doc,
     get_individual_doc,
 )
+from hope.apps.household.services.index_queue import flush_index_queue
 from hope.apps.registration_data.celery_tasks import deduplicate_documents_for_rdi
 from hope.apps.registration_data.services.biometric_deduplication import (
     BiometricDeduplicationService,
@@ -98,15 +98,9 @@ class RdiMergeTask:
         )
 
     def _clear_cache(self, business_area_slug: str) -> None:
-        with contextlib.suppress(ConnectionError, AttributeError):
-            for key in cache.keys("*"):
-                if key.startswith(
-                    (
-                        f"count_{business_area_slug}_HouseholdNodeConnection",
-                        f"count_{business_area_slug}_IndividualNodeConnection",
-                    )
-                ):
-                    cache.delete(key)
+        with contextlib.suppress(ConnectionError):
+            clear_cache_for_key(f"count_{business_area_slug}_HouseholdNodeConnection_")
+            clear_cache_for_key(f"count_{business_area_slug}_IndividualNodeConnection_")
 
     def _run_biometric_deduplication(self, obj_hct: RegistrationDataImport, individuals_to_merge_ids: list) -> None:
         if obj_hct.program is not None and obj_hct.program.biometric_deduplication_enabled:
@@ -244,7 +238,7 @@ class RdiMergeTask:
                         self._update_household_collections(households, obj_hct)
                         self._update_individual_collections(individuals, obj_hct)
 
-                    self._populate_index_households(obj_hct)
+                    self._populate_index_households(obj_hct, [*individual_ids, *household_ids])
                     logger.info(f"RDI:{registration_data_import_id} Populated index for {len(individuals)} individuals")
 
                     rdi_merged.send(sender=obj_hct.__class__, instance=obj_hct)
@@ -293,7 +287,7 @@ class RdiMergeTask:
             )
         )
 
-    def _populate_index_households(self, obj_hct: RegistrationDataImport) -> None:
+    def _populate_index_households(self, obj_hct: RegistrationDataImport, queued_ids: list) -> None:
         if not config.IS_ELASTICSEARCH_ENABLED:
             return
         get_household_doc(str(obj_hct.program.id))().update(
@@ -306,6 +300,16 @@ class RdiMergeTask:
                 )
             )
         )
+        # records saved one by one during the merge were only queued, the merged RDI must be searchable right away.
+        # Only this RDI's entries, once committed: the queue rows stay unlocked and an index error can't undo the merge
+        transaction.on_commit(lambda: self._flush_index_queue(obj_hct, queued_ids))
+
+    def _flush_index_queue(self, obj_hct: RegistrationDataImport, object_ids: list) -> None:
+        try:
+            flush_index_queue(str(obj_hct.program_id), object_ids=object_ids)
+        except Exception as e:  # noqa: BLE001
+            # the merge is committed, the entries stay queued for the periodic flush
+            logger.warning(f"RDI:{obj_hct.id} Failed to flush the index queue: {e}")
 
     def _create_kobo_submissions(self, households: QuerySet[Any, Any], obj_hct: RegistrationDataImport) -> list[Any]:
         kobo_submissions = []
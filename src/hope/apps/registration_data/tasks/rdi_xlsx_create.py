@@ -11,11 +11,10 @@ from django.core.files.storage import default_storage
 from django.db import transaction
 from django.utils import timezone
 from django_countries.fields import Country
-import openpyxl
 from openpyxl.cell import Cell
 from openpyxl.worksheet.worksheet import Worksheet
 
-from hope.apps.core.utils import SheetImageLoader, timezone_datetime
+from hope.apps.core.utils import SheetImageLoader, StreamingWorkbook, StreamingWorksheet, timezone_datetime
 from hope.apps.household.const import (
     HEAD,
     NON_BENEFICIARY,
@@ -737,7 +736,9 @@ class RdiXlsxCreateTask(RdiBaseCreateTask):
             return
         self._process_flex_field(header, cell_value, cell, obj_to_create, current_field)
 
-    def _create_objects(self, sheet: Worksheet, registration_data_import: RegistrationDataImport) -> None:
+    def _create_objects(
+        self, sheet: Worksheet | StreamingWorksheet, registration_data_import: RegistrationDataImport
+    ) -> None:
         self.complex_fields, self.complex_types = self._build_complex_fields_config()
         self.rdi = RegistrationDataImport.objects.get(id=registration_data_import.id)
         self.sheet_title = str(sheet.title.lower())
@@ -815,14 +816,12 @@ class RdiXlsxCreateTask(RdiBaseCreateTask):
 
             self.business_area = BusinessArea.objects.get(id=business_area_id)
 
-            wb = openpyxl.load_workbook(import_data.file, data_only=True)
-
-            # households objects have to be created first
-            worksheets = (wb["Households"], wb["Individuals"])
             logger.info("Starting import of %s", registration_data_import.id)
-            for sheet in worksheets:
-                self.image_loader = SheetImageLoader(sheet)
-                self._create_objects(sheet, registration_data_import)
+            with StreamingWorkbook(import_data.file) as wb:
+                # households objects have to be created first
+                for sheet in (wb["Households"], wb["Individuals"]):
+                    self.image_loader = SheetImageLoader(sheet)
+                    self._create_objects(sheet, registration_data_import)
 
             old_rdi_mis = RegistrationDataImport.objects.get(id=registration_data_import.id)
             if not self.business_area.postpone_deduplication:
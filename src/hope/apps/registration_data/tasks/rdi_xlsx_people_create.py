@@ -5,11 +5,10 @@ import logging
 from typing import TYPE_CHECKING, Any, Callable
 
 from django.db import transaction
-import openpyxl
 
 from hope.apps.core.field_attributes.core_fields_attributes import FieldFactory
 from hope.apps.core.field_attributes.fields_types import Scope
-from hope.apps.core.utils import SheetImageLoader, serialize_flex_attributes
+from hope.apps.core.utils import SheetImageLoader, StreamingWorkbook, StreamingWorksheet, serialize_flex_attributes
 from hope.apps.household.const import (
     NON_BENEFICIARY,
     ROLE_ALTERNATE,
@@ -280,7 +279,9 @@ class RdiXlsxPeopleCreateTask(RdiXlsxCreateTask):
             cell_value = cell_value.strip()
         return cell_value
 
-    def _create_objects(self, sheet: Worksheet, registration_data_import: RegistrationDataImport) -> None:
+    def _create_objects(
+        self, sheet: Worksheet | StreamingWorksheet, registration_data_import: RegistrationDataImport
+    ) -> None:
         complex_fields: dict[str, dict[str, Callable]] = {
             "individuals": {
                 "pp_photo_i_c": self._handle_image_field,
@@ -392,13 +393,11 @@ class RdiXlsxPeopleCreateTask(RdiXlsxCreateTask):
 
         self.business_area = BusinessArea.objects.get(id=business_area_id)
 
-        wb = openpyxl.load_workbook(import_data.file, data_only=True)
-
-        # households objects have to be created first
-        worksheet = wb["People"]
         logger.info("Starting import of %s", registration_data_import.id)
-        self.image_loader = SheetImageLoader(worksheet)
-        self._create_objects(worksheet, registration_data_import)
+        with StreamingWorkbook(import_data.file) as wb:
+            worksheet = wb["People"]
+            self.image_loader = SheetImageLoader(worksheet)
+            self._create_objects(worksheet, registration_data_import)
 
         old_rdi_mis = RegistrationDataImport.objects.get(id=registration_data_import.id)
         if not self.business_area.postpone_deduplication:
@@ -2,21 +2,16 @@ import json
 import operator
 
 from django.db import transaction
-import openpyxl
-from openpyxl.worksheet.worksheet import Worksheet
 
+from hope.apps.core.utils import StreamingWorkbook, StreamingWorksheet
 from hope.apps.registration_data.validators import UploadXLSXInstanceValidator
 from hope.models import ImportData, Program
 
 
 class ValidateXlsxImport:
     @staticmethod
-    def _count_non_empty_rows(sheet: Worksheet) -> int:
-        count = 0
-        for row in sheet.iter_rows(min_row=3):
-            if any(cell.value for cell in row):
-                count += 1
-        return count
+    def _count_non_empty_rows(sheet: StreamingWorksheet) -> int:
+        return sum(1 for values in sheet.iter_rows(min_row=3, values_only=True) if any(values))
 
     @transaction.atomic()
     def execute(self, import_data: ImportData, program: Program) -> dict:
@@ -32,21 +27,16 @@ class ValidateXlsxImport:
         else:
             import_data.status = ImportData.STATUS_FINISHED
 
-        wb = openpyxl.load_workbook(import_data.file)
-
         number_of_households = 0
         number_of_individuals = 0
-        hh_sheet = wb["Households"] if "Households" in wb.sheetnames else None
-        ind_sheet = wb["Individuals"] if "Individuals" in wb.sheetnames else None
-        people_sheet = wb["People"] if "People" in wb.sheetnames else None
-
-        if not program.is_social_worker_program:
-            if hh_sheet:
-                number_of_households = self._count_non_empty_rows(hh_sheet)
-            if ind_sheet:
-                number_of_individuals = self._count_non_empty_rows(ind_sheet)
-        elif people_sheet:
-            number_of_individuals = self._count_non_empty_rows(people_sheet)
+        with StreamingWorkbook(import_data.file, data_only=False) as wb:
+            if not program.is_social_worker_program:
+                if "Households" in wb.sheetnames:
+                    number_of_households = self._count_non_empty_rows(wb["Households"])
+                if "Individuals" in wb.sheetnames:
+                    number_of_individuals = self._count_non_empty_rows(wb["Individuals"])
+            elif "People" in wb.sheetnames:
+                number_of_individuals = self._count_non_empty_rows(wb["People"])
 
         import_data.number_of_households = number_of_households
         import_data.number_of_individuals = number_of_individuals
@@ -12,7 +12,6 @@ from zipfile import BadZipfile
 
 from dateutil import parser
 from django.core import validators as django_core_validators
-import openpyxl
 from openpyxl import Workbook, load_workbook
 from openpyxl.cell import Cell
 from openpyxl.worksheet.worksheet import Worksheet
@@ -28,6 +27,8 @@ from hope.apps.core.field_attributes.fields_types import _INDIVIDUAL, Scope
 from hope.apps.core.kobo.common import KOBO_FORM_INDIVIDUALS_COLUMN_NAME, get_field_name
 from hope.apps.core.utils import (
     SheetImageLoader,
+    StreamingWorkbook,
+    StreamingWorksheet,
     rename_dict_keys,
     serialize_flex_attributes,
 )
@@ -84,7 +85,7 @@ class XLSXValidator(BaseValidator):
             # Checking only extensions is not enough,
             # loading workbook to check if it is in fact true .xlsx file
             try:
-                load_workbook(xlsx_file, data_only=True)
+                load_workbook(xlsx_file, read_only=True).close()
             except BadZipfile:
                 return [
                     {
@@ -612,7 +613,7 @@ class UploadXLSXInstanceValidator(ImportDataInstanceValidator):
             return row[idx].value if idx is not None else None
         return None
 
-    def rows_validator(self, sheet: Worksheet, business_area_slug: str | None = None) -> None:
+    def rows_validator(self, sheet: Worksheet | StreamingWorksheet, business_area_slug: str | None = None) -> None:
         try:
             first_row = sheet[1]
             combined_fields = {
@@ -942,7 +943,7 @@ class UploadXLSXInstanceValidator(ImportDataInstanceValidator):
                     )
         return invalid_rows
 
-    def validate_file_with_template(self, wb: Workbook) -> None:
+    def validate_file_with_template(self, wb: Workbook | StreamingWorkbook) -> None:
         try:
             combined_fields = self.combined_fields
 
@@ -1014,7 +1015,7 @@ class UploadXLSXInstanceValidator(ImportDataInstanceValidator):
             if self.errors:
                 return self.errors
             try:
-                wb = openpyxl.load_workbook(xlsx_file, data_only=True)
+                wb = StreamingWorkbook(xlsx_file)
             except BadZipfile:
                 return [
                     {
@@ -1024,27 +1025,28 @@ class UploadXLSXInstanceValidator(ImportDataInstanceValidator):
                     }
                 ]
 
-            self.validate_file_with_template(wb)
-            if self.errors:  # pragma: no cover
-                # return error if WS do not exist in the import file
-                return self.errors
+            with wb:
+                self.validate_file_with_template(wb)
+                if self.errors:  # pragma: no cover
+                    # return error if WS do not exist in the import file
+                    return self.errors
 
-            self.validate_index_id(wb)
-            self.validate_collectors_size(wb)
+                self.validate_index_id(wb)
+                self.validate_collectors_size(wb)
 
-            if self.is_social_worker_program:
-                self.validate_people_collectors(wb)
-                people_sheet = wb["People"]
-                self.image_loader = SheetImageLoader(people_sheet)
-                self.rows_validator(people_sheet, business_area_slug)
-            else:
-                self.validate_collectors(wb)
-                individuals_sheet = wb["Individuals"]
-                household_sheet = wb["Households"]
-                self.image_loader = SheetImageLoader(household_sheet)
-                self.rows_validator(household_sheet, business_area_slug)
-                self.image_loader = SheetImageLoader(individuals_sheet)
-                self.rows_validator(individuals_sheet)
+                if self.is_social_worker_program:
+                    self.validate_people_collectors(wb)
+                    people_sheet = wb["People"]
+                    self.image_loader = SheetImageLoader(people_sheet)
+                    self.rows_validator(people_sheet, business_area_slug)
+                else:
+                    self.validate_collectors(wb)
+                    individuals_sheet = wb["Individuals"]
+                    household_sheet = wb["Households"]
+                    self.image_loader = SheetImageLoader(household_sheet)
+                    self.rows_validator(household_sheet, business_area_slug)
+                    self.image_loader = SheetImageLoader(individuals_sheet)
+                    self.rows_validator(individuals_sheet)
 
             return self.errors
         except Exception as e:  # pragma: no cover
@@ -1101,7 +1103,7 @@ class UploadXLSXInstanceValidator(ImportDataInstanceValidator):
             logger.warning(e)
             raise
 
-    def validate_collectors(self, wb: Workbook) -> None:
+    def validate_collectors(self, wb: Workbook | StreamingWorkbook) -> None:
         try:
             individuals_sheet = wb["Individuals"]
             households_sheet = wb["Households"]
@@ -1168,7 +1170,7 @@ class UploadXLSXInstanceValidator(ImportDataInstanceValidator):
             logger.warning(e)
             raise
 
-    def validate_index_id(self, wb: Workbook) -> None:
+    def validate_index_id(self, wb: Workbook | StreamingWorkbook) -> None:
         try:
             if self.is_social_worker_program:
                 people_sheet = wb["People"]
@@ -1202,7 +1204,7 @@ class UploadXLSXInstanceValidator(ImportDataInstanceValidator):
             logger.warning(e)
             raise
 
-    def validate_people_collectors(self, wb: Workbook) -> None:
+    def validate_people_collectors(self, wb: Workbook | StreamingWorkbook) -> None:
         try:
             index_ids, primary_collector_ids, alternate_collector_ids, relationship_column = [], [], [], []
             people_sheet = wb["People"]
@@ -1299,7 +1301,7 @@ class UploadXLSXInstanceValidator(ImportDataInstanceValidator):
             logger.warning(e)
             raise
 
-    def validate_collectors_size(self, wb: Workbook) -> None:
+    def validate_collectors_size(self, wb: Workbook | StreamingWorkbook) -> None:
         try:
             if not self.is_social_worker_program:
                 individuals_sheet = wb["Individuals"]
@@ -1385,7 +1387,7 @@ class UploadXLSXInstanceValidator(ImportDataInstanceValidator):
                 )
         return errors
 
-    def _count_individuals(self, individuals_sheet: Worksheet) -> int:
+    def _count_individuals(self, individuals_sheet: Worksheet | StreamingWorksheet) -> int:
         first_row = individuals_sheet[1]
         individuals_count = 0
         for cell in first_row:
@@ -1395,7 +1397,7 @@ class UploadXLSXInstanceValidator(ImportDataInstanceValidator):
                         individuals_count += 1
         return individuals_count
 
-    def _count_households(self, households_sheet: Worksheet) -> int:
+    def _count_households(self, households_sheet: Worksheet | StreamingWorksheet) -> int:
         first_row = households_sheet[1]
         for cell in first_row:
             if cell.value == "household_id":
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("sanction_list", "0007_migration"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sanctionlistindividual",
+            name="content_hash",
+            field=models.CharField(blank=True, default="", editable=False, max_length=64),
+        ),
+    ]
@@ -1,18 +1,19 @@
 import contextlib
 from datetime import date, datetime
+import hashlib
+from itertools import batched
 import logging
 import os
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Iterable
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
 from urllib.parse import urlparse
 from urllib.request import urlopen
+from uuid import UUID
 from xml.etree.ElementTree import Element
 
 import dateutil.parser
 from defusedxml import ElementTree
-from django.core.exceptions import ObjectDoesNotExist
-from django.db.models import QuerySet
-from django.forms import model_to_dict
+from django.db import transaction
 from django.utils import timezone
 from django.utils.functional import cached_property
 from elasticsearch.exceptions import NotFoundError
@@ -45,9 +46,23 @@ class LoadSanctionListXMLTask:
 
     INDIVIDUAL_TAG_PATH = "INDIVIDUALS/INDIVIDUAL"
 
+    BATCH_SIZE = 500
+
+    RELATED_FIELDS = ("documents", "nationalities", "countries", "alias_names", "birth_dates")
+
+    DOCUMENT_KEY_FIELDS = (
+        "individual_id",
+        "document_number",
+        "type_of_document",
+        "date_of_issue",
+        "issuing_country_id",
+        "note",
+    )
+
     def __init__(self, sanction_list: "SanctionList", **kwargs: Any) -> None:
         self.sanction_list = sanction_list
         self.url = kwargs.get("url", self.DEFAULT_URL)
+        self._countries: dict[str, Country] = {}
         self.VALUES_PATHS: dict[str, Any] = {
             "data_id": "DATAID",
             "version_num": "VERSIONNUM",
@@ -124,7 +139,7 @@ class LoadSanctionListXMLTask:
                         parsed_date = dateutil.parser.parse(value, default=default_datetime)
                         dates_of_birth.add(
                             SanctionListIndividualDateOfBirth(
-                                individual=self._get_individual_from_db_or_file(individual),
+                                individual=individual,
                                 date=parsed_date.date(),
                             )
                         )
@@ -139,7 +154,7 @@ class LoadSanctionListXMLTask:
                     try:
                         years = {
                             SanctionListIndividualDateOfBirth(
-                                individual=self._get_individual_from_db_or_file(individual),
+                                individual=individual,
                                 date=date(year=year, month=1, day=1),
                             )
                             for year in range(int(from_year or ""), int(to_year or "") + 1)
@@ -178,18 +193,16 @@ class LoadSanctionListXMLTask:
             is_valid_quality_tag = isinstance(quality_tag, Element) and quality_tag.text
             is_valid_name_tag = isinstance(alias_name_tag, Element) and alias_name_tag.text
             if is_valid_quality_tag and is_valid_name_tag:
-                individual_instance = self._get_individual_from_db_or_file(individual)
-                unique_key = f"{alias_name_tag.text}-{str(individual_instance.id)}"
+                unique_key = f"{alias_name_tag.text}-{str(individual.id)}"
                 if quality_tag.text.lower() in ("good", "a.k.a") and alias_name_tag.text:
                     aliases[unique_key] = SanctionListIndividualAliasName(
-                        individual=individual_instance,
+                        individual=individual,
                         name=alias_name_tag.text,
                     )
 
         return set(aliases.values())
 
-    @staticmethod
-    def _get_country_field(individual_tag: Element, path: str, *args: Any, **kwargs: Any) -> str | None | set:
+    def _get_country_field(self, individual_tag: Element, path: str, *args: Any, **kwargs: Any) -> str | None | set:
         tags = individual_tag.findall(path)
 
         countries = set()
@@ -198,8 +211,9 @@ class LoadSanctionListXMLTask:
                 alpha_2_code = Countries.get_country_value(tag.text)
                 if not alpha_2_code:
                     continue
-                if country := (Country.objects.get(iso_code2=alpha_2_code)):
-                    countries.add(country)
+                if alpha_2_code not in self._countries:
+                    self._countries[alpha_2_code] = Country.objects.get(iso_code2=alpha_2_code)
+                countries.add(self._countries[alpha_2_code])
 
         return countries or None
 
@@ -217,7 +231,7 @@ class LoadSanctionListXMLTask:
         if result:
             return {
                 SanctionListIndividualCountries(
-                    individual=self._get_individual_from_db_or_file(individual),
+                    individual=individual,
                     country=country,
                 )
                 for country in result
@@ -245,7 +259,7 @@ class LoadSanctionListXMLTask:
         if result:
             return {
                 SanctionListIndividualNationalities(
-                    individual=self._get_individual_from_db_or_file(individual),
+                    individual=individual,
                     nationality=country,
                 )
                 for country in result
@@ -288,7 +302,7 @@ class LoadSanctionListXMLTask:
                 )
             if isinstance(document_number_tag, Element) and isinstance(type_of_document_tag, Element):
                 document = SanctionListIndividualDocument(
-                    individual=self._get_individual_from_db_or_file(individual),
+                    individual=individual,
                     type_of_document=type_of_document_tag.text,
                     document_number=document_number_tag.text,
                     issuing_country=issuing_country,
@@ -299,18 +313,15 @@ class LoadSanctionListXMLTask:
 
         return documents
 
-    def _get_individual_data(self, individual_tag: Element) -> dict:
-        from hope.models import SanctionListIndividual
-
+    def _get_individual_data(self, individual_tag: Element, individual: "SanctionListIndividual") -> dict:
         individual_data_dict = {
-            "individual": SanctionListIndividual(),
+            "individual": individual,
             "documents": None,
             "nationalities": None,
             "countries": None,
             "alias_names": None,
             "birth_dates": None,
         }
-        individual = individual_data_dict["individual"]
         individual.active = True
         for field_name, path_or_func in self.VALUES_PATHS.items():
             if callable(path_or_func):
@@ -342,68 +353,16 @@ class LoadSanctionListXMLTask:
         all_fields = SanctionListIndividual._meta.get_fields(include_parents=False)
         return [field.name for field in all_fields if field.name not in excluded_fields and field.concrete is True]
 
-    def _get_individual_from_db_or_file(
-        self,
-        individual: "SanctionListIndividual",
-    ) -> "SanctionListIndividual":
-        try:
-            return SanctionListIndividual.all_objects.filter(sanction_list=self.sanction_list).get(
-                reference_number=individual.reference_number
-            )
-        except ObjectDoesNotExist:
-            return individual
-
-    @cached_property
-    def _get_all_individuals_from_db(self) -> QuerySet:
-        return SanctionListIndividual.all_objects.filter(sanction_list=self.sanction_list).defer("documents")
-
-    def _get_existing_individuals(self, individuals_reference_numbers: set[str]) -> QuerySet:
-        return self._get_all_individuals_from_db.filter(reference_number__in=individuals_reference_numbers)
-
-    def _get_individuals_to_create(
-        self, individuals_from_file: "Iterable[SanctionListIndividual]"
-    ) -> "set[SanctionListIndividual]":
-        individuals_reference_numbers = self._get_reference_numbers_list(individuals_from_file)
-        return {
-            individual
-            for individual in individuals_from_file
-            if individual.reference_number
-            not in self._get_existing_individuals(individuals_reference_numbers).values_list(
-                "reference_number", flat=True
-            )
-        }
-
-    def _get_individuals_to_update(self, individuals_from_file: Iterable) -> "set[SanctionListIndividual]":
-        individuals_to_update = set()
-        individuals_reference_numbers = self._get_reference_numbers_list(individuals_from_file)
-        for individual in individuals_from_file:
-            new_individual_data_dict = model_to_dict(individual, fields=self._get_individual_fields)
-            old_individual = (
-                self._get_existing_individuals(individuals_reference_numbers)
-                .filter(reference_number=new_individual_data_dict["reference_number"])
-                .first()
-            )
-            if old_individual:
-                old_individual_data_dict = model_to_dict(old_individual, fields=self._get_individual_fields)
-                if new_individual_data_dict != old_individual_data_dict:
-                    obj = SanctionListIndividual.all_objects.get(reference_number=individual.reference_number)
-                    individual.id = obj.id
-                    individuals_to_update.add(individual)
-
-        return individuals_to_update
-
-    def _get_individuals_to_deactivate(self, individuals_from_file: "Iterable[SanctionListIndividual]") -> QuerySet:
-        individuals_reference_numbers = self._get_reference_numbers_list(individuals_from_file)
-        return self._get_all_individuals_from_db.difference(
-            self._get_existing_individuals(individuals_reference_numbers)
-        ).values_list("id", flat=True)
-        # need to return id's calling delete() on qs set all to inactive state
-
     @staticmethod
-    def _get_reference_numbers_list(
-        individuals_from_file: "Iterable[SanctionListIndividual]",
-    ) -> set[str]:
-        return {i.reference_number for i in individuals_from_file}
+    def _get_content_hash(individual_tag: Element) -> str:
+        """Fingerprint of the entry content, independent of the file formatting."""
+        digest = hashlib.sha256()
+        for tag in individual_tag.iter():
+            digest.update(f"{tag.tag}\x1f{(tag.text or '').strip()}\x1e".encode())
+        return digest.hexdigest()
+
+    def _get_document_key(self, document: "SanctionListIndividualDocument") -> tuple:
+        return tuple(getattr(document, field_name) for field_name in self.DOCUMENT_KEY_FIELDS)
 
     @staticmethod
     def _cast_field_value_to_correct_type(model: Any, field_name: str, value: Any) -> Any:
@@ -429,122 +388,149 @@ class LoadSanctionListXMLTask:
 
         return correct_value
 
+    def _iter_individual_tags(self, source: Any) -> Iterator[Element]:
+        """Stream the INDIVIDUAL tags of the file, every entry is dropped from the tree once it was handled."""
+        path = self.INDIVIDUAL_TAG_PATH.split("/")
+        parents: list[Element] = []
+        for event, tag in ElementTree.iterparse(source, events=("start", "end")):
+            if event == "start":
+                parents.append(tag)
+                continue
+            parents.pop()
+            if len(parents) != len(path):
+                continue
+            if [parent.tag for parent in parents[1:]] + [tag.tag] == path:
+                yield tag
+            parents[-1].remove(tag)
+
     def load_from_file(self, file_path: str | Path) -> None:
-        tree = ElementTree.parse(str(file_path))
-        root = tree.getroot()
-        self.parse(root)
+        self.parse(self._iter_individual_tags(str(file_path)))
 
     def load_from_url(self) -> None:  # pragma: no cover
         parsed_url = urlparse(self.url)
         if parsed_url.scheme not in ["http", "https"]:
             raise ValueError("The URL scheme is not permitted. Only 'http' and 'https' are allowed.")
-        url = urlopen(self.url)  # noqa: S310
-        tree = ElementTree.parse(url)
-        root = tree.getroot()
-        self.parse(root)
+        with urlopen(self.url) as response:  # noqa: S310
+            self.parse(self._iter_individual_tags(response))
 
     def execute(self) -> None:  # pragma: no cover
         raise DeprecationWarning()
 
-    def _sync_related_models(
-        self,
-        documents_from_file: set,
-        countries_from_file: set,
-        nationalities_from_file: set,
-        aliases_from_file: set,
-        dob_from_file: set,
-    ) -> None:
-        # SanctionListIndividualDocument
-        if documents_from_file:
-            for single_doc in documents_from_file:
-                SanctionListIndividualDocument.objects.get_or_create(
-                    individual=single_doc.individual,
-                    document_number=single_doc.document_number,
-                    type_of_document=single_doc.type_of_document,
-                    date_of_issue=single_doc.date_of_issue,
-                    issuing_country=single_doc.issuing_country,
-                    note=single_doc.note,
+    def _save_related_models(self, updated_individuals_ids: list[UUID], related_from_file: dict[str, list]) -> None:
+        existing_documents = set()
+        if updated_individuals_ids:
+            # documents and dates of birth are kept, the remaining relations are replaced by the file content
+            for model in (
+                SanctionListIndividualCountries,
+                SanctionListIndividualNationalities,
+                SanctionListIndividualAliasName,
+            ):
+                model.objects.filter(individual_id__in=updated_individuals_ids).delete()
+            existing_documents = set(
+                SanctionListIndividualDocument.objects.filter(individual_id__in=updated_individuals_ids).values_list(
+                    "individual_id",
+                    "document_number",
+                    "type_of_document",
+                    "date_of_issue",
+                    "issuing_country_id",
+                    "note",
                 )
+            )
 
-        # SanctionListIndividualCountries
-        SanctionListIndividualCountries.objects.filter(individual__sanction_list=self.sanction_list).delete()
-        if countries_from_file:
-            SanctionListIndividualCountries.objects.bulk_create(countries_from_file)
-
-        # SanctionListIndividualNationalities
-        SanctionListIndividualNationalities.objects.filter(individual__sanction_list=self.sanction_list).delete()
-        if nationalities_from_file:
-            SanctionListIndividualNationalities.objects.bulk_create(nationalities_from_file)
-
-        # SanctionListIndividualAliasName
-        SanctionListIndividualAliasName.objects.filter(individual__sanction_list=self.sanction_list).delete()
-        if aliases_from_file:
-            SanctionListIndividualAliasName.objects.bulk_create(aliases_from_file)
-
-        # SanctionListIndividualDateOfBirth
-        if dob_from_file:
-            for single_dob in dob_from_file:
-                SanctionListIndividualDateOfBirth.objects.get_or_create(
-                    individual=single_dob.individual,
-                    date=single_dob.date,
-                )
+        documents_to_create = []
+        for document in related_from_file["documents"]:
+            document_key = self._get_document_key(document)
+            if document_key not in existing_documents:
+                existing_documents.add(document_key)
+                documents_to_create.append(document)
+
+        SanctionListIndividualDocument.objects.bulk_create(documents_to_create)
+        SanctionListIndividualCountries.objects.bulk_create(related_from_file["countries"])
+        SanctionListIndividualNationalities.objects.bulk_create(related_from_file["nationalities"])
+        SanctionListIndividualAliasName.objects.bulk_create(related_from_file["alias_names"])
+        SanctionListIndividualDateOfBirth.objects.bulk_create(related_from_file["birth_dates"], ignore_conflicts=True)
+
+    def _load_batch(
+        self, individual_tags: Iterable[Element], reference_numbers: set[str]
+    ) -> tuple[list[UUID], list[UUID]]:
+        """Write the entries of the batch which changed since the last load, return the created and updated ids."""
+        entries = {}
+        for individual_tag in individual_tags:
+            raw_reference_number = self._get_text_from_path(individual_tag, self.VALUES_PATHS["reference_number"])
+            reference_number = self._cast_field_value_to_correct_type(
+                SanctionListIndividual, "reference_number", raw_reference_number
+            )
+            entries[reference_number] = (individual_tag, self._get_content_hash(individual_tag))
+        reference_numbers.update(entries)
+
+        existing_individuals = {
+            reference_number: (individual_id, content_hash, active)
+            for reference_number, individual_id, content_hash, active in SanctionListIndividual.all_objects.filter(
+                sanction_list=self.sanction_list, reference_number__in=entries
+            ).values_list("reference_number", "id", "content_hash", "active")
+        }
 
-    def parse(self, root: Element) -> None:
-        individuals_from_file = set()
-        documents_from_file = set()
-        nationalities_from_file = set()
-        countries_from_file = set()
-        aliases_from_file = set()
-        dob_from_file = set()
-
-        for individual_tag in root.findall(self.INDIVIDUAL_TAG_PATH):
-            individual_data_dict = self._get_individual_data(individual_tag)
-            individual = individual_data_dict["individual"]
-            individual.sanction_list = self.sanction_list
+        individuals_to_create = []
+        individuals_to_update = []
+        related_from_file: dict[str, list] = {field_name: [] for field_name in self.RELATED_FIELDS}
+        for reference_number, (individual_tag, content_hash) in entries.items():
+            individual_id, old_content_hash, active = existing_individuals.get(reference_number, (None, "", False))
+            if active and old_content_hash == content_hash:
+                continue
+            individual = SanctionListIndividual(sanction_list=self.sanction_list, content_hash=content_hash)
+            if individual_id:
+                individual.id = individual_id
+            individual_data_dict = self._get_individual_data(individual_tag, individual)
             individual.full_name = (
                 (f"{individual.first_name} {individual.second_name} {individual.third_name} {individual.fourth_name}")
                 .strip()
                 .title()
             )
-            individuals_from_file.add(individual)
-
-            documents_from_file.update(individual_data_dict["documents"])
-            nationalities_from_file.update(individual_data_dict["nationalities"])
-            countries_from_file.update(individual_data_dict["countries"])
-            aliases_from_file.update(individual_data_dict["alias_names"])
-            dob_from_file.update(individual_data_dict["birth_dates"])
-
-        individuals_to_create = self._get_individuals_to_create(individuals_from_file)
-        SanctionListIndividual.all_objects.bulk_create(individuals_to_create)
-
-        individuals_to_update = self._get_individuals_to_update(individuals_from_file)
-
-        if individuals_to_update:
-            SanctionListIndividual.all_objects.bulk_update(
-                self._get_individuals_to_update(individuals_from_file),
-                self._get_individual_fields,
-                1000,
-            )
-        individuals_ids_to_delete = self._get_individuals_to_deactivate(individuals_from_file)
-        SanctionListIndividual.objects.filter(
-            sanction_list=self.sanction_list, id__in=individuals_ids_to_delete
-        ).delete()
-
-        self._sync_related_models(
-            documents_from_file,
-            countries_from_file,
-            nationalities_from_file,
-            aliases_from_file,
-            dob_from_file,
+            (individuals_to_update if individual_id else individuals_to_create).append(individual)
+            for field_name in self.RELATED_FIELDS:
+                related_from_file[field_name].extend(individual_data_dict[field_name])
+
+        if not individuals_to_create and not individuals_to_update:
+            return [], []
+        with transaction.atomic():
+            SanctionListIndividual.all_objects.bulk_create(individuals_to_create)
+            if individuals_to_update:
+                SanctionListIndividual.all_objects.bulk_update(individuals_to_update, self._get_individual_fields)
+            self._save_related_models([individual.id for individual in individuals_to_update], related_from_file)
+        return [individual.id for individual in individuals_to_create], [
+            individual.id for individual in individuals_to_update
+        ]
+
+    def parse(self, individual_tags: Iterable[Element]) -> None:
+        reference_numbers: set[str] = set()
+        created_individuals_ids = []
+        updated_individuals_ids = []
+        for batch in batched(individual_tags, self.BATCH_SIZE, strict=False):
+            created_ids, updated_ids = self._load_batch(batch, reference_numbers)
+            created_individuals_ids.extend(created_ids)
+            updated_individuals_ids.extend(updated_ids)
+
+        deactivated_count, _ = (
+            SanctionListIndividual.objects.filter(sanction_list=self.sanction_list)
+            .exclude(reference_number__in=reference_numbers)
+            .delete()
         )
+        if not created_individuals_ids and not updated_individuals_ids and not deactivated_count:
+            return
 
+        # possible matches of updated or deactivated entries may be gone and have to be cleared, which needs the
+        # full re-screen. New entries can only add matches, screening just them is enough.
+        sanction_list_individuals = None if updated_individuals_ids or deactivated_count else created_individuals_ids
         try:
             cls_un = UNSanctionList
             programs = Program.objects.filter(
                 sanction_lists__strategy=f"{cls_un.__module__}.{cls_un.__qualname__}"
             )  # get programs which use sanction list which is using this strategy
             for program in programs:
-                check_against_sanction_list_pre_merge(program_id=program.id)
+                check_against_sanction_list_pre_merge(
+                    program_id=program.id,
+                    sanction_list_individuals=sanction_list_individuals,
+                )
         except NotFoundError:  # pragma: no cover
             pass
 
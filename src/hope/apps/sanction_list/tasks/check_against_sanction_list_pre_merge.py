@@ -1,10 +1,12 @@
+from itertools import batched
 import logging
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
 
 from constance import config
 from django.core.cache import cache
 from django.db import transaction
 from django.utils import timezone
+from elasticsearch.dsl import MultiSearch
 
 from hope.apps.core.utils import IDENTIFICATION_TYPE_TO_KEY_MAPPING
 from hope.apps.grievance.models import GrievanceTicket, TicketSystemFlaggingDetails
@@ -17,7 +19,11 @@ from hope.models import Individual, Program, RegistrationDataImport, SanctionLis
 log = logging.getLogger(__name__)
 
 
-def _get_query_dict(sanction_list_individual: SanctionListIndividual, individuals_ids: list[str] | None) -> dict:
+def _get_query_dict(
+    sanction_list_individual: SanctionListIndividual,
+    individuals_ids: list[str] | None,
+    program_id: str | None = None,
+) -> dict:
     documents = [
         doc
         for doc in sanction_list_individual.documents.all()
@@ -72,6 +78,8 @@ def _get_query_dict(sanction_list_individual: SanctionListIndividual, individual
     }
     if individuals_ids:
         query_dict["query"]["bool"]["filter"] = [{"terms": {"id": [str(ind_id) for ind_id in individuals_ids]}}]  # type: ignore
+    elif program_id:
+        query_dict["query"]["bool"]["filter"] = [{"term": {"program_id": str(program_id)}}]  # type: ignore
     return query_dict
 
 
@@ -79,7 +87,7 @@ def _generate_ticket(
     marked_individual: Individual,
     registration_data_import: RegistrationDataImport | None,
     sanction_list_individual: SanctionListIndividual,
-) -> tuple[GrievanceTicket, TicketSystemFlaggingDetails, Any] | None:
+) -> tuple[GrievanceTicket, TicketSystemFlaggingDetails, Any]:
     GrievanceTicketProgramThrough = GrievanceTicket.programs.through  # noqa
     household = marked_individual.household
     admin_level_2 = getattr(household, "admin2", None)
@@ -97,12 +105,6 @@ def _generate_ticket(
         golden_records_individual=marked_individual,
         sanction_list_individual=sanction_list_individual,
     )
-    details_already_exists = TicketSystemFlaggingDetails.objects.filter(
-        golden_records_individual=marked_individual,
-        sanction_list_individual=sanction_list_individual,
-    ).exists()
-    if details_already_exists is True:
-        return None
     return (
         ticket,
         ticket_details,
@@ -113,27 +115,54 @@ def _generate_ticket(
     )
 
 
-def _resolve_individual_hit(
-    individual_hit: Any,
+def _search_sanction_list_individuals(
+    document: Any,
+    sanction_list_individuals: list[SanctionListIndividual],
+    individuals_ids: list[str],
+    program: Program,
+) -> Iterator[tuple[SanctionListIndividual, Any]]:
+    """Yield every sanction list individual with its ES response, one `_msearch` request per batch."""
+    for batch in batched(sanction_list_individuals, max(config.SANCTION_LIST_MSEARCH_BATCH_SIZE, 1), strict=False):
+        multi_search = MultiSearch(index=document._index._name)
+        for sanction_list_individual in batch:
+            query_dict = _get_query_dict(sanction_list_individual, individuals_ids, program_id=str(program.id))
+            multi_search = multi_search.add(document.search().update_from_dict(query_dict))
+        yield from zip(batch, multi_search.execute(), strict=True)
+
+
+def _resolve_individual_hits(
+    individual_hits: Iterable[Any],
     individuals_ids: list[str],
     possible_match_score: float,
     program: Program,
-) -> Individual | None:
-    if individuals_ids and individual_hit.id not in individuals_ids:
-        return None
-    if individual_hit.meta.score < possible_match_score:
-        return None
-    marked_individual = Individual.all_objects.filter(id=individual_hit.id).first()
-    if not marked_individual:
-        log.debug(f"Skipping individual with ID {individual_hit.id} as it does not exist in the database.")
-        return None
-    if marked_individual.program_id != program.id:
-        log.debug(
-            f"Skipping individual {marked_individual.unicef_id} with ID {marked_individual.id} "
-            f"as it does not belong to program {program.id}."
-        )
-        return None
-    return marked_individual
+) -> dict[str, Individual]:
+    """Load the individuals of all hits scoring at least `possible_match_score` with a single query.
+
+    Without `individuals_ids` the whole program is screened and only its individuals are taken into account.
+    """
+    allowed_ids = set(individuals_ids)
+    hit_ids = {
+        individual_hit.id
+        for individual_hit in individual_hits
+        if individual_hit.meta.score >= possible_match_score and (not allowed_ids or individual_hit.id in allowed_ids)
+    }
+    if not hit_ids:
+        return {}
+    manager = Individual.all_objects if individuals_ids else Individual.objects
+    individuals = {
+        str(individual.id): individual
+        for individual in manager.filter(id__in=hit_ids).select_related("household__admin2", "business_area")
+    }
+    for hit_id in hit_ids - individuals.keys():
+        log.debug(f"Skipping individual with ID {hit_id} as it does not exist in the database.")
+    for individual in list(individuals.values()):
+        if individual.program_id != program.id:
+            log.debug(
+                f"Skipping individual {individual.unicef_id} with ID {individual.id} "
+                f"as it does not belong to program {program.id}."
+            )
+            del individuals[str(individual.id)]
+    return individuals
 
 
 def _save_tickets_and_notify(
@@ -166,49 +195,63 @@ def check_against_sanction_list_pre_merge(
     sanction_list_individuals_queryset = SanctionListIndividual.objects.filter(
         sanction_list__in=sanction_lists.all(),
         active=True,
-    )
-    if sanction_list_individuals is not None:  # pragma: no cover
+    ).prefetch_related("documents__issuing_country", "dates_of_birth", "alias_names")
+    if sanction_list_individuals is not None:
         sanction_list_individuals_queryset = sanction_list_individuals_queryset.filter(
             id__in=sanction_list_individuals,
         )
-    if not individuals_ids:
-        individuals_ids = Individual.objects.filter(program_id=program_id).values_list("id", flat=True)  # type: ignore
-    individuals_ids = [str(ind_id) for ind_id in individuals_ids]
+    # without individuals_ids the whole program is screened, filtered by program instead of an id list
+    individuals_ids = [str(ind_id) for ind_id in individuals_ids or []]
     possible_match_score = config.SANCTION_LIST_MATCH_SCORE
     document = get_individual_doc(str(program.id))
 
+    matches: list[tuple[SanctionListIndividual, list[Any]]] = []
+    for sanction_list_individual, results in _search_sanction_list_individuals(
+        document, list(sanction_list_individuals_queryset), individuals_ids, program
+    ):
+        matches.append((sanction_list_individual, list(results)))
+        log.debug(
+            f"SANCTION LIST INDIVIDUAL: {sanction_list_individual.full_name}"
+            f" - reference number: {sanction_list_individual.reference_number}"
+            f" Scores: ",
+        )
+        log.debug([(r.full_name, r.meta.score) for r in results])
+
+    marked_individuals = _resolve_individual_hits(
+        (individual_hit for _, results in matches for individual_hit in results),
+        individuals_ids,
+        possible_match_score,
+        program,
+    )
+    existing_details = set(
+        TicketSystemFlaggingDetails.objects.filter(
+            golden_records_individual_id__in=[individual.id for individual in marked_individuals.values()],
+            sanction_list_individual_id__in=[sanction_list_individual.id for sanction_list_individual, _ in matches],
+        ).values_list("golden_records_individual_id", "sanction_list_individual_id")
+    )
+
     tickets_to_create = []
     ticket_details_to_create = []
     tickets_programs = []
     possible_matches = set()
-    for sanction_list_individual in sanction_list_individuals_queryset:
-        query_dict = _get_query_dict(sanction_list_individual, individuals_ids=individuals_ids)
-        query = document.search().update_from_dict(query_dict)
-
-        results = query.execute()
+    for sanction_list_individual, results in matches:
         for individual_hit in results:
-            marked_individual = _resolve_individual_hit(individual_hit, individuals_ids, possible_match_score, program)
+            marked_individual = marked_individuals.get(individual_hit.id)
             if not marked_individual:  # pragma: no cover
                 continue
 
             possible_matches.add(marked_individual.id)
-            tickets_info = _generate_ticket(
+            if (marked_individual.id, sanction_list_individual.id) in existing_details:
+                continue
+            existing_details.add((marked_individual.id, sanction_list_individual.id))
+            ticket, ticket_details, tickets_program = _generate_ticket(
                 marked_individual,
                 registration_data_import,
                 sanction_list_individual,
             )
-            if tickets_info:
-                ticket, ticket_details, tickets_program = tickets_info
-                tickets_to_create.append(ticket)
-                ticket_details_to_create.append(ticket_details)
-                tickets_programs.append(tickets_program)
-
-            log.debug(
-                f"SANCTION LIST INDIVIDUAL: {sanction_list_individual.full_name}"
-                f" - reference number: {sanction_list_individual.reference_number}"
-                f" Scores: ",
-            )
-            log.debug([(r.full_name, r.meta.score) for r in results])
+            tickets_to_create.append(ticket)
+            ticket_details_to_create.append(ticket_details)
+            tickets_programs.append(tickets_program)
     cache.set("sanction_list_last_check", timezone.now(), None)
 
     possible_matches_individuals = evaluate_qs(
@@ -222,13 +265,14 @@ def check_against_sanction_list_pre_merge(
     )
     possible_matches_individuals.update(sanction_list_possible_match=True)
 
-    if not individuals_ids:
+    if not individuals_ids and sanction_list_individuals is None:
         # If we not pass individuals_ids, it means we want to check all individuals in the program.
         # So we know that individuals which are not found in the possible matches
         # need to be marked as not possible matches.
+        # A check of selected sanction list individuals says nothing about matches of the other ones.
         not_possible_matches_individuals = evaluate_qs(
-            Individual.objects.exclude(id__in=possible_matches)
-            .filter(sanction_list_possible_match=True)
+            Individual.objects.filter(program_id=program.id, sanction_list_possible_match=True)
+            .exclude(id__in=possible_matches)
             .select_for_update()
             .order_by("pk")
         )
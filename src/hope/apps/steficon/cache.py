@@ -0,0 +1,70 @@
+"""Task scoped cache of resolved rules.
+
+Executing a rule resolves its latest released/enabled RuleCommit, and every `invoke()` call fetches
+the invoked Rule. Inside `rule_cache()` both are resolved once and the RuleCommit instances, together
+with their compiled interpreters, are reused by all the following executions.
+
+Usage:
+    with rule_cache():
+        for payment in payments:
+            rule.execute({"household": payment.household})
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Iterator
+
+if TYPE_CHECKING:
+    from hope.models import Rule, RuleCommit
+
+
+class RuleCache:
+    def __init__(self) -> None:
+        self.rules: dict[str, "Rule"] = {}
+        self.commits: dict[tuple[str, int, bool, bool], "RuleCommit | None"] = {}
+
+    def get_rule(self, rule_id: Any) -> "Rule":
+        from hope.models import Rule
+
+        key = str(rule_id)
+        if key not in self.rules:
+            self.rules[key] = Rule.objects.get(id=rule_id)
+        return self.rules[key]
+
+    def get_latest_commit(self, rule: "Rule", only_release: bool, only_enabled: bool) -> "RuleCommit | None":
+        key = (str(rule.pk), rule.version, only_release, only_enabled)
+        if key not in self.commits:
+            self.commits[key] = rule.get_latest_commit(only_release=only_release, only_enabled=only_enabled)
+        return self.commits[key]
+
+    def invalidate(self, rule_id: Any) -> None:
+        key = str(rule_id)
+        self.rules.pop(key, None)
+        for commit_key in [k for k in self.commits if k[0] == key]:
+            del self.commits[commit_key]
+
+
+_active_rule_cache: ContextVar[RuleCache | None] = ContextVar("steficon_rule_cache", default=None)
+
+
+def get_rule_cache() -> RuleCache | None:
+    return _active_rule_cache.get()
+
+
+@contextmanager
+def rule_cache() -> Iterator[RuleCache]:
+    """Cache resolved rules for the enclosed block, nested blocks share the outermost cache."""
+    active = _active_rule_cache.get()
+    if active is not None:
+        yield active
+        return
+    token = _active_rule_cache.set(RuleCache())
+    try:
+        yield _active_rule_cache.get()  # type: ignore[misc]
+    finally:
+        _active_rule_cache.reset(token)
+
+
+def invalidate_rule_cache(rule_id: Any) -> None:
+    if active := _active_rule_cache.get():
+        active.invalidate(rule_id)
@@ -1,16 +1,19 @@
 from builtins import __build_class__  # noqa
 import datetime
 from decimal import Decimal
+from functools import lru_cache
 import importlib
 import logging
 import sys
 import traceback
-from typing import Any
+from types import CodeType
+from typing import Any, Iterable, Iterator
 from uuid import UUID
 
 from django.core.exceptions import ValidationError
 from django.utils.functional import cached_property
 
+from hope.apps.steficon.cache import get_rule_cache
 from hope.apps.steficon.config import config
 from hope.apps.steficon.exception import RuleError
 
@@ -36,54 +39,64 @@ class Interpreter:
 def call_rule(rule_id: UUID, context: dict) -> Any:
     from hope.models import Rule
 
-    rule: Rule = Rule.objects.get(id=rule_id)
+    cache = get_rule_cache()
+    rule: Rule = Rule.objects.get(id=rule_id) if cache is None else cache.get_rule(rule_id)
     return rule.execute(context)
 
 
+@lru_cache(maxsize=256)
+def compile_rule(init_string: str) -> CodeType:
+    """Compile rule source once per process, the same definition is shared by all its commits."""
+    return compile(init_string, "<code>", mode="exec")
+
+
 class PythonExec(Interpreter):
     label = "Python"
 
     @cached_property
-    def code(self) -> Any:
-        return compile(self.init_string, "<code>", mode="exec")
+    def code(self) -> CodeType:
+        return compile_rule(self.init_string)
 
-    def execute(self, context: dict) -> Any:
-        gl = {
-            "__builtins__": {
-                "__build_class__": __build_class__,
-                "__name__": __name__,
-                "__import__": __import__,
-                "date": datetime.date,
-                "bytearray": bytearray,
-                "bytes": bytes,
-                "Decimal": Decimal,
-                "invoke": call_rule,
-                "complex": complex,
-                "dict": dict,
-                "float": float,
-                "frozenset": frozenset,
-                "int": int,
-                "list": list,
-                "memoryview": memoryview,
-                "range": range,
-                "set": set,
-                "str": str,
-                "tuple": tuple,
-            }
+    @cached_property
+    def restricted_builtins(self) -> dict[str, Any]:
+        """Restricted builtins, prepared once and copied into fresh globals for every execution."""
+        builtins = {
+            "__build_class__": __build_class__,
+            "__name__": __name__,
+            "__import__": __import__,
+            "date": datetime.date,
+            "bytearray": bytearray,
+            "bytes": bytes,
+            "Decimal": Decimal,
+            "invoke": call_rule,
+            "complex": complex,
+            "dict": dict,
+            "float": float,
+            "frozenset": frozenset,
+            "int": int,
+            "list": list,
+            "memoryview": memoryview,
+            "range": range,
+            "set": set,
+            "str": str,
+            "tuple": tuple,
         }
         for module_name in config.BUILTIN_MODULES:
             try:
                 mod = importlib.import_module(module_name)
-                gl["__builtins__"][module_name] = mod
+                builtins[module_name] = mod
             except ImportError as e:
                 logger.exception(e)
+        return builtins
 
+    def execute(self, context: dict) -> Any:
         pts = self.get_result()
         locals_ = {}
         locals_["context"] = context
         locals_["result"] = pts
         try:
-            exec(self.init_string, gl, locals_)  # noqa
+            # globals are per execution, nothing a rule defines or changes leaks into the next one
+            exec(self.code, {"__builtins__": dict(self.restricted_builtins)}, locals_)  # noqa
         except SyntaxError as err:
             error_class = err.__class__.__name__
             detail = err.args[0]
@@ -111,6 +124,11 @@ class PythonExec(Interpreter):
         else:
             return pts
 
+    def execute_many(self, contexts: Iterable[dict]) -> Iterator[Any]:
+        """Execute the rule for each context, yielding the results in the same order."""
+        for context in contexts:
+            yield self.execute(context)
+
     def validate(self) -> bool:
         errors = [
             f"Code contains an invalid statement '{forbidden}'"
@@ -1,10 +1,19 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 import enum
+from functools import partial
+from itertools import batched
 import logging
-from typing import TYPE_CHECKING, Any
+import time
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
 
 from constance import config
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections as db_connections, transaction
 from elasticsearch import NotFoundError
 from elasticsearch.dsl import connections
+from elasticsearch.helpers import parallel_bulk, streaming_bulk
 
 logger = logging.getLogger(__name__)
 
@@ -16,11 +25,153 @@ if TYPE_CHECKING:
     from django_elasticsearch_dsl import Document
 
 
+def _with_indexed_relations(queryset: "QuerySet", document: "Document") -> "QuerySet":
+    """Load the relations serialized into the document together with every chunk of the queryset."""
+    if hasattr(document, "optimize_queryset") and queryset.model is document.django.model:
+        return document.optimize_queryset(queryset)
+    return queryset
+
+
 def populate_index(queryset: "QuerySet", doc: Any, parallel: bool = False, chunk_size: int = 2000) -> None:
     if not config.IS_ELASTICSEARCH_ENABLED:  # pragma: no cover
         return
-    qs = queryset.iterator(chunk_size=chunk_size)
-    doc().update(qs, parallel=parallel)
+    document = doc()
+    qs = _with_indexed_relations(queryset, document).iterator(chunk_size=chunk_size)
+    document.update(qs, parallel=parallel)
+
+
+@contextmanager
+def refresh_disabled(index_name: str, using: str = "default") -> Iterator[None]:
+    """Pause the periodic refresh of the index for a bulk load, restore it and refresh once afterwards."""
+    es = connections.get_connection(using)
+    current_settings = es.indices.get_settings(index=index_name, name="index.refresh_interval", flat_settings=True)
+    refresh_interval = next(iter(current_settings.values()), {}).get("settings", {}).get("index.refresh_interval")
+    es.indices.put_settings(index=index_name, settings={"index.refresh_interval": "-1"})
+    try:
+        yield
+    finally:
+        es.indices.put_settings(index=index_name, settings={"index.refresh_interval": refresh_interval})
+        es.indices.refresh(index=index_name)
+
+
+REBUILD_TIMEOUT = 60 * 60 * 24
+
+
+def _rebuild_cache_key(alias: str) -> str:
+    return f"es-index-rebuild:{alias}"
+
+
+def is_index_rebuilding(alias: str) -> bool:
+    """Return True while the index behind `alias` is rebuilt, see `capture_index_writes`."""
+    return cache.get(_rebuild_cache_key(alias)) is not None
+
+
+def record_index_writes(alias: str, object_ids: Iterable[Any]) -> None:
+    """Log the ids written to `alias` while its index is rebuilt, the rebuild re-syncs them from the database."""
+    if not (object_ids := [str(_id) for _id in object_ids]):
+        return
+    key = _rebuild_cache_key(alias)
+    try:
+        position = cache.incr(key)
+    except ValueError:
+        # no rebuild running, or it already swapped the alias and the write reached the new index
+        return
+    cache.set(f"{key}:{position}", object_ids, REBUILD_TIMEOUT)
+
+
+@contextmanager
+def capture_index_writes(alias: str) -> Iterator[Callable[[], set[str]]]:
+    """Record the ids written to `alias` while the enclosed rebuild is running.
+
+    Yields a function returning the ids recorded since its previous call. The writes are only logged, the
+    rebuild reads those records back from the database once its bulk load is done, so a stale load can't
+    overwrite a newer write or bring a deleted document back.
+    """
+    key = _rebuild_cache_key(alias)
+    cache.set(key, 0, REBUILD_TIMEOUT)
+    read = 0
+
+    def written_ids() -> set[str]:
+        nonlocal read
+        positions = range(read + 1, (cache.get(key) or read) + 1)
+        batches = cache.get_many([f"{key}:{position}" for position in positions])
+        ids: set[str] = set()
+        for position in positions:
+            if (batch := batches.get(f"{key}:{position}")) is None:
+                # the writer incremented the counter but did not store its batch yet, read it next time
+                break
+            ids.update(batch)
+            read = position
+        return ids
+
+    try:
+        yield written_ids
+    finally:
+        cache.delete_many([key, *(f"{key}:{position}" for position in range(1, (cache.get(key) or 0) + 1))])
+
+
+def bulk_populate_index(  # noqa: PLR0913
+    queryset: "QuerySet",
+    doc: Any,
+    chunk_size: int = 2000,
+    thread_count: int = 1,
+    using: str = "default",
+    *,
+    index_name: str | None = None,
+) -> tuple[int, int]:
+    """Index the whole queryset with refreshes paused, return the numbers of indexed and failed documents.
+
+    Related objects are loaded per chunk and the chunk is sent by `thread_count` bulk workers. The database is
+    only read from the calling thread, the workers receive serialized documents. `index_name` replaces the
+    document alias as target, a rebuild uses it to fill an index that is not live yet.
+    """
+    if not config.IS_ELASTICSEARCH_ENABLED:  # pragma: no cover
+        return 0, 0
+    document = doc()
+    index_name = index_name or document._index._name
+    es = connections.get_connection(using)
+    instances = _with_indexed_relations(queryset, document).iterator(chunk_size=chunk_size)
+
+    indexed = failed = 0
+    started = time.monotonic()
+    with refresh_disabled(index_name, using=using):
+        for chunk in batched(instances, chunk_size, strict=False):
+            actions = [
+                {
+                    "_op_type": "index",
+                    "_index": index_name,
+                    "_id": document.generate_id(instance),
+                    "_source": document.prepare(instance),
+                }
+                for instance in chunk
+                if document.should_index_object(instance)
+            ]
+            if thread_count > 1:
+                results = parallel_bulk(
+                    es,
+                    actions,
+                    thread_count=thread_count,
+                    chunk_size=-(-chunk_size // thread_count),
+                    raise_on_error=False,
+                    raise_on_exception=False,
+                )
+            else:
+                results = streaming_bulk(
+                    es, actions, chunk_size=chunk_size, raise_on_error=False, raise_on_exception=False
+                )
+            for ok, item in results:
+                if ok:
+                    indexed += 1
+                    continue
+                failed += 1
+                if failed <= 10:
+                    logger.error(f"Failed to index document into {index_name}: {item}")
+    elapsed = time.monotonic() - started
+    logger.info(
+        f"Indexed {indexed} documents into {index_name} in {elapsed:.1f}s "
+        f"({indexed / elapsed if elapsed else indexed:.0f} documents/s), {failed} failed"
+    )
+    return indexed, failed
 
 
 def remove_elasticsearch_documents_by_matching_ids(id_list: list[str], document: "type[Document]") -> None:
@@ -31,6 +182,8 @@ def remove_elasticsearch_documents_by_matching_ids(id_list: list[str], document:
         document.search().params(search_type="dfs_query_then_fetch", conflicts="proceed").update_from_dict(
             query_dict
         ).delete()
+        if is_index_rebuilding(document._index._name):
+            transaction.on_commit(partial(record_index_writes, document._index._name, id_list))
     except NotFoundError:
         pass
 
@@ -55,24 +208,43 @@ def ensure_index_ready(index_name: str) -> None:
     conn.indices.refresh(index=index_name)
 
 
+def _run_for_active_programs(func: Callable[[str], Any]) -> None:
+    """Call `func` for every active program, up to ELASTICSEARCH_REBUILD_WORKERS programs at a time."""
+    from hope.models import Program
+
+    program_ids = [str(pk) for pk in Program.objects.filter(status=Program.ACTIVE).values_list("id", flat=True)]
+    workers = min(settings.ELASTICSEARCH_REBUILD_WORKERS, len(program_ids))
+    if workers <= 1:
+        for program_id in program_ids:
+            func(program_id)
+        return
+
+    def _run(program_id: str) -> Any:
+        try:
+            return func(program_id)
+        finally:
+            db_connections.close_all()
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(_run, program_ids))
+    logger.info(f"Processed indexes of {len(program_ids)} programs in {time.monotonic() - started:.1f}s")
+
+
 def rebuild_search_index(models: None = None, options: dict | None = None) -> None:
     from hope.apps.household.services.index_management import rebuild_program_indexes
-    from hope.models import Program
 
     if not config.IS_ELASTICSEARCH_ENABLED:  # pragma: no cover
         return
 
-    for program in Program.objects.filter(status=Program.ACTIVE):
-        rebuild_program_indexes(str(program.id))
+    _run_for_active_programs(rebuild_program_indexes)
 
 
 def populate_all_indexes() -> None:
     """Populate Elasticsearch indexes - for all active programs."""
     from hope.apps.household.services.index_management import populate_program_indexes
-    from hope.models import Program
 
     if not config.IS_ELASTICSEARCH_ENABLED:  # pragma: no cover
         return
 
-    for program in Program.objects.filter(status=Program.ACTIVE):
-        populate_program_indexes(str(program.id))
+    _run_for_active_programs(populate_program_indexes)
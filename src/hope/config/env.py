@@ -51,6 +51,7 @@ DEFAULTS = {
     "ELASTICSEARCH_HOST": (str, "http://hope-es-hope-search:9200"),
     "ELASTICSEARCH_INDEX_PREFIX": (str, ""),
     "ELASTICSEARCH_SYNONYMS_FILE": (str, "/app/data/synonyms.txt"),
+    "ELASTICSEARCH_REBUILD_WORKERS": (int, 4),
     "RAPID_PRO_URL": (str, "https://rapidpro.io"),
     "DATAMART_USER": (str, ""),
     "DATAMART_URL": (str, "https://datamart-dev.unicef.io"),
@@ -75,6 +75,16 @@ CONSTANCE_CONFIG = {
         "If percentage of duplicates is higher or equal to this setting, deduplication is aborted",
         "percentages",
     ),
+    "DEDUPLICATION_MSEARCH_WINDOW_SIZE": (
+        200,
+        "Number of individuals deduplicated with a single Elasticsearch multi-search request",
+        "positive_integers",
+    ),
+    "DEDUPLICATION_SHARD_SIZE": (
+        20000,
+        "Number of individuals deduplicated by a single worker for business areas with sharded deduplication",
+        "positive_integers",
+    ),
     "DEDUPLICATION_IMAGE_UPLOAD_BATCH_SIZE": (
         5000,
         "Batch size for image upload",
@@ -120,6 +130,11 @@ CONSTANCE_CONFIG = {
         "Results equal or above this score are considered possible matches",
         "positive_floats",
     ),
+    "SANCTION_LIST_MSEARCH_BATCH_SIZE": (
+        100,
+        "Number of sanction list individuals screened with a single Elasticsearch multi-search request",
+        "positive_integers",
+    ),
     # RAPID PRO
     "RAPID_PRO_PROVIDER": ("tel", "Rapid pro messages provider (telegram/tel)"),
     # CASH ASSIST
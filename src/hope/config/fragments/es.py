@@ -9,3 +9,5 @@ ELASTICSEARCH_DSL = {
 ELASTICSEARCH_BASE_SETTINGS = {"number_of_shards": 1, "number_of_replicas": 0}
 ELASTICSEARCH_SYNONYMS_FILE = env("ELASTICSEARCH_SYNONYMS_FILE")
 ELASTICSEARCH_DSL_AUTOSYNC = False
+# number of programs whose indexes are rebuilt concurrently
+ELASTICSEARCH_REBUILD_WORKERS = env("ELASTICSEARCH_REBUILD_WORKERS")
@@ -73,3 +73,10 @@ class AuroraKeyConstructor(KeyConstructorMixin):
     organization_list_version = OrganizationListVersionsKeyBit()
     project_list_version = ProjectListVersionsKeyBit()
     registration_list_version = RegistrationListVersionsKeyBit()
+
+
+AURORA_LIST_CACHE_TAGS = (
+    OrganizationListVersionsKeyBit.specific_view_cache_key,
+    ProjectListVersionsKeyBit.specific_view_cache_key,
+    RegistrationListVersionsKeyBit.specific_view_cache_key,
+)
@@ -22,7 +22,7 @@ from hope.contrib.aurora.api import (
     ProjectSerializer,
     RegistrationSerializer,
 )
-from hope.contrib.aurora.caches import AuroraKeyConstructor
+from hope.contrib.aurora.caches import AURORA_LIST_CACHE_TAGS, AuroraKeyConstructor
 from hope.contrib.aurora.models import Organization, Project, Registration
 from hope.contrib.aurora.utils import fetch_metadata
 
@@ -78,7 +78,7 @@ class OrganizationListView(HOPEAPIView, ListAPIView):
     queryset = Organization.objects.all()
     serializer_class = OrganizationSerializer
 
-    @cached_response(key_func=AuroraKeyConstructor())
+    @cached_response(key_func=AuroraKeyConstructor(), tags=AURORA_LIST_CACHE_TAGS)
     def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         return super().get(request, *args, **kwargs)
 
@@ -89,7 +89,7 @@ class ProjectListView(HOPEAPIView, ListAPIView):
     filter_backends = [DjangoFilterBackend]
     filterset_class = ProjectFilter
 
-    @cached_response(key_func=AuroraKeyConstructor())
+    @cached_response(key_func=AuroraKeyConstructor(), tags=AURORA_LIST_CACHE_TAGS)
     def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         return super().get(request, *args, **kwargs)
 
@@ -100,6 +100,6 @@ class RegistrationListView(HOPEAPIView, ListAPIView):
     filter_backends = [DjangoFilterBackend]
     filterset_class = RegistrationFilter
 
-    @cached_response(key_func=AuroraKeyConstructor())
+    @cached_response(key_func=AuroraKeyConstructor(), tags=AURORA_LIST_CACHE_TAGS)
     def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         return super().get(request, *args, **kwargs)
@@ -22,6 +22,7 @@ from hope.models.delivery_mechanism import *  # noqa: F403
 from hope.models.delivery_mechanism_config import *  # noqa: F403
 from hope.models.document import *  # noqa: F403
 from hope.models.document_type import *  # noqa: F403
+from hope.models.elasticsearch_index_queue import *  # noqa: F403
 from hope.models.entitlement_card import *  # noqa: F403
 from hope.models.facility import *  # noqa: F403
 from hope.models.feedback import *  # noqa: F403
@@ -50,6 +51,7 @@ from hope.models.partner import *  # noqa: F403
 from hope.models.payment import *  # noqa: F403
 from hope.models.payment_data_collector import *  # noqa: F403
 from hope.models.payment_household_snapshot import *  # noqa: F403
+from hope.models.payment_number_sequence import *  # noqa: F403
 from hope.models.payment_plan import *  # noqa: F403
 from hope.models.payment_plan_group import *  # noqa: F403
 from hope.models.payment_plan_purpose import *  # noqa: F403
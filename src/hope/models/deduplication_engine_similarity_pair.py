@@ -1,7 +1,6 @@
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Iterable, Literal
 
 from django.db import models, transaction
-from django.db.models import QuerySet
 
 from hope.apps.registration_data.api.deduplication_engine import SimilarityPair
 from hope.models.individual import Individual
@@ -166,7 +165,7 @@ class DeduplicationEngineSimilarityPair(models.Model):
     def serialize_for_individual(
         cls,
         individual: Individual,
-        similarity_pairs: QuerySet["DeduplicationEngineSimilarityPair"],
+        similarity_pairs: Iterable["DeduplicationEngineSimilarityPair"],
     ) -> list:
         duplicates = []
         for pair in similarity_pairs:
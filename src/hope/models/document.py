@@ -1,7 +1,9 @@
 import re
 
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
 from django.db.models import BooleanField, F, Func, Q, UniqueConstraint, Value
+from django.db.models.functions import Upper
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
@@ -79,6 +81,11 @@ class Document(AbstractSyncable, SoftDeletableMergeStatusModel, TimeStampedUUIDM
                 fields=["type", "individual"],
                 name="doc_type_individual_idx",
             ),
+            # serves the `document_number__icontains` filters, they compare UPPER(document_number)
+            GinIndex(
+                OpClass(Upper("document_number"), name="gin_trgm_ops"),
+                name="doc_number_upper_trgm_idx",
+            ),
         ]
         constraints = [
             # if document_type.unique_for_individual=True then document of this type must be unique for an individual
@@ -0,0 +1,24 @@
+from django.db import models
+
+
+class ElasticsearchIndexQueue(models.Model):
+    """Individual or Household waiting to be synced to its program index.
+
+    See `hope.apps.household.services.index_queue`.
+    """
+
+    class DocumentType(models.TextChoices):
+        INDIVIDUAL = "individual", "Individual"
+        HOUSEHOLD = "household", "Household"
+
+    # no constraint, records removed together with their program still queue their removal from the index
+    program = models.ForeignKey("program.Program", on_delete=models.DO_NOTHING, db_constraint=False, related_name="+")
+    document_type = models.CharField(max_length=16, choices=DocumentType.choices)
+    object_id = models.UUIDField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        app_label = "household"
+
+    def __str__(self) -> str:
+        return f"{self.document_type} {self.object_id}"
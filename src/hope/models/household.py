@@ -619,6 +619,14 @@ class Household(
             ),
         ]
 
+    @classmethod
+    def from_db(cls, db: str | None, field_names: list[str], values: list[Any]) -> Household:
+        instance = super().from_db(db, field_names, values)
+        # areas as stored, changing them also invalidates the list cache partitions the household moves out of
+        if "admin1_id" in instance.__dict__ and "admin2_id" in instance.__dict__:
+            instance._loaded_admin_area_ids = {"admin1": instance.admin1_id, "admin2": instance.admin2_id}
+        return instance
+
     def delete(self, *args: Any, **kwargs: Any) -> tuple[int, dict[str, int]]:
         household_deleted.send(self.__class__, instance=self)
         return super().delete(*args, **kwargs)
@@ -429,6 +429,14 @@ class Individual(
     )
     vector_column = SearchVectorField(null=True, help_text="Database vector column for search [sys]")
 
+    @classmethod
+    def from_db(cls, db: str | None, field_names: list[str], values: list[Any]) -> "Individual":
+        instance = super().from_db(db, field_names, values)
+        # household as stored, moving the individual also invalidates the list cache partitions of the old one
+        if "household_id" in instance.__dict__:
+            instance._loaded_household_id = instance.household_id
+        return instance
+
     def delete(self, *args: Any, **kwargs: Any) -> tuple[int, dict[str, int]]:
         individual_deleted.send(self.__class__, instance=self)
         return super().delete(*args, **kwargs)
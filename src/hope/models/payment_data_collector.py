@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterable
 
 from hope.models.account import Account
 from hope.models.delivery_mechanism_config import DeliveryMechanismConfig
@@ -46,6 +46,7 @@ class PaymentDataCollector(Account):
         cls,
         fsp: "FinancialServiceProvider",
         account: Account | None,
+        financial_institution_codes: dict[Any, str] | None = None,
     ) -> str | None:
         if not account or not account.financial_institution:
             return None
@@ -54,6 +55,9 @@ class PaymentDataCollector(Account):
         if financial_institution.is_generic:
             return None
 
+        if financial_institution_codes is not None:
+            return financial_institution_codes.get(financial_institution.pk)
+
         return (
             FinancialInstitutionMapping.objects.filter(
                 financial_institution=financial_institution,
@@ -64,13 +68,15 @@ class PaymentDataCollector(Account):
         )
 
     @classmethod
-    def resolve_required_field(
+    def resolve_required_field(  # noqa: PLR0913
         cls,
         fsp: "FinancialServiceProvider",
         collector: Individual,
         account: Account | None,
         output_field: str,
         fsp_name_mapping: FspNameMapping | None,
+        *,
+        financial_institution_codes: dict[Any, str] | None = None,
     ) -> Any:
         if fsp_name_mapping:
             internal_field = fsp_name_mapping.hope_name
@@ -85,7 +91,9 @@ class PaymentDataCollector(Account):
             value = getattr(associated_object, internal_field, None)
 
         if cls.SERVICE_PROVIDER_CODE in (output_field, internal_field):
-            financial_institution_code = cls.resolve_financial_institution_code(fsp, account)
+            financial_institution_code = cls.resolve_financial_institution_code(
+                fsp, account, financial_institution_codes
+            )
             if financial_institution_code not in [None, ""]:
                 return financial_institution_code
 
@@ -144,6 +152,79 @@ class PaymentDataCollector(Account):
         if not dm_config:
             return True
 
+        return cls._has_required_fields(fsp, dm_config, collector, account, fsp_names_mappings)
+
+    @classmethod
+    def validate_accounts(
+        cls,
+        fsp: "FinancialServiceProvider",
+        delivery_mechanism: "DeliveryMechanism",
+        collectors: Iterable[Individual],
+    ) -> dict[Any, bool]:
+        """Bulk variant of `validate_account`, returns {collector pk: is valid}.
+
+        Accounts, delivery mechanism configs, FSP name mappings and financial institution codes are
+        fetched once for all collectors, so the number of queries does not depend on their count.
+        Collectors are expected to come with `household` selected.
+        """
+        collectors = list(collectors)
+        if not delivery_mechanism.account_type:
+            return dict.fromkeys((collector.pk for collector in collectors), True)
+
+        dm_configs = list(DeliveryMechanismConfig.objects.filter(fsp=fsp, delivery_mechanism=delivery_mechanism))
+        if not dm_configs:
+            return dict.fromkeys((collector.pk for collector in collectors), True)
+
+        country_configs: dict[Any, DeliveryMechanismConfig] = {}
+        for dm_config in dm_configs:
+            if dm_config.country_id:
+                country_configs.setdefault(dm_config.country_id, dm_config)
+
+        accounts: dict[Any, Account] = {}
+        for account in Account.objects.select_related("financial_institution").filter(
+            individual_id__in=[collector.pk for collector in collectors],
+            account_type=delivery_mechanism.account_type,
+        ):
+            # keep the first one per collector, same as `collector.accounts...first()`
+            accounts.setdefault(account.individual_id, account)
+
+        financial_institution_codes = dict(
+            FinancialInstitutionMapping.objects.filter(
+                financial_service_provider=fsp,
+                financial_institution_id__in={
+                    account.financial_institution_id
+                    for account in accounts.values()
+                    if account.financial_institution_id
+                },
+            ).values_list("financial_institution_id", "code")
+        )
+        fsp_names_mappings = {x.external_name: x for x in fsp.names_mappings.all()}
+
+        results = {}
+        for collector in collectors:
+            collector_country_id = collector.household and collector.household.country_id
+            dm_config = country_configs.get(collector_country_id) or dm_configs[0]
+            results[collector.pk] = cls._has_required_fields(
+                fsp,
+                dm_config,
+                collector,
+                accounts.get(collector.pk),
+                fsp_names_mappings,
+                financial_institution_codes=financial_institution_codes,
+            )
+        return results
+
+    @classmethod
+    def _has_required_fields(  # noqa: PLR0913
+        cls,
+        fsp: "FinancialServiceProvider",
+        dm_config: DeliveryMechanismConfig,
+        collector: Individual,
+        account: Account | None,
+        fsp_names_mappings: dict[str, FspNameMapping],
+        *,
+        financial_institution_codes: dict[Any, str] | None = None,
+    ) -> bool:
         for field_value in dm_config.required_fields:
             value = cls.resolve_required_field(
                 fsp,
@@ -151,6 +232,7 @@ class PaymentDataCollector(Account):
                 account,
                 field_value,
                 fsp_names_mappings.get(field_value),
+                financial_institution_codes=financial_institution_codes,
             )
 
             if value in [None, ""]:
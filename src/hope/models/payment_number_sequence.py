@@ -0,0 +1,26 @@
+import secrets
+
+from django.db import models
+
+
+class PaymentNumberSequence(models.Model):
+    """Per program positions of the order/token number permutations.
+
+    See `hope.apps.payment.services.payment_number_allocator`.
+    """
+
+    program = models.OneToOneField(
+        "program.Program",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="payment_number_sequence",
+    )
+    key = models.CharField(max_length=64, default=secrets.token_hex)
+    order_number_position = models.PositiveBigIntegerField(default=0)
+    token_number_position = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        app_label = "payment"
+
+    def __str__(self) -> str:
+        return f"Payment number sequence of {self.program_id}"
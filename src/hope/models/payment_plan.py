@@ -734,6 +734,7 @@ class PaymentPlan(
                     "total_delivered_quantity_usd",
                     "total_undelivered_quantity",
                     "total_undelivered_quantity_usd",
+                    "updated_at",
                 ]
             )
 
@@ -909,7 +910,7 @@ class PaymentPlan(
             return 1.0
 
         if exchange_rates_client is None:
-            exchange_rates_client = ExchangeRates()
+            exchange_rates_client = ExchangeRates.get_shared()
 
         return exchange_rates_client.get_exchange_rate_for_currency_code(
             self.currency.code, self.currency_exchange_date
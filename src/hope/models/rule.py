@@ -1,5 +1,5 @@
 from builtins import type as builtin_type
-from typing import Any, Callable, Optional, Sequence
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence
 
 from concurrency.fields import AutoIncVersionField
 from django.conf import settings
@@ -13,6 +13,7 @@ from django.utils.functional import cached_property
 from natural_keys import NaturalKeyModel
 
 from hope.apps.core.mixins import LimitBusinessAreaModelMixin
+from hope.apps.steficon.cache import get_rule_cache, invalidate_rule_cache
 from hope.apps.steficon.config import SAFETY_HIGH, SAFETY_NONE, SAFETY_STANDARD
 from hope.apps.steficon.interpreters import Interpreter, interpreters, mapping
 from hope.apps.steficon.result import Result
@@ -141,6 +142,7 @@ class Rule(NaturalKeyModel, LimitBusinessAreaModelMixin):
         with atomic():
             super().save(force_insert, force_update, using, update_fields)
             self.commit()
+        invalidate_rule_cache(self.pk)
 
     def commit(self, is_release: bool = False, force: bool = False) -> Optional["RuleCommit"]:
         stored, changes = self.get_changes()
@@ -172,6 +174,7 @@ class Rule(NaturalKeyModel, LimitBusinessAreaModelMixin):
             self.history.exclude(pk=commit.pk).update(deprecated=True)
         else:
             commit = self.commit(is_release=True, force=True)
+        invalidate_rule_cache(self.pk)
         return commit
 
     @property
@@ -204,26 +207,36 @@ class Rule(NaturalKeyModel, LimitBusinessAreaModelMixin):
         func: type[Interpreter] = mapping[self.language]
         return func(self.definition)
 
+    def get_latest_commit(self, only_release: bool = True, only_enabled: bool = True) -> Optional["RuleCommit"]:
+        qs: QuerySet[RuleCommit] = self.history.all()
+        if only_release:
+            qs = qs.filter(is_release=True)
+
+        if only_enabled:
+            qs = qs.filter(enabled=True)
+        return qs.order_by("-version").first()
+
     def execute(
         self,
         context: dict | None = None,
         only_release: bool = True,
         only_enabled: bool = True,
     ) -> Result:
-        if self.pk:
-            qs: QuerySet[RuleCommit] = self.history.all()
-            if only_release:
-                qs = qs.filter(is_release=True)
-
-            if only_enabled:
-                qs = qs.filter(enabled=True)
-            latest: RuleCommit | Rule | None = qs.order_by("-version").first()
-        else:
+        cache = get_rule_cache()
+        latest: RuleCommit | Rule | None
+        if not self.pk:
             latest = self
-        with atomic():
-            if latest:
-                return latest.interpreter.execute(context)
+        elif cache is not None:
+            latest = cache.get_latest_commit(self, only_release, only_enabled)
+        else:
+            latest = self.get_latest_commit(only_release, only_enabled)
+        if not latest:
             raise ValueError("No Released Rules found")
+        if cache is not None:
+            # cached executions run inside the caller's transaction, no savepoint per execution
+            return latest.interpreter.execute(context)
+        with atomic():
+            return latest.interpreter.execute(context)
 
 
 MONITORED_FIELDS = ("name", "enabled", "deprecated", "language", "definition")
@@ -290,6 +303,9 @@ class RuleCommit(models.Model):
     def execute(self, context: dict) -> Any:
         return self.interpreter.execute(context)
 
+    def execute_many(self, contexts: Iterable[dict]) -> Iterator[Any]:
+        return self.interpreter.execute_many(contexts)
+
     def release(self) -> Optional["RuleCommit"]:
         if self.deprecated or not self.enabled:
             raise ValueError("Cannot release disabled/deprecated rules")
@@ -297,4 +313,5 @@ class RuleCommit(models.Model):
             self.is_release = True
             self.save()
             self.rule.history.exclude(pk=self.pk).update(deprecated=True)
+            invalidate_rule_cache(self.rule_id)
         return self
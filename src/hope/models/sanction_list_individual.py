@@ -55,6 +55,7 @@ class SanctionListIndividual(TimeStampedUUIDModel, InternalDataFieldModel):
     version_num = models.PositiveIntegerField()
     country_of_birth = models.ForeignKey("geo.Country", blank=True, null=True, on_delete=models.PROTECT)
     active = models.BooleanField(default=True)
+    content_hash = models.CharField(max_length=64, blank=True, default="", editable=False)
 
     sanction_list = models.ForeignKey(SanctionList, on_delete=models.CASCADE, related_name="entries")
     objects = ActiveIndividualsManager()
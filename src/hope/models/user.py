@@ -5,8 +5,7 @@ from typing import Any
 from uuid import UUID
 
 from django.conf import settings
-from django.contrib.auth.models import AbstractUser, Permission
-from django.contrib.contenttypes.models import ContentType
+from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.db.models import JSONField, Q, QuerySet
@@ -16,12 +15,12 @@ from model_utils.models import UUIDModel
 from natural_keys import NaturalKeyModel
 from unicef_security.models import SecurityMixin
 
+from hope.apps.account.permission_matrix import get_permission_matrix
 from hope.apps.account.permissions import Permissions
 from hope.apps.account.utils import test_conditional
 from hope.apps.utils.mailjet import MailjetClient
 from hope.models.business_area import BusinessArea
 from hope.models.partner import Partner
-from hope.models.role import Role
 from hope.models.role_assignment import RoleAssignment
 
 logger = logging.getLogger(__name__)
@@ -133,46 +132,15 @@ class User(AbstractUser, SecurityMixin, NaturalKeyModel, UUIDModel):
 
         retrieved from RoleAssignments of the user and their partner
         """
+        matrix = get_permission_matrix(self)
+        business_area_id = matrix.business_area_ids.get(business_area_slug)
+        if business_area_id is None:
+            return set()
         if program_id:
-            role_assignments = RoleAssignment.objects.filter(
-                Q(
-                    partner__user=self,
-                    business_area__slug=business_area_slug,
-                    program_id=program_id,
-                )
-                | Q(
-                    partner__user=self,
-                    business_area__slug=business_area_slug,
-                    program=None,
-                )
-                | Q(
-                    user=self,
-                    business_area__slug=business_area_slug,
-                    program_id=program_id,
-                )
-                | Q(user=self, business_area__slug=business_area_slug, program=None)
-            ).exclude(expiry_date__lt=timezone.now())
+            permissions = matrix.program_permissions(business_area_id, str(program_id))
         else:
-            role_assignments = RoleAssignment.objects.filter(
-                Q(partner__user=self, business_area__slug=business_area_slug)
-                | Q(user=self, business_area__slug=business_area_slug)
-            ).exclude(expiry_date__lt=timezone.now())
-
-        permissions_set = set()
-        # permissions from group field in RoleAssignment
-        role_assignment_group_permissions = Permission.objects.filter(
-            group__role_assignments__in=role_assignments
-        ).values_list("content_type__app_label", "codename")
-        permissions_set.update(f"{app}.{codename}" for app, codename in role_assignment_group_permissions)
-
-        # permissions from role field in RoleAssignment
-        role_assignment_role_permissions = Role.objects.filter(
-            role_assignments__in=role_assignments, permissions__isnull=False
-        ).values_list("permissions", flat=True)
-        permissions_set.update(
-            permission for permission_list in role_assignment_role_permissions for permission in permission_list
-        )
-        return permissions_set
+            permissions = matrix.business_area_permissions(business_area_id)
+        return set(permissions or ())
 
     @cached_property
     def all_permissions_in_business_areas(self) -> dict[str, set[str]]:
@@ -181,27 +149,13 @@ class User(AbstractUser, SecurityMixin, NaturalKeyModel, UUIDModel):
         Permissions are retrieved from RoleAssignments of the user and their partner, for all business areas
         associated with the user.
         """
-        content_types_dict = {
-            str(pk): app_label for pk, app_label in ContentType.objects.values_list("id", "app_label")
-        }
-        role_assignments = (
-            RoleAssignment.objects.filter(Q(partner__user=self) | Q(user=self))
-            .select_related("role", "group")
-            .prefetch_related("group__permissions")
-            .exclude(expiry_date__lt=timezone.now())
+        return defaultdict(
+            set,
+            {
+                business_area_id: set(permissions)
+                for business_area_id, permissions in get_permission_matrix(self).business_areas.items()
+            },
         )
-        permissions_per_business_area = defaultdict(set)
-        for role_assignment in role_assignments:
-            if role_assignment.role.permissions is not None:
-                permissions_per_business_area[str(role_assignment.business_area_id)].update(
-                    role_assignment.role.permissions
-                )
-            if role_assignment.group is not None:
-                permissions_per_business_area[str(role_assignment.business_area_id)].update(
-                    f"{content_types_dict[str(perm.content_type_id)]}.{perm.codename}"
-                    for perm in role_assignment.group.permissions.all()
-                )
-        return permissions_per_business_area
 
     @cached_property
     def business_areas(self) -> QuerySet[BusinessArea]:
@@ -13,6 +13,7 @@ COMMON_SETTINGS = {
     ],
     "CELERY_TASK_ALWAYS_EAGER": True,
     "ELASTICSEARCH_INDEX_PREFIX": "test_",
+    "ELASTICSEARCH_REBUILD_WORKERS": 1,
     "EMAIL_BACKEND": "django.core.mail.backends.console.EmailBackend",
     "CATCH_ALL_EMAIL": [],
     "DEFAULT_EMAIL": "testemail@email.com",
@@ -0,0 +1,143 @@
+"""Tests for the compiled permission matrix of a user."""
+
+from typing import Any
+
+from django.core.cache import cache
+from django.test import TestCase
+import pytest
+
+from extras.test_utils.factories import (
+    BusinessAreaFactory,
+    PartnerFactory,
+    ProgramFactory,
+    RoleAssignmentFactory,
+    RoleFactory,
+    UserFactory,
+)
+from hope.apps.account.caches import get_programs_permissions_version_key
+from hope.apps.account.permission_matrix import get_permission_matrix
+from hope.apps.account.permissions import Permissions, check_permissions
+from hope.models import BusinessArea, Program, User
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def business_area(db: Any) -> BusinessArea:
+    return BusinessAreaFactory(slug="afghanistan", code="0060", name="Afghanistan")
+
+
+@pytest.fixture
+def program(business_area: BusinessArea) -> Program:
+    return ProgramFactory(status=Program.ACTIVE, business_area=business_area)
+
+
+@pytest.fixture
+def user(db: Any) -> User:
+    return UserFactory(partner=PartnerFactory(name="Partner"))
+
+
+def get_programs_version() -> int:
+    return cache.get(get_programs_permissions_version_key(), 0)
+
+
+def test_matrix_maps_business_areas_and_programs_to_permissions(
+    user: User, business_area: BusinessArea, program: Program
+) -> None:
+    other_program = ProgramFactory(status=Program.ACTIVE, business_area=business_area)
+    RoleAssignmentFactory(
+        user=user,
+        partner=None,
+        business_area=business_area,
+        program=None,
+        role=RoleFactory(name="BA Role", permissions=[Permissions.RDI_VIEW_LIST.value]),
+    )
+    RoleAssignmentFactory(
+        user=user,
+        partner=None,
+        business_area=business_area,
+        program=program,
+        role=RoleFactory(name="Program Role", permissions=[Permissions.PM_VIEW_LIST.value]),
+    )
+
+    matrix = get_permission_matrix(user)
+    business_area_id = str(business_area.id)
+
+    assert matrix.business_area_ids == {business_area.slug: business_area_id}
+    assert matrix.program_ids[business_area_id, program.code] == str(program.id)
+    assert matrix.program_permissions(business_area_id, str(program.id)) == {
+        Permissions.RDI_VIEW_LIST.value,
+        Permissions.PM_VIEW_LIST.value,
+    }
+    assert matrix.program_permissions(business_area_id, str(other_program.id)) == {Permissions.RDI_VIEW_LIST.value}
+    assert matrix.business_area_permissions(business_area_id) == {
+        Permissions.RDI_VIEW_LIST.value,
+        Permissions.PM_VIEW_LIST.value,
+    }
+    assert matrix.business_area_permissions(str(BusinessAreaFactory().id)) is None
+
+
+def test_check_permissions_runs_no_queries_with_cached_matrix(
+    user: User, business_area: BusinessArea, program: Program, django_assert_num_queries: Any
+) -> None:
+    RoleAssignmentFactory(
+        user=user,
+        partner=None,
+        business_area=business_area,
+        program=program,
+        role=RoleFactory(name="Program Role", permissions=[Permissions.PM_VIEW_LIST.value]),
+    )
+    kwargs = {"business_area": business_area.slug, "program": program.code}
+
+    with django_assert_num_queries(4):
+        assert check_permissions(user, [Permissions.PM_VIEW_LIST], **kwargs)
+    with django_assert_num_queries(0):
+        assert check_permissions(user, [Permissions.PM_VIEW_LIST], **kwargs)
+        assert not check_permissions(user, [Permissions.RDI_VIEW_LIST], **kwargs)
+        assert user.permissions_in_business_area(business_area.slug, program.id) == {Permissions.PM_VIEW_LIST.value}
+
+    # the matrix is shared through the cache with other instances of the user
+    same_user = User.objects.get(id=user.id)
+    with django_assert_num_queries(0):
+        assert check_permissions(same_user, [Permissions.PM_VIEW_LIST], **kwargs)
+
+
+def test_matrix_without_roles_is_cached_until_a_role_is_granted(
+    user: User, business_area: BusinessArea, program: Program, django_assert_num_queries: Any
+) -> None:
+    assert not get_permission_matrix(user).has_roles
+    same_user = User.objects.get(id=user.id)
+    with django_assert_num_queries(0):
+        assert not get_permission_matrix(same_user).has_roles
+        assert not check_permissions(
+            user, [Permissions.PM_VIEW_LIST], business_area=business_area.slug, program=program.code
+        )
+
+    with TestCase.captureOnCommitCallbacks(execute=True):
+        RoleAssignmentFactory(
+            user=user,
+            partner=None,
+            business_area=business_area,
+            program=program,
+            role=RoleFactory(name="Program Role", permissions=[Permissions.PM_VIEW_LIST.value]),
+        )
+
+    assert check_permissions(user, [Permissions.PM_VIEW_LIST], business_area=business_area.slug, program=program.code)
+
+
+def test_program_lookup_changes_invalidate_matrices(program: Program) -> None:
+    version = get_programs_version()
+
+    with TestCase.captureOnCommitCallbacks(execute=True):
+        program.description = "Updated"
+        program.save(update_fields=["description"])
+    assert get_programs_version() == version
+
+    with TestCase.captureOnCommitCallbacks(execute=True):
+        program.is_visible = False
+        program.save(update_fields=["is_visible"])
+    assert get_programs_version() == version + 1
+
+    with TestCase.captureOnCommitCallbacks(execute=True):
+        ProgramFactory(business_area=program.business_area)
+    assert get_programs_version() > version + 1
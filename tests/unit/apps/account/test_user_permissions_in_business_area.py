@@ -2,6 +2,7 @@
 
 from typing import Any
 
+from django.test import TestCase
 import pytest
 
 from extras.test_utils.factories import (
@@ -85,7 +86,8 @@ def test_user_role_exclude_by_expiry_date(business_area_afg: BusinessArea, busin
 
     # Expire user_role_1
     user_role_1.expiry_date = "2024-02-02"
-    user_role_1.save()
+    with TestCase.captureOnCommitCallbacks(execute=True):
+        user_role_1.save()
     user_role_1.refresh_from_db()
 
     assert str(user_role_1.expiry_date) == "2024-02-02"
@@ -129,7 +131,8 @@ def test_unicef_partner_hq_has_permission_from_user_and_role_with_all_permission
         Permissions.PROGRAMME_VIEW_LIST_AND_DETAILS,
     ]
     role_with_all_permissions.permissions = [permission.value for permission in permissions]
-    role_with_all_permissions.save()
+    with TestCase.captureOnCommitCallbacks(execute=True):
+        role_with_all_permissions.save()
 
     # UNICEF HQ user should have all these permissions automatically
     for permission in permissions:
@@ -15,6 +15,7 @@ from extras.test_utils.factories import (
     RoleFactory,
     UserFactory,
 )
+from hope.apps.account.permission_matrix import PermissionMatrix
 from hope.apps.core.backends import PermissionsBackend
 from hope.models import BusinessArea, Program
 
@@ -199,12 +200,13 @@ def test_get_all_permissions_caches_result(
     assert permissions == cached_permissions
 
 
-@patch("hope.apps.core.backends.cache.get")
+@patch("hope.apps.account.permission_matrix.cache.get")
 def test_cache_get_returns_cached_permissions(mock_cache_get: Any, backend, user, business_area, permission):
-    mock_cache_get.return_value = {get_permission_name(permission)}
+    matrix = PermissionMatrix(business_areas={str(business_area.id): frozenset({get_permission_name(permission)})})
+    mock_cache_get.side_effect = lambda key, *args, **kwargs: matrix if key.endswith(":matrix") else 1
     permissions = backend.get_all_permissions(user, business_area)
     mock_cache_get.assert_called()
-    assert mock_cache_get.call_count == 2
+    assert mock_cache_get.call_count == 3
     assert get_permission_name(permission) in permissions
 
 
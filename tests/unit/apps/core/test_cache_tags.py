@@ -0,0 +1,57 @@
+from unittest.mock import MagicMock
+
+from django.core.cache import cache
+
+from hope.apps.core.cache_tags import TaggedCache, invalidate_cache_tags, tag_cache_key
+
+
+def test_invalidate_cache_tags_deletes_only_tagged_entries() -> None:
+    cache.set("list:a", 1)
+    cache.set("list:b", 2)
+    cache.set("other", 3)
+    tag_cache_key("list:a", "list", timeout=60)
+    tag_cache_key("list:b", "list", "other_tag", timeout=60)
+
+    invalidate_cache_tags("list")
+
+    assert cache.get("list:a") is None
+    assert cache.get("list:b") is None
+    assert cache.get("other") == 3
+
+
+def test_invalidate_cache_tags_of_unknown_tag_is_noop() -> None:
+    cache.set("key", 1)
+
+    invalidate_cache_tags("unknown")
+
+    assert cache.get("key") == 1
+
+
+def test_tagged_cache_registers_written_entries() -> None:
+    tagged_cache = TaggedCache(cache, ("responses",))
+
+    tagged_cache.set("response", "content", 60)
+    assert tagged_cache.get("response") == "content"
+
+    invalidate_cache_tags("responses")
+    assert cache.get("response") is None
+
+
+def test_redis_tags_use_sets_instead_of_key_scans(mocker) -> None:
+    pipeline = MagicMock()
+    pipeline.execute.return_value = [{b"list:a", b"list:b"}, 1]
+    client = MagicMock()
+    client.pipeline.return_value = pipeline
+    mocked_cache = mocker.patch("hope.apps.core.cache_tags.cache")
+    mocked_cache.client.get_client.return_value = client
+    mocked_cache.make_key.side_effect = lambda key: f":1:{key}"
+
+    tag_cache_key("list:a", "list", timeout=60)
+    pipeline.sadd.assert_called_once_with(":1:cache_tag:list", "list:a")
+    pipeline.expire.assert_called_once_with(":1:cache_tag:list", 60)
+
+    invalidate_cache_tags("list")
+    pipeline.smembers.assert_called_once_with(":1:cache_tag:list")
+    pipeline.delete.assert_called_once_with(":1:cache_tag:list")
+    assert sorted(mocked_cache.delete_many.call_args.args[0]) == ["list:a", "list:b"]
+    mocked_cache.keys.assert_not_called()
@@ -7,6 +7,7 @@ import requests_mock as requests_mock_lib
 
 from hope.apps.core.exchange_rates import ExchangeRateClientAPI, ExchangeRates
 from hope.apps.core.exchange_rates.api import ExchangeRateClientDummy
+from hope.apps.core.exchange_rates.models import HistoryExchangeRate, SingleExchangeRate
 
 EXCHANGE_RATES_WITH_HISTORICAL_DATA = {
     "ROWSET": {
@@ -293,3 +294,43 @@ def test_get_exchange_rate_for_currency_code(
         exchange_rates_client = ExchangeRates()
         exchange_rate = exchange_rates_client.get_exchange_rate_for_currency_code(currency_code, dispersion_date)
         assert expected_result == exchange_rate
+
+
+@pytest.fixture
+def shared_exchange_rates(settings, monkeypatch):
+    settings.EXCHANGE_RATE_CACHE_EXPIRY = 60
+    monkeypatch.setattr(ExchangeRates, "_shared", None)
+    monkeypatch.setattr(
+        "hope.apps.core.exchange_rates.models.get_exchange_rate_client",
+        lambda: ExchangeRateClientDummy(EXCHANGE_RATES_WITH_HISTORICAL_DATA),
+    )
+
+
+def test_get_shared_reuses_table_until_refreshed(shared_exchange_rates):
+    shared = ExchangeRates.get_shared()
+
+    assert ExchangeRates.get_shared() is shared
+    assert ExchangeRates.refresh_shared() is not shared
+    assert ExchangeRates.get_shared().get_exchange_rate_for_currency_code("XEU", datetime(1998, 2, 7)) == 0.926
+
+
+def test_get_shared_builds_new_table_without_cache(settings, monkeypatch):
+    settings.EXCHANGE_RATE_CACHE_EXPIRY = 0
+    monkeypatch.setattr(
+        "hope.apps.core.exchange_rates.models.get_exchange_rate_client",
+        lambda: ExchangeRateClientDummy(EXCHANGE_RATES_WITH_HISTORICAL_DATA),
+    )
+
+    assert ExchangeRates.get_shared() is not ExchangeRates.get_shared()
+
+
+def test_historical_rate_lookup_falls_back_to_list_order_for_overlapping_ranges():
+    rates = [
+        HistoryExchangeRate(datetime(2020, 1, 1), datetime(2020, 12, 31), 2.0, 1.0),
+        HistoryExchangeRate(datetime(2020, 6, 1), datetime(2021, 6, 1), 3.0, 1.0),
+    ]
+    exchange_rate = SingleExchangeRate("ABC", "Abc", 1.0, datetime(2022, 1, 1), datetime(9999, 12, 31), 1.0, 2, rates)
+
+    assert exchange_rate.get_exchange_rate_by_dispersion_date(datetime(2020, 7, 1)) == 2.0
+    assert exchange_rate.get_exchange_rate_by_dispersion_date(datetime(2021, 3, 1)) == 3.0
+    assert exchange_rate.get_exchange_rate_by_dispersion_date(datetime(2019, 3, 1)) is None
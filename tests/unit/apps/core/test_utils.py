@@ -1,8 +1,10 @@
 from datetime import date
 from decimal import Decimal
+import io
 import json
 from unittest.mock import MagicMock
 
+from django.core.cache import cache
 from django.db.models import JSONField, Value
 from django.db.models.functions import Cast, Lower
 import pytest
@@ -19,6 +21,7 @@ from extras.test_utils.factories.core import (
     FlexibleAttributeFactory,
     FlexibleAttributeForPDUFactory,
 )
+from hope.apps.core.cache_tags import tag_cache_key
 from hope.apps.core.utils import (
     AutoCompleteFilterTemp,
     CaseInsensitiveTuple,
@@ -26,6 +29,7 @@ from hope.apps.core.utils import (
     FlexFieldsEncoder,
     JSONBSet,
     SheetImageLoader,
+    StreamingWorkbook,
     _apply_dict_fields,
     build_arg_dict_from_dict,
     build_arg_dict_from_dict_if_exists,
@@ -650,6 +654,51 @@ def io_for_pil() -> bytes:
     return base64.b64decode(one_pixel_png_base64)
 
 
+def _workbook_with_image() -> io.BytesIO:
+    from openpyxl import Workbook
+    from openpyxl.drawing.image import Image
+
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Individuals"
+    ws.append(["full_name_i_c", "photo_i_c", "age_i_c"])
+    ws.append(["Full name", "Photo", "Age"])
+    ws.append(["John", None, 30])
+    ws.append([])
+    ws.append(["Jane"])
+    ws.add_image(Image(io.BytesIO(io_for_pil())), "B3")
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    buffer.seek(0)
+    return buffer
+
+
+def test_streaming_worksheet_rows_and_columns_are_padded_to_header():
+    with StreamingWorkbook(_workbook_with_image()) as wb:
+        sheet = wb["Individuals"]
+
+        assert sheet.title == "Individuals"
+        assert [c.value for c in sheet[1]] == ["full_name_i_c", "photo_i_c", "age_i_c"]
+        assert list(sheet.iter_rows(min_row=3, values_only=True)) == [
+            ("John", None, 30),
+            (None, None, None),
+            ("Jane", None, None),
+        ]
+        assert [c.coordinate for c in sheet[3]] == ["A3", "B3", "C3"]
+        assert [c.value for c in sheet["C"][2:]] == [30, None, None]
+
+
+def test_sheet_image_loader_reads_images_from_streaming_worksheet():
+    from PIL import Image as PILImage
+
+    with StreamingWorkbook(_workbook_with_image()) as wb:
+        loader = SheetImageLoader(wb["Individuals"])
+
+        assert loader.image_in("B3") is True
+        assert loader.image_in("A3") is False
+        assert isinstance(loader.get("B3"), PILImage.Image)
+
+
 def test_rows_iterator_skips_header_and_empty_rows():
     cell_value = MagicMock(value="content")
     cell_empty = MagicMock(value=None)
@@ -1047,22 +1096,15 @@ def test_map_unicef_ids_separates_hh_and_ind_prefixes_and_resolves(business_area
     assert result.count("HH-9001") == 2
 
 
-def test_clear_cache_for_key_removes_only_matching_keys(mocker):
-    mock_cache = mocker.patch("hope.apps.core.utils.cache")
-    mock_cache.keys.return_value = ["FOO_a", "FOO_b"]
-
-    clear_cache_for_key("FOO_")
-
-    mock_cache.keys.assert_called_once_with("FOO_*")
-    assert mock_cache.delete.call_args_list == [mocker.call("FOO_a"), mocker.call("FOO_b")]
-
-
-def test_clear_cache_for_key_is_noop_when_cache_lacks_keys_method(mocker):
-    sentinel = mocker.patch("hope.apps.core.utils.cache", spec=["set", "get", "delete"])
+def test_clear_cache_for_key_removes_only_tagged_keys():
+    cache.set("FOO_a", 1)
+    cache.set("FOO_b", 2)
+    tag_cache_key("FOO_a", "FOO_", timeout=60)
 
     clear_cache_for_key("FOO_")
 
-    sentinel.delete.assert_not_called()
+    assert cache.get("FOO_a") is None
+    assert cache.get("FOO_b") == 2
 
 
 @pytest.mark.django_db
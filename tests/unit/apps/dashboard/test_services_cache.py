@@ -20,8 +20,13 @@ from extras.test_utils.factories import (
     ProgramFactory,
 )
 from hope.apps.dashboard.serializers import DashboardBaseSerializer
-from hope.apps.dashboard.services import GLOBAL_SLUG, DashboardDataCache, DashboardGlobalDataCache
-from hope.models import BusinessArea, Payment, PaymentPlan
+from hope.apps.dashboard.services import (
+    GLOBAL_SLUG,
+    DashboardDataCache,
+    DashboardGlobalDataCache,
+    get_changed_dashboard_years,
+)
+from hope.models import BusinessArea, Household, Payment, PaymentPlan
 
 
 @pytest.fixture
@@ -682,3 +687,20 @@ def test_partial_refresh_with_no_cache(afghanistan: BusinessArea, existing_ba_ca
     years_to_refresh_recent = [CURRENT_YEAR, CURRENT_YEAR - 1]
     refreshed_data = DashboardDataCache.refresh_data(ba_slug, years_to_refresh=years_to_refresh_recent)
     assert refreshed_data == [existing_ba_cache_data]
+
+
+@pytest.mark.django_db
+def test_get_changed_dashboard_years(afghanistan: BusinessArea, populate_dashboard_cache: Any) -> None:
+    household = populate_dashboard_cache(afghanistan)
+    populate_dashboard_cache(BusinessAreaFactory(slug="iraq", name="Iraq"))
+    Payment.objects.filter(household=household).update(
+        delivery_date=timezone.datetime(2023, 12, 30, tzinfo=dt_timezone.utc),
+        entitlement_date=None,
+        status_date=timezone.datetime(2024, 1, 2, tzinfo=dt_timezone.utc),
+    )
+    since = timezone.now()
+    assert get_changed_dashboard_years(since) == {}
+
+    Household.objects.filter(id=household.id).update(updated_at=since)
+
+    assert get_changed_dashboard_years(since) == {afghanistan.slug: {2023, 2024}}
@@ -1,9 +1,10 @@
-from datetime import date
+from datetime import UTC, date, datetime
 from typing import Callable
 from unittest.mock import Mock, call, patch
 
 from django.core.cache import cache
 from django.db import OperationalError
+from django.utils import timezone
 import pytest
 
 from extras.test_utils.factories import (
@@ -19,7 +20,7 @@ from hope.apps.dashboard.celery_tasks import (
     update_dashboard_figures,
     update_recent_dashboard_figures,
 )
-from hope.apps.dashboard.services import DashboardDataCache
+from hope.apps.dashboard.services import DASHBOARD_WATERMARK_CACHE_KEY, WATERMARK_OVERLAP, DashboardDataCache
 from hope.models import BusinessArea, Payment, PaymentPlan
 
 
@@ -378,3 +379,52 @@ def test_update_recent_dashboard_figures_no_active_bas(mock_ba_refresh: Mock, mo
 
     mock_ba_refresh.assert_not_called()
     mock_global_refresh.assert_called_once_with(years_to_refresh=years_to_refresh)
+
+
+@patch("hope.apps.dashboard.celery_tasks.DashboardGlobalDataCache.refresh_data")
+@patch("hope.apps.dashboard.celery_tasks.DashboardDataCache.refresh_data")
+def test_update_dashboard_figures_refreshes_only_changed_years(
+    mock_ba_refresh: Mock,
+    mock_global_refresh: Mock,
+    afghanistan: BusinessArea,
+    iraq: BusinessArea,
+    populate_dashboard_cache: Callable,
+) -> None:
+    BusinessArea.objects.exclude(slug__in=[afghanistan.slug, iraq.slug]).update(active=False)
+    populate_dashboard_cache(iraq)
+    cache.set(DASHBOARD_WATERMARK_CACHE_KEY, timezone.now() + WATERMARK_OVERLAP, None)
+    populate_dashboard_cache(afghanistan)
+    Payment.objects.filter(business_area=afghanistan).update(
+        delivery_date=datetime(2023, 5, 1, tzinfo=UTC),
+        entitlement_date=None,
+        status_date=datetime(2024, 1, 1, tzinfo=UTC),
+    )
+
+    started_at = timezone.now()
+    update_dashboard_figures.apply()
+
+    mock_ba_refresh.assert_called_once_with(afghanistan.slug, years_to_refresh=[2023, 2024])
+    mock_global_refresh.assert_called_once_with(years_to_refresh=[2023, 2024])
+    assert cache.get(DASHBOARD_WATERMARK_CACHE_KEY) >= started_at
+
+    # nothing changed since the previous run
+    mock_ba_refresh.reset_mock()
+    mock_global_refresh.reset_mock()
+    cache.set(DASHBOARD_WATERMARK_CACHE_KEY, timezone.now() + WATERMARK_OVERLAP, None)
+    update_dashboard_figures.apply()
+    mock_ba_refresh.assert_not_called()
+    mock_global_refresh.assert_not_called()
+
+
+@patch("hope.apps.dashboard.celery_tasks.DashboardGlobalDataCache.refresh_data")
+@patch("hope.apps.dashboard.celery_tasks.DashboardDataCache.refresh_data")
+def test_update_dashboard_figures_full_refresh_ignores_watermark(
+    mock_ba_refresh: Mock, mock_global_refresh: Mock, afghanistan: BusinessArea
+) -> None:
+    BusinessArea.objects.exclude(slug=afghanistan.slug).update(active=False)
+    cache.set(DASHBOARD_WATERMARK_CACHE_KEY, timezone.now() + WATERMARK_OVERLAP, None)
+
+    update_dashboard_figures.apply(kwargs={"full_refresh": True})
+
+    mock_ba_refresh.assert_called_once_with(afghanistan.slug)
+    mock_global_refresh.assert_called_once_with()
@@ -270,14 +270,14 @@ def test_list_areas_caching(api, geo_data, areas_list_url, grant_user_permission
 
     with CaptureQueriesContext(connection) as ctx:
         response = api.get(areas_list_url)
-        etag_initial = assert_cached_response(response, expected_queries=10)
-        assert len(ctx.captured_queries) == 10
+        etag_initial = assert_cached_response(response, expected_queries=9)
+        assert len(ctx.captured_queries) == 9
 
     # Test that reoccurring requests use cached data
     with CaptureQueriesContext(connection) as ctx:
         response = api.get(areas_list_url)
-        etag_second = assert_cached_response(response, expected_queries=5)
-        assert len(ctx.captured_queries) == 5
+        etag_second = assert_cached_response(response, expected_queries=4)
+        assert len(ctx.captured_queries) == 4
         assert etag_second == etag_initial
 
     # After update of area, it does not use the cached data
@@ -288,8 +288,8 @@ def test_list_areas_caching(api, geo_data, areas_list_url, grant_user_permission
 
     with CaptureQueriesContext(connection) as ctx:
         response = api.get(areas_list_url)
-        etag_after_area_update = assert_cached_response(response, expected_queries=6)
-        assert len(ctx.captured_queries) == 6
+        etag_after_area_update = assert_cached_response(response, expected_queries=5)
+        assert len(ctx.captured_queries) == 5
         assert etag_after_area_update != etag_initial
 
     # After removing area_type, it does not use the cached data
@@ -299,8 +299,8 @@ def test_list_areas_caching(api, geo_data, areas_list_url, grant_user_permission
 
     with CaptureQueriesContext(connection) as ctx:
         response = api.get(areas_list_url)
-        etag_after_area_type_delete = assert_cached_response(response, expected_queries=6)
-        assert len(ctx.captured_queries) == 6
+        etag_after_area_type_delete = assert_cached_response(response, expected_queries=5)
+        assert len(ctx.captured_queries) == 5
         assert etag_after_area_type_delete != etag_after_area_update
 
     # After removing country, it does not use the cached data
@@ -310,15 +310,15 @@ def test_list_areas_caching(api, geo_data, areas_list_url, grant_user_permission
 
     with CaptureQueriesContext(connection) as ctx:
         response = api.get(areas_list_url)
-        etag_after_country_delete = assert_cached_response(response, expected_queries=6)
-        assert len(ctx.captured_queries) == 6
+        etag_after_country_delete = assert_cached_response(response, expected_queries=5)
+        assert len(ctx.captured_queries) == 5
         assert etag_after_country_delete != etag_after_area_type_delete
 
     # Cached data again
     with CaptureQueriesContext(connection) as ctx:
         response = api.get(areas_list_url)
-        etag_cached_again = assert_cached_response(response, expected_queries=5)
-        assert len(ctx.captured_queries) == 5
+        etag_cached_again = assert_cached_response(response, expected_queries=4)
+        assert len(ctx.captured_queries) == 4
         assert etag_cached_again == etag_after_country_delete
 
     # Different filter - does not use cached data
@@ -63,6 +63,7 @@ from hope.apps.registration_data.api.deduplication_engine import IgnoredFilename
 from hope.models import (
     DeduplicationEngineSimilarityPair,
     Document,
+    ElasticsearchIndexQueue,
     FlexibleAttribute,
     IndividualRoleInHousehold,
 )
@@ -1014,37 +1015,34 @@ def test_save_images_image_field_with_unsupported_value_type() -> None:
 @override_config(IS_ELASTICSEARCH_ENABLED=False)
 def test_update_es_returns_early_when_disabled(program: Any, mocker: Any) -> None:
     individual = IndividualFactory(program=program, business_area=program.business_area)
-    mock_individual_doc = mocker.patch("hope.apps.grievance.services.data_change.utils.get_individual_doc")
-    mock_household_doc = mocker.patch("hope.apps.grievance.services.data_change.utils.get_household_doc")
+    mock_enqueue = mocker.patch("hope.apps.grievance.services.data_change.utils.enqueue_for_indexing")
 
     update_es(individual)
 
-    mock_individual_doc.assert_not_called()
-    mock_household_doc.assert_not_called()
+    mock_enqueue.assert_not_called()
 
 
 @override_config(IS_ELASTICSEARCH_ENABLED=True)
 def test_update_es_indexes_individual_without_household(program: Any, mocker: Any) -> None:
     individual = IndividualFactory(program=program, business_area=program.business_area)
-    mock_individual_doc = mocker.patch("hope.apps.grievance.services.data_change.utils.get_individual_doc")
-    mock_household_doc = mocker.patch("hope.apps.grievance.services.data_change.utils.get_household_doc")
+    mock_enqueue = mocker.patch("hope.apps.grievance.services.data_change.utils.enqueue_for_indexing")
 
     update_es(individual)
 
-    mock_individual_doc.assert_called_once_with(str(individual.program.id))
-    mock_individual_doc.return_value.return_value.update.assert_called_once_with(individual)
-    mock_household_doc.assert_not_called()
+    mock_enqueue.assert_called_once_with(
+        ElasticsearchIndexQueue.DocumentType.INDIVIDUAL, individual.program_id, [individual.pk]
+    )
 
 
 @override_config(IS_ELASTICSEARCH_ENABLED=True)
 def test_update_es_indexes_individual_and_household(program: Any, mocker: Any) -> None:
     household = HouseholdFactory(program=program, business_area=program.business_area, create_role=False)
     individual = household.head_of_household
-    mock_individual_doc = mocker.patch("hope.apps.grievance.services.data_change.utils.get_individual_doc")
-    mock_household_doc = mocker.patch("hope.apps.grievance.services.data_change.utils.get_household_doc")
+    mock_enqueue = mocker.patch("hope.apps.grievance.services.data_change.utils.enqueue_for_indexing")
 
     update_es(individual)
 
-    mock_individual_doc.assert_called_once_with(str(individual.program.id))
-    mock_household_doc.assert_called_once_with(str(individual.program.id))
-    mock_household_doc.return_value.return_value.update.assert_called_once_with(individual.household)
+    assert mock_enqueue.call_args_list == [
+        mocker.call(ElasticsearchIndexQueue.DocumentType.INDIVIDUAL, individual.program_id, [individual.pk]),
+        mocker.call(ElasticsearchIndexQueue.DocumentType.HOUSEHOLD, individual.program_id, [household.pk]),
+    ]
@@ -1,4 +1,6 @@
 from datetime import date
+from types import SimpleNamespace
+from uuid import uuid4
 
 from django.core.cache import cache
 from django.test import TestCase
@@ -6,6 +8,7 @@ from django.utils import timezone
 import pytest
 
 from extras.test_utils.factories import (
+    AreaFactory,
     BusinessAreaFactory,
     HouseholdFactory,
     IndividualFactory,
@@ -13,13 +16,17 @@ from extras.test_utils.factories import (
     RegistrationDataImportFactory,
 )
 from hope.apps.household.api.caches import (
+    ALL_PARTITIONS,
+    HOUSEHOLD_LIST_PARTITION_KEY,
+    INDIVIDUAL_LIST_PARTITION_KEY,
     get_household_list_program_key,
     get_individual_list_program_key,
+    get_request_list_partition,
     invalidate_household_and_individual_list_cache,
     invalidate_household_list_cache,
     invalidate_individual_list_cache,
 )
-from hope.models import BusinessArea, Household, Individual, Program
+from hope.models import Area, BusinessArea, Household, Individual, Program
 
 pytestmark = pytest.mark.django_db
 
@@ -42,6 +49,28 @@ def programs(business_area: BusinessArea) -> dict[str, Program]:
     }
 
 
+@pytest.fixture
+def areas() -> dict[str, Area]:
+    admin1 = AreaFactory(p_code="AF01")
+    return {
+        "admin1": admin1,
+        "area_a": AreaFactory(parent=admin1, p_code="AF0101"),
+        "area_b": AreaFactory(parent=admin1, p_code="AF0102"),
+    }
+
+
+def get_partition_version(key: str, program: Program, partition: str) -> int:
+    return cache.get(key.format(program_id=program.id, partition=partition), 0)
+
+
+def get_admin2_versions(key: str, program: Program, areas: dict[str, Area]) -> tuple[int, int, int]:
+    return (
+        get_partition_version(key, program, f"admin2:{areas['area_a'].id}"),
+        get_partition_version(key, program, f"admin2:{areas['area_b'].id}"),
+        get_partition_version(key, program, ALL_PARTITIONS),
+    )
+
+
 def test_household_save_increments_cache(program: Program) -> None:
     cache.clear()
 
@@ -321,3 +350,77 @@ def test_invalidate_helpers_do_not_affect_other_programs(programs: dict[str, Pro
 
     assert get_household_list_program_key(program2.id) == initial_hh_p2
     assert get_individual_list_program_key(program2.id) == initial_ind_p2
+
+
+def test_household_save_increments_only_its_area_partitions(program: Program, areas: dict[str, Area]) -> None:
+    household = HouseholdFactory(
+        program=program, business_area=program.business_area, admin1=areas["admin1"], admin2=areas["area_a"]
+    )
+    cache.clear()
+
+    with TestCase.captureOnCommitCallbacks(execute=True):
+        household.size = 5
+        household.save(update_fields=["size"])
+
+    assert get_admin2_versions(HOUSEHOLD_LIST_PARTITION_KEY, program, areas) == (1, 0, 0)
+    assert get_partition_version(HOUSEHOLD_LIST_PARTITION_KEY, program, f"admin1:{areas['admin1'].id}") == 1
+    assert get_admin2_versions(INDIVIDUAL_LIST_PARTITION_KEY, program, areas) == (0, 0, 0)
+
+
+def test_household_move_increments_both_area_partitions(program: Program, areas: dict[str, Area]) -> None:
+    household_id = HouseholdFactory(
+        program=program, business_area=program.business_area, admin1=areas["admin1"], admin2=areas["area_a"]
+    ).id
+    household = Household.objects.get(id=household_id)
+    cache.clear()
+
+    with TestCase.captureOnCommitCallbacks(execute=True):
+        household.admin2 = areas["area_b"]
+        household.save()
+
+    assert get_admin2_versions(HOUSEHOLD_LIST_PARTITION_KEY, program, areas) == (1, 1, 0)
+    assert get_admin2_versions(INDIVIDUAL_LIST_PARTITION_KEY, program, areas) == (1, 1, 0)
+
+
+def test_individual_save_increments_its_household_area_partitions(program: Program, areas: dict[str, Area]) -> None:
+    household = HouseholdFactory(
+        program=program, business_area=program.business_area, admin1=areas["admin1"], admin2=areas["area_b"]
+    )
+    individual = Individual.objects.get(id=household.head_of_household_id)
+    cache.clear()
+
+    with TestCase.captureOnCommitCallbacks(execute=True):
+        individual.full_name = "Updated"
+        individual.save()
+
+    assert get_admin2_versions(HOUSEHOLD_LIST_PARTITION_KEY, program, areas) == (0, 1, 0)
+    assert get_admin2_versions(INDIVIDUAL_LIST_PARTITION_KEY, program, areas) == (0, 1, 0)
+
+
+def test_invalidate_helpers_increment_partitions_of_given_households(program: Program, areas: dict[str, Area]) -> None:
+    household = HouseholdFactory(
+        program=program, business_area=program.business_area, admin1=areas["admin1"], admin2=areas["area_a"]
+    )
+    cache.clear()
+
+    with TestCase.captureOnCommitCallbacks(execute=True):
+        invalidate_household_and_individual_list_cache(program.id, [household])
+    assert get_admin2_versions(HOUSEHOLD_LIST_PARTITION_KEY, program, areas) == (1, 0, 0)
+    assert get_admin2_versions(INDIVIDUAL_LIST_PARTITION_KEY, program, areas) == (1, 0, 0)
+
+    with TestCase.captureOnCommitCallbacks(execute=True):
+        invalidate_household_list_cache(program.id)
+    assert get_admin2_versions(HOUSEHOLD_LIST_PARTITION_KEY, program, areas) == (1, 0, 1)
+
+
+def test_request_list_partition_uses_canonical_area_id() -> None:
+    area_id = uuid4()
+
+    def partition(**query_params: str) -> str | None:
+        return get_request_list_partition(SimpleNamespace(query_params=query_params))
+
+    assert partition(admin2=str(area_id).upper()) == f"admin2:{area_id}"
+    assert partition(admin1=area_id.hex) == f"admin1:{area_id}"
+    assert partition(admin1=str(uuid4()), admin2=str(area_id)) == f"admin2:{area_id}"
+    assert partition(admin2="not-an-id") is None
+    assert partition() is None
@@ -6,7 +6,9 @@ import pytest
 from extras.test_utils.factories import HouseholdFactory, IndividualFactory, PaymentPlanPurposeFactory, ProgramFactory
 from hope.apps.household.const import IDP, REFUGEE
 from hope.apps.household.documents import get_household_doc, get_individual_doc
-from hope.models import Program
+from hope.apps.household.services.index_queue import flush_index_queue
+from hope.models import ElasticsearchIndexQueue, Program
+from hope.models.utils import MergeStatusModel
 
 pytestmark = [
     pytest.mark.usefixtures("django_elasticsearch_setup"),
@@ -19,6 +21,7 @@ def _es_count(index_name: str) -> int:
     es = Elasticsearch(settings.ELASTICSEARCH_HOST)
     if not es.indices.exists(index=index_name):
         return -1
+    flush_index_queue()
     es.indices.refresh(index=index_name)
     return es.count(index=index_name)["count"]
 
@@ -119,12 +122,14 @@ def test_individual_update_reflects_in_document():
     index_name = _ind_index(program)
     individual = IndividualFactory(program=program, given_name="OldName")
     es = Elasticsearch(settings.ELASTICSEARCH_HOST)
+    flush_index_queue()
     es.indices.refresh(index=index_name)
     doc = es.get(index=index_name, id=str(individual.id))
     assert doc["_source"]["given_name"] == "OldName"
 
     individual.given_name = "NewName"
     individual.save()
+    flush_index_queue()
     es.indices.refresh(index=index_name)
     doc = es.get(index=index_name, id=str(individual.id))
     assert doc["_source"]["given_name"] == "NewName"
@@ -189,12 +194,14 @@ def test_household_update_reflects_in_document():
     index_name = _hh_index(program)
     household = HouseholdFactory(program=program, residence_status=REFUGEE)
     es = Elasticsearch(settings.ELASTICSEARCH_HOST)
+    flush_index_queue()
     es.indices.refresh(index=index_name)
     doc = es.get(index=index_name, id=str(household.id))
     assert doc["_source"]["residence_status"] == REFUGEE
 
     household.residence_status = IDP
     household.save()
+    flush_index_queue()
     es.indices.refresh(index=index_name)
     doc = es.get(index=index_name, id=str(household.id))
     assert doc["_source"]["residence_status"] == IDP
@@ -208,3 +215,59 @@ def test_sync_household_skipped_when_program_not_active():
     hh.residence_status = REFUGEE
     hh.save()
     assert not _index_exists(_ind_index(program))
+
+
+@override_config(IS_ELASTICSEARCH_ENABLED=True)
+def test_saves_are_queued_until_flush():
+    program = _create_and_activate_program()
+    index_name = _ind_index(program)
+    individual = IndividualFactory(program=program)
+    individual.save()
+    es = Elasticsearch(settings.ELASTICSEARCH_HOST)
+    es.indices.refresh(index=index_name)
+
+    assert es.count(index=index_name)["count"] == 0
+    assert ElasticsearchIndexQueue.objects.filter(object_id=individual.id).count() >= 2
+
+    flush_index_queue()
+
+    assert not ElasticsearchIndexQueue.objects.exists()
+    es.indices.refresh(index=index_name)
+    assert es.count(index=index_name)["count"] == 1
+
+
+@override_config(IS_ELASTICSEARCH_ENABLED=True)
+def test_flush_limited_to_object_ids():
+    program = _create_and_activate_program()
+    index_name = _ind_index(program)
+    flushed = IndividualFactory(program=program)
+    queued = IndividualFactory(program=program)
+
+    flush_index_queue(str(program.id), object_ids=[flushed.id])
+
+    assert not ElasticsearchIndexQueue.objects.filter(object_id=flushed.id).exists()
+    assert ElasticsearchIndexQueue.objects.filter(object_id=queued.id).exists()
+    es = Elasticsearch(settings.ELASTICSEARCH_HOST)
+    es.indices.refresh(index=index_name)
+    assert es.exists(index=index_name, id=str(flushed.id))
+    assert not es.exists(index=index_name, id=str(queued.id))
+
+
+@override_config(IS_ELASTICSEARCH_ENABLED=True)
+def test_pending_household_is_not_indexed_until_merged():
+    program = _create_and_activate_program()
+    index_name = _hh_index(program)
+    household = HouseholdFactory(program=program, rdi_merge_status=MergeStatusModel.PENDING)
+    assert _es_count(index_name) == 0
+
+    household.rdi_merge_status = MergeStatusModel.MERGED
+    household.save()
+    assert _es_count(index_name) == 1
+
+
+@override_config(IS_ELASTICSEARCH_ENABLED=True)
+def test_pending_individual_is_indexed():
+    program = _create_and_activate_program()
+    index_name = _ind_index(program)
+    IndividualFactory(program=program, rdi_merge_status=MergeStatusModel.PENDING)
+    assert _es_count(index_name) == 1
@@ -24,7 +24,7 @@ from extras.test_utils.factories import (
 from hope.apps.account.permissions import Permissions
 from hope.apps.core.exceptions import SearchError
 from hope.apps.household.const import HOST, REFUGEE, ROLE_PRIMARY
-from hope.apps.household.filters import HouseholdFilter
+from hope.apps.household.filters import HouseholdFilter, _filter_by_es_hits
 from hope.apps.utils.elasticsearch_utils import rebuild_search_index
 from hope.models import Household, Program
 from hope.models.utils import MergeStatusModel
@@ -1088,6 +1088,20 @@ def test_search_db_no_program_filter(
     assert str(expected_results[1].id) in result_ids
 
 
+def test_filter_by_es_hits_keeps_relevance_order(household_filter_search_context: dict[str, Any]) -> None:
+    program = household_filter_search_context["program"]
+    household1 = HouseholdFactory(program=program, business_area=program.business_area)
+    household2 = HouseholdFactory(program=program, business_area=program.business_area)
+    es_ids = [str(household2.id), str(household1.id)]
+
+    qs = _filter_by_es_hits(Household.objects.all(), es_ids, {})
+
+    assert list(qs) == [household2, household1]
+    assert "DISTINCT" not in str(qs.query)
+    sorted_qs = _filter_by_es_hits(Household.objects.order_by("unicef_id"), es_ids, {"order_by": "unicef_id"})
+    assert list(sorted_qs) == sorted([household1, household2], key=lambda household: household.unicef_id)
+
+
 def test_filter_detail_id_requires_numeric(household_filter_search_context: dict[str, Any]) -> None:
     household_filter = HouseholdFilter(data={}, queryset=Household.objects.all(), request=None)
 
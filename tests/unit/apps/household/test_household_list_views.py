@@ -30,11 +30,12 @@ from extras.test_utils.factories import (
     SurveyFactory,
     UserFactory,
 )
+from hope.api.caches import get_cache_response_stats
 from hope.apps.account.permissions import Permissions
 from hope.apps.core.utils import resolve_flex_fields_choices_to_string
 from hope.apps.household.api.caches import get_household_list_program_key
 from hope.apps.household.const import DUPLICATE, ROLE_PRIMARY
-from hope.models import FlexibleAttribute, Payment, Program
+from hope.models import FlexibleAttribute, Household, Payment, Program
 
 pytestmark = pytest.mark.django_db
 
@@ -355,7 +356,7 @@ def test_household_list_caching(
         etag = response.headers["etag"]
         assert json.loads(cache.get(etag)[0].decode("utf8")) == response.json()
         assert len(response.json()["results"]) == 2
-        assert len(ctx.captured_queries) == 16
+        assert len(ctx.captured_queries) == 13
 
     with CaptureQueriesContext(connection) as ctx:
         response = household_list_context["api_client"].get(household_list_context["list_url"])
@@ -363,7 +364,7 @@ def test_household_list_caching(
         assert response.has_header("etag")
         etag_second_call = response.headers["etag"]
         assert etag == etag_second_call
-        assert len(ctx.captured_queries) == 8
+        assert len(ctx.captured_queries) == 6
 
     household_list_context["household1"].children_count = 100
     version_before_save = get_household_list_program_key(household_list_context["program"].id)
@@ -378,7 +379,7 @@ def test_household_list_caching(
         etag_third_call = response.headers["etag"]
         assert json.loads(cache.get(etag_third_call)[0].decode("utf8")) == response.json()
         assert etag_third_call not in [etag, etag_second_call]
-        assert len(ctx.captured_queries) == 11
+        assert len(ctx.captured_queries) == 9
 
     set_admin_area_limits_in_program(
         household_list_context["partner"],
@@ -392,7 +393,7 @@ def test_household_list_caching(
         etag_changed_areas = response.headers["etag"]
         assert json.loads(cache.get(etag_changed_areas)[0].decode("utf8")) == response.json()
         assert etag_changed_areas not in [etag, etag_second_call, etag_third_call]
-        assert len(ctx.captured_queries) == 11
+        assert len(ctx.captured_queries) == 9
 
     version_before_delete = get_household_list_program_key(household_list_context["program"].id)
     with TestCase.captureOnCommitCallbacks(execute=True):
@@ -406,7 +407,7 @@ def test_household_list_caching(
         etag_fourth_call = response.headers["etag"]
         assert len(response.json()["results"]) == 1
         assert etag_fourth_call not in [etag, etag_second_call, etag_third_call, etag_changed_areas]
-        assert len(ctx.captured_queries) == 11
+        assert len(ctx.captured_queries) == 9
 
     with CaptureQueriesContext(connection) as ctx:
         response = household_list_context["api_client"].get(household_list_context["list_url"])
@@ -414,7 +415,56 @@ def test_household_list_caching(
         assert response.has_header("etag")
         etag_fifth_call = response.headers["etag"]
         assert etag_fifth_call == etag_fourth_call
-        assert len(ctx.captured_queries) == 8
+        assert len(ctx.captured_queries) == 6
+
+
+def test_household_list_filtered_by_area_survives_changes_in_other_areas(
+    household_list_context: dict[str, Any],
+    create_user_role_with_permissions: Any,
+) -> None:
+    create_user_role_with_permissions(
+        user=household_list_context["user"],
+        permissions=[Permissions.RDI_VIEW_DETAILS],
+        business_area=household_list_context["afghanistan"],
+        program=household_list_context["program"],
+    )
+    other_area = AreaFactory(
+        parent=household_list_context["area1"], p_code="AF0102", area_type=household_list_context["area2"].area_type
+    )
+    household_other_area = HouseholdFactory(
+        admin1=household_list_context["area1"],
+        admin2=other_area,
+        country_origin=household_list_context["country"],
+        program=household_list_context["program"],
+        business_area=household_list_context["afghanistan"],
+    )
+    api_client = household_list_context["api_client"]
+    list_url = household_list_context["list_url"]
+    area2_filter = {"admin2": str(household_list_context["area2"].id)}
+
+    response = api_client.get(list_url, area2_filter)
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()["results"]) == 2
+    etag = response.headers["etag"]
+
+    with TestCase.captureOnCommitCallbacks(execute=True):
+        household_other_area.size = 5
+        household_other_area.save(update_fields=["size"])
+
+    response = api_client.get(list_url, area2_filter)
+    assert response.headers["etag"] == etag
+    assert get_cache_response_stats("HouseholdViewSet.list") == {"hit": 1, "miss": 1}
+
+    # moving a household out of the area invalidates the filtered list
+    household1 = Household.objects.get(id=household_list_context["household1"].id)
+    with TestCase.captureOnCommitCallbacks(execute=True):
+        household1.admin2 = other_area
+        household1.save()
+
+    response = api_client.get(list_url, area2_filter)
+    assert response.headers["etag"] != etag
+    assert [result["id"] for result in response.json()["results"]] == [str(household_list_context["household2"].id)]
+    assert get_cache_response_stats("HouseholdViewSet.list") == {"hit": 1, "miss": 2}
 
 
 def test_household_all_flex_fields_attributes(
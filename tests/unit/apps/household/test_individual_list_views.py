@@ -396,7 +396,7 @@ def test_individual_list_caching(
         etag = response.headers["etag"]
         assert json.loads(cache.get(etag)[0].decode("utf8")) == response.json()
         assert len(response.json()["results"]) == 4
-        assert len(captured.captured_queries) == 18
+        assert len(captured.captured_queries) == 15
 
     with CaptureQueriesContext(connection) as captured:
         response = ctx["client"].get(ctx["list_url"])
@@ -404,7 +404,7 @@ def test_individual_list_caching(
         assert response.has_header("etag")
         etag_second = response.headers["etag"]
         assert etag_second == etag
-        assert len(captured.captured_queries) == 8
+        assert len(captured.captured_queries) == 6
 
     ctx["individual1_1"].given_name = "Jane"
     hh_version_before_save = get_household_list_program_key(ctx["program"].id)
@@ -419,7 +419,7 @@ def test_individual_list_caching(
         etag_third = response.headers["etag"]
         assert json.loads(cache.get(etag_third)[0].decode("utf8")) == response.json()
         assert etag_third not in [etag, etag_second]
-        assert len(captured.captured_queries) == 13
+        assert len(captured.captured_queries) == 11
 
     set_admin_area_limits_in_program(ctx["partner"], ctx["program"], [ctx["area1"]])
     with CaptureQueriesContext(connection) as captured:
@@ -428,7 +428,7 @@ def test_individual_list_caching(
         etag_changed_areas = response.headers["etag"]
         assert json.loads(cache.get(etag_changed_areas)[0].decode("utf8")) == response.json()
         assert etag_changed_areas not in [etag, etag_second, etag_third]
-        assert len(captured.captured_queries) == 13
+        assert len(captured.captured_queries) == 11
 
     hh_version_before_delete = get_household_list_program_key(ctx["program"].id)
     ind_version_before_delete = get_individual_list_program_key(ctx["program"].id)
@@ -442,13 +442,13 @@ def test_individual_list_caching(
         etag_fourth = response.headers["etag"]
         assert len(response.json()["results"]) == 3
         assert etag_fourth not in [etag, etag_second, etag_third, etag_changed_areas]
-        assert len(captured.captured_queries) == 13
+        assert len(captured.captured_queries) == 11
 
     with CaptureQueriesContext(connection) as captured:
         response = ctx["client"].get(ctx["list_url"])
         assert response.status_code == status.HTTP_200_OK
         assert response.headers["etag"] == etag_fourth
-        assert len(captured.captured_queries) == 8
+        assert len(captured.captured_queries) == 6
 
 
 def test_individual_list_deduplication_result_serializer(
@@ -24,6 +24,7 @@ from hope.apps.household.celery_tasks import (
     cleanup_indexes_in_inactive_programs_async_task_action,
     enroll_households_to_program_async_task,
     enroll_households_to_program_async_task_action,
+    flush_elasticsearch_index_queue_async_task,
     interval_recalculate_population_fields_async_task,
     interval_recalculate_population_fields_async_task_action,
     mass_unwithdraw_households_async_task,
@@ -37,7 +38,15 @@ from hope.apps.household.celery_tasks import (
     revalidate_phone_number_async_task_action,
 )
 from hope.apps.household.const import ROLE_PRIMARY
-from hope.models import AsyncJob, Document, Household, IndividualIdentity, PeriodicAsyncJob, Program
+from hope.models import (
+    AsyncJob,
+    Document,
+    ElasticsearchIndexQueue,
+    Household,
+    IndividualIdentity,
+    PeriodicAsyncJob,
+    Program,
+)
 from hope.models.utils import MergeStatusModel
 
 pytestmark = pytest.mark.django_db
@@ -302,6 +311,25 @@ def test_cleanup_inactive_program_indexes_task_schedules_async_job(mock_queue, d
     mock_queue.assert_called_once_with()
 
 
+@patch.object(PeriodicAsyncJob, "queue")
+def test_flush_elasticsearch_index_queue_task_schedules_async_job(mock_queue, django_capture_on_commit_callbacks):
+    program = ProgramFactory()
+    with django_capture_on_commit_callbacks(execute=True):
+        flush_elasticsearch_index_queue_async_task()
+    assert not PeriodicAsyncJob.objects.exists()
+
+    ElasticsearchIndexQueue.objects.create(
+        program=program, document_type=ElasticsearchIndexQueue.DocumentType.INDIVIDUAL, object_id=uuid.uuid4()
+    )
+    with django_capture_on_commit_callbacks(execute=True):
+        flush_elasticsearch_index_queue_async_task()
+
+    job = PeriodicAsyncJob.objects.get()
+    assert job.action == "hope.apps.household.celery_tasks.flush_elasticsearch_index_queue_async_task_action"
+    assert job.group_key == "household"
+    mock_queue.assert_called_once_with()
+
+
 @patch.object(AsyncJob, "queue")
 def test_recalculate_population_fields_chunk_task_schedules_async_job(mock_queue, django_capture_on_commit_callbacks):
     with django_capture_on_commit_callbacks(execute=True):
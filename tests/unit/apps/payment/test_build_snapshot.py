@@ -1,16 +1,23 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 import pytest
 
 from extras.test_utils.factories import (
     AccountFactory,
     AccountTypeFactory,
     DeliveryMechanismFactory,
+    DocumentFactory,
     FinancialServiceProviderFactory,
     HouseholdFactory,
     PaymentFactory,
     PaymentPlanFactory,
+    TicketNeedsAdjudicationDetailsFactory,
 )
 from hope.apps.payment.services import payment_household_snapshot_service
-from hope.apps.payment.services.payment_household_snapshot_service import create_payment_plan_snapshot_data
+from hope.apps.payment.services.payment_household_snapshot_service import (
+    bulk_create_payment_snapshot_data,
+    create_payment_plan_snapshot_data,
+)
 from hope.models import MergeStatusModel
 
 pytestmark = pytest.mark.django_db
@@ -131,3 +138,34 @@ def test_batching(batch_payment_plan, batch_payments, monkeypatch) -> None:
     create_payment_plan_snapshot_data(batch_payment_plan)
 
     assert batch_payment_plan.payment_items.filter(household_snapshot__isnull=False).count() == len(batch_payments)
+
+
+def test_snapshot_needs_adjudication_counts_roles_and_documents(payment_plan, payments, household_one) -> None:
+    head = household_one.head_of_household
+    DocumentFactory(individual=head, program=head.program)
+    TicketNeedsAdjudicationDetailsFactory(golden_records_individual=head)
+    TicketNeedsAdjudicationDetailsFactory().possible_duplicates.add(head)
+
+    create_payment_plan_snapshot_data(payment_plan)
+
+    payments[0].refresh_from_db()
+    snapshot_data = payments[0].household_snapshot.snapshot_data
+    head_data = next(x for x in snapshot_data["individuals"] if x["id"] == str(head.id))
+    assert head_data["needs_adjudication_tickets_count"] == 2
+    assert snapshot_data["needs_adjudication_tickets_count"] == 2
+    assert [document["type"] for document in head_data["documents"]] == [head.documents.first().type.key]
+    assert [role["individual"]["id"] for role in snapshot_data["roles"]] == [str(head.id)]
+    assert snapshot_data["primary_collector"]["id"] == str(head.id)
+    assert "alternate_collector" not in snapshot_data
+
+
+def test_snapshot_queries_do_not_depend_on_page_size(batch_payment_plan, batch_payments, monkeypatch) -> None:
+    monkeypatch.setattr(payment_household_snapshot_service, "page_size", 2)
+    with CaptureQueriesContext(connection) as small_page:
+        bulk_create_payment_snapshot_data([payment.id for payment in batch_payments[:2]])
+
+    monkeypatch.setattr(payment_household_snapshot_service, "page_size", 10)
+    with CaptureQueriesContext(connection) as large_page:
+        bulk_create_payment_snapshot_data([payment.id for payment in batch_payments[2:12]])
+
+    assert len(large_page.captured_queries) == len(small_page.captured_queries)
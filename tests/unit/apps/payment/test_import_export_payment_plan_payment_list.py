@@ -10,6 +10,7 @@ from django.conf import settings
 from django.contrib.admin.options import get_content_type_for_model
 from django.core.files import File
 from django.urls import reverse
+from openpyxl import load_workbook
 import pytest
 
 from extras.test_utils.factories.account import RoleAssignmentFactory, RoleFactory, UserFactory
@@ -629,6 +630,28 @@ def test_export_payment_plan_payment_list(payment_plan, payments, user):
     assert wb.active["N2"].value == "Test_Number_National_Id_123"
 
 
+def test_export_payment_plan_payment_list_streams_same_cells_as_in_memory_workbook(payment_plan, payments, user):
+    export_service = XlsxPaymentPlanExportService(payment_plan)
+    export_service.save_xlsx_file(user)
+    payment_plan.refresh_from_db()
+
+    in_memory = BytesIO()
+    export_service.generate_workbook().save(in_memory)
+    in_memory.seek(0)
+    expected = load_workbook(in_memory).active
+    with payment_plan.export_file_entitlement.file.open("rb") as file:
+        saved = load_workbook(BytesIO(file.read())).active
+
+    def dump(ws: Any) -> list:
+        return [[(c.value, c.fill.fill_type, c.border.left.style) for c in row] for row in ws.iter_rows()]
+
+    assert saved.title == expected.title
+    assert dump(saved) == dump(expected)
+    assert {k: v.width for k, v in saved.column_dimensions.items()} == {
+        k: v.width for k, v in expected.column_dimensions.items()
+    }
+
+
 def test_payment_row_flex_fields(payment_plan, fsp, payments, flex_decimal_attribute, flex_date_attribute):
     core_fields = [
         "account_holder_name",
@@ -18,6 +18,7 @@ from hope.models import (
     DeliveryMechanismConfig,
     FinancialInstitution,
     FspNameMapping,
+    Individual,
     MergeStatusModel,
     PaymentDataCollector,
 )
@@ -409,3 +410,69 @@ def test_delivery_data_uses_existing_service_provider_code_when_financial_instit
         "financial_institution_name": str(account_setup["financial_institution"].name),
         "financial_institution_pk": str(account_setup["financial_institution"].id),
     }
+
+
+def test_validate_accounts_matches_validate_account(account_setup, django_assert_num_queries):
+    fsp = account_setup["fsp"]
+    collector = account_setup["individual"]
+    collector_2 = account_setup["individual_2"]
+    financial_institution = account_setup["financial_institution"]
+    financial_institution.country = CountryFactory()
+    financial_institution.save(update_fields=["country"])
+    country = CountryFactory()
+    account_setup["household"].country = country
+    account_setup["household"].save(update_fields=["country"])
+    DeliveryMechanismConfig.objects.create(
+        fsp=fsp,
+        delivery_mechanism=account_setup["dm_atm_card"],
+        country=country,
+        required_fields=["service_provider_code", "expiry_date"],
+    )
+    AccountFactory(
+        number="test",
+        data={"expiry_date": "12.12.2024"},
+        individual=collector,
+        account_type=account_setup["account_type_bank"],
+        financial_institution=financial_institution,
+        rdi_merge_status=MergeStatusModel.MERGED,
+    )
+    AccountFactory(
+        number="test-2",
+        data={},
+        individual=collector_2,
+        account_type=account_setup["account_type_bank"],
+        financial_institution=financial_institution,
+        rdi_merge_status=MergeStatusModel.MERGED,
+    )
+    FinancialInstitutionMappingFactory(
+        financial_institution=financial_institution,
+        financial_service_provider=fsp,
+        code="WOOP-WU",
+    )
+    collectors = list(Individual.objects.select_related("household").filter(pk__in=[collector.pk, collector_2.pk]))
+
+    # configs, accounts, financial institution codes and fsp name mappings
+    with django_assert_num_queries(4):
+        result = PaymentDataCollector.validate_accounts(fsp, account_setup["dm_atm_card"], collectors)
+
+    assert result == {collector.pk: True, collector_2.pk: False}
+    assert result == {
+        c.pk: PaymentDataCollector.validate_account(fsp, account_setup["dm_atm_card"], c) for c in collectors
+    }
+
+
+def test_validate_accounts_without_account_type_or_config(account_setup, django_assert_num_queries):
+    fsp = account_setup["fsp"]
+    collector = account_setup["individual"]
+
+    with django_assert_num_queries(0):
+        assert PaymentDataCollector.validate_accounts(fsp, account_setup["dm_cash"], [collector]) == {
+            collector.pk: True
+        }
+
+    dm_without_config = DeliveryMechanismFactory(
+        code="atm_card_no_config",
+        name="ATM Card No Config",
+        account_type=account_setup["account_type_bank"],
+    )
+    assert PaymentDataCollector.validate_accounts(fsp, dm_without_config, [collector]) == {collector.pk: True}
@@ -746,6 +746,74 @@ def test_get_hope_status(payment_gateway_setup: dict) -> None:
     assert record.get_hope_status(Decimal("1000000.00")) == Payment.STATUS_ERROR
 
 
+@mock.patch(
+    "hope.apps.payment.services.payment_gateway.get_quantity_in_usd",
+    return_value=Decimal("50.00"),
+)
+def test_update_payments_indexes_records_and_bulk_updates(
+    get_quantity_in_usd_mock: Any,
+    payment_gateway_setup: dict,
+    django_assert_num_queries: Any,
+) -> None:
+    payment_1, payment_2 = payment_gateway_setup["payments"]
+    payment_plan = payment_gateway_setup["payment_plan"]
+    split_1, _ = payment_gateway_setup["splits"]
+    extra_payment = PaymentFactory(
+        parent=payment_plan,
+        parent_split=split_1,
+        status=Payment.STATUS_PENDING,
+        delivered_quantity=None,
+        entitlement_quantity=Decimal("100.00"),
+    )
+
+    def record(remote_id: str, status: str, auth_code: str) -> PaymentRecordData:
+        return PaymentRecordData(
+            id=1,
+            remote_id=remote_id,
+            created="2023-10-10",
+            modified="2023-10-11",
+            record_code="1",
+            parent="1",
+            status=status,
+            auth_code=auth_code,
+            payout_amount=100.0,
+            fsp_code="1",
+        )
+
+    pg_payment_records = [
+        record(str(payment_2.id), "TRANSFERRED_TO_FSP", "2"),
+        record(str(payment_1.id), "TRANSFERRED_TO_BENEFICIARY", "1"),
+        record(str(payment_1.id), "ERROR", "duplicate"),
+    ]
+
+    updated_before = extra_payment.updated_at
+    # one bulk update per set of updated fields, the payment missing in PG is skipped
+    with django_assert_num_queries(2):
+        PaymentGatewayService.update_payments(
+            [payment_1, payment_2, extra_payment],
+            pg_payment_records,
+            split_1,
+            payment_plan,
+            Decimal("2.0"),
+        )
+
+    payment_1.refresh_from_db()
+    assert payment_1.status == Payment.STATUS_DISTRIBUTION_SUCCESS
+    assert payment_1.fsp_auth_code == "1"
+    assert payment_1.delivered_quantity == Decimal("100.00")
+    assert payment_1.delivered_quantity_usd == Decimal("50.00")
+    payment_2.refresh_from_db()
+    assert payment_2.status == Payment.STATUS_SENT_TO_FSP
+    assert payment_2.delivered_quantity is None
+    # bulk_update skips auto_now, the dashboard refresh finds the synced payments by updated_at
+    assert payment_1.updated_at > updated_before
+    assert payment_2.updated_at > updated_before
+    extra_payment.refresh_from_db()
+    assert extra_payment.status == Payment.STATUS_PENDING
+    assert extra_payment.updated_at == updated_before
+    get_quantity_in_usd_mock.assert_called_once()
+
+
 @mock.patch("hope.apps.payment.services.payment_gateway.PaymentGatewayAPI.add_records_to_payment_instruction")
 @mock.patch("hope.apps.payment.services.payment_gateway.PaymentGatewayAPI.change_payment_instruction_status")
 def test_add_records_to_payment_instructions_for_split(
@@ -1740,36 +1808,38 @@ def test_periodic_sync_payment_gateway_delivery_mechanisms(sync_delivery_mechani
     assert sync_delivery_mechanisms_mock.call_count == 1
 
 
+def _pg_record_for(payment: Payment) -> PaymentRecordData:
+    return PaymentRecordData(
+        id=1,
+        remote_id=str(payment.id),
+        created="2023-10-10",
+        modified="2023-10-11",
+        record_code="1",
+        parent="1",
+        status="TRANSFERRED_TO_BENEFICIARY",
+        auth_code="1",
+        payout_amount=float(payment.entitlement_quantity),
+        fsp_code="1",
+    )
+
+
 @mock.patch("hope.apps.payment.services.payment_gateway.PaymentGatewayAPI.get_record")
+@mock.patch("hope.apps.payment.services.payment_gateway.PaymentGatewayAPI.get_records_for_payment_instruction")
 @mock.patch("hope.apps.payment.services.payment_gateway.PaymentGatewayAPI.add_records_to_payment_instruction")
 @mock.patch("hope.apps.payment.services.payment_gateway.PaymentGatewayAPI.change_payment_instruction_status")
 def test_add_missing_records_to_payment_instructions(
-    get_record_mock: Any,
-    add_records_to_payment_instruction_mock: Any,
     change_payment_instruction_status_mock: Any,
+    add_records_to_payment_instruction_mock: Any,
+    get_records_for_payment_instruction_mock: Any,
+    get_record_mock: Any,
     payment_gateway_setup: dict,
 ) -> None:
     payment_plan = payment_gateway_setup["payment_plan"]
-    # Fetch payments in the same order as eligible_payments.all() to match production iteration order
-    payments = list(payment_plan.eligible_payments.all())
+    existing_payment, missing_payment = payment_gateway_setup["payments"]
 
-    get_record_mock.side_effect = [
-        PaymentRecordData(
-            id=1,
-            remote_id=str(payments[0].id),
-            created="2023-10-10",
-            modified="2023-10-11",
-            record_code="1",
-            parent="1",
-            status="TRANSFERRED_TO_BENEFICIARY",
-            auth_code="1",
-            payout_amount=float(payments[0].entitlement_quantity),
-            fsp_code="1",
-        ),
-        None,
-    ]
-    pg_service = PaymentGatewayService()
-    pg_service.api.get_record = get_record_mock  # type: ignore
+    get_records_for_payment_instruction_mock.side_effect = lambda split_id: (
+        [_pg_record_for(existing_payment)] if split_id == existing_payment.parent_split_id else []
+    )
     change_payment_instruction_status_mock.side_effect = [
         PaymentInstructionStatus.CLOSED.value,
         PaymentInstructionStatus.READY.value,
@@ -1780,19 +1850,39 @@ def test_add_missing_records_to_payment_instructions(
         errors={"0": "Error", "1": "Error"},
     )
 
-    with patch.object(pg_service.api, "add_records_to_payment_instruction"):
-        pg_service.api.add_records_to_payment_instruction = add_records_to_payment_instruction_mock
+    pg_service = PaymentGatewayService()
+    pg_service.add_missing_records_to_payment_instructions(payment_plan)
 
-        pg_service.add_missing_records_to_payment_instructions(payment_plan)
-        assert get_record_mock.call_count == 2
+    # one listing per instruction, no per record lookups
+    assert get_records_for_payment_instruction_mock.call_count == 2
+    get_record_mock.assert_not_called()
 
-        called_payments, called_split = (
-            pg_service.api.add_records_to_payment_instruction.call_args[0][0],
-            pg_service.api.add_records_to_payment_instruction.call_args[0][1],
-        )
-        missing_payment = payments[1]  # second in DB order — got None from side_effect
-        assert called_payments == list(Payment.objects.filter(pk=missing_payment.pk))
-        assert called_split == missing_payment.parent_split_id
+    called_payments, called_split = add_records_to_payment_instruction_mock.call_args[0][:2]
+    assert called_payments == list(Payment.objects.filter(pk=missing_payment.pk))
+    assert called_split == missing_payment.parent_split_id
+
+
+@mock.patch("hope.apps.payment.services.payment_gateway.PaymentGatewayAPI.get_record")
+@mock.patch("hope.apps.payment.services.payment_gateway.PaymentGatewayAPI.get_records_for_payment_instruction")
+@mock.patch("hope.apps.payment.services.payment_gateway.PaymentGatewayService.add_records_to_payment_instructions")
+def test_add_missing_records_to_payment_instructions_falls_back_to_single_records(
+    add_records_to_payment_instructions_mock: Any,
+    get_records_for_payment_instruction_mock: Any,
+    get_record_mock: Any,
+    payment_gateway_setup: dict,
+) -> None:
+    payment_plan = payment_gateway_setup["payment_plan"]
+    existing_payment, missing_payment = payment_gateway_setup["payments"]
+
+    get_records_for_payment_instruction_mock.side_effect = PaymentGatewayAPI.PaymentGatewayAPIError("Not found")
+    get_record_mock.side_effect = lambda payment_id: (
+        _pg_record_for(existing_payment) if payment_id == str(existing_payment.id) else None
+    )
+
+    PaymentGatewayService().add_missing_records_to_payment_instructions(payment_plan)
+
+    assert get_record_mock.call_count == 2
+    add_records_to_payment_instructions_mock.assert_called_once_with(payment_plan, [str(missing_payment.id)])
 
 
 def test_map_financial_institution_pk_and_mapping_found(payment_gateway_setup: dict) -> None:
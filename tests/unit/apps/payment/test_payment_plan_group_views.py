@@ -347,7 +347,7 @@ def test_list_groups_for_cycle(
     results = response.json()["results"]
     assert len(results) == 1
     assert results[0]["cycle"] == {"id": str(cycle.id), "title": cycle.title}
-    assert len(ctx.captured_queries) == 13
+    assert len(ctx.captured_queries) == 10
 
 
 def test_list_groups_no_cycle_filter(
@@ -369,7 +369,7 @@ def test_list_groups_no_cycle_filter(
 
     assert response.status_code == status.HTTP_200_OK
     assert len(response.json()["results"]) == 2
-    assert len(ctx.captured_queries) == 13
+    assert len(ctx.captured_queries) == 10
 
 
 def test_count_groups_for_cycle(
@@ -804,8 +804,8 @@ def test_list_cache_invalidated_on_group_create(
         cached = client.get(_list_url(business_area.slug, program.code))
     assert cached.status_code == status.HTTP_200_OK
     assert cached.headers["etag"] == etag_before
-    assert len(hit_ctx.captured_queries) == 4
-    assert len(miss_ctx.captured_queries) == 13
+    assert len(hit_ctx.captured_queries) == 2
+    assert len(miss_ctx.captured_queries) == 10
 
     with TestCase.captureOnCommitCallbacks(execute=True):
         client.post(_list_url(business_area.slug, program.code), {"name": "New Group", "cycle": str(cycle.id)})
@@ -814,7 +814,7 @@ def test_list_cache_invalidated_on_group_create(
         second = client.get(_list_url(business_area.slug, program.code))
     assert second.status_code == status.HTTP_200_OK
     assert second.headers["etag"] != etag_before
-    assert len(invalidated_ctx.captured_queries) == 7
+    assert len(invalidated_ctx.captured_queries) == 5
 
 
 def test_list_cache_invalidated_on_group_rename(
@@ -843,8 +843,8 @@ def test_list_cache_invalidated_on_group_rename(
         cached = client.get(_list_url(business_area.slug, program.code))
     assert cached.status_code == status.HTTP_200_OK
     assert cached.headers["etag"] == etag_before
-    assert len(hit_ctx.captured_queries) == 4
-    assert len(miss_ctx.captured_queries) == 13
+    assert len(hit_ctx.captured_queries) == 2
+    assert len(miss_ctx.captured_queries) == 10
 
     with TestCase.captureOnCommitCallbacks(execute=True):
         client.put(_detail_url(business_area.slug, program.code, group.id), {"name": "Renamed"})
@@ -853,7 +853,7 @@ def test_list_cache_invalidated_on_group_rename(
         second = client.get(_list_url(business_area.slug, program.code))
     assert second.status_code == status.HTTP_200_OK
     assert second.headers["etag"] != etag_before
-    assert len(invalidated_ctx.captured_queries) == 7
+    assert len(invalidated_ctx.captured_queries) == 5
 
 
 def test_list_cache_invalidated_on_group_delete(
@@ -882,8 +882,8 @@ def test_list_cache_invalidated_on_group_delete(
         cached = client.get(_list_url(business_area.slug, program.code))
     assert cached.status_code == status.HTTP_200_OK
     assert cached.headers["etag"] == etag_before
-    assert len(hit_ctx.captured_queries) == 4
-    assert len(miss_ctx.captured_queries) == 13
+    assert len(hit_ctx.captured_queries) == 2
+    assert len(miss_ctx.captured_queries) == 10
 
     with TestCase.captureOnCommitCallbacks(execute=True):
         client.delete(_detail_url(business_area.slug, program.code, group.id))
@@ -892,7 +892,7 @@ def test_list_cache_invalidated_on_group_delete(
         second = client.get(_list_url(business_area.slug, program.code))
     assert second.status_code == status.HTTP_200_OK
     assert second.headers["etag"] != etag_before
-    assert len(invalidated_ctx.captured_queries) == 7
+    assert len(invalidated_ctx.captured_queries) == 5
 
 
 @pytest.mark.parametrize(
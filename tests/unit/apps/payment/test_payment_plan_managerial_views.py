@@ -167,7 +167,7 @@ def test_list_payment_plans(
         etag = response.headers["etag"]
 
         assert json.loads(cache.get(etag)[0].decode("utf8")) == response.json()
-        assert len(ctx.captured_queries) == 6
+        assert len(ctx.captured_queries) == 5
 
     with CaptureQueriesContext(connection) as ctx:
         response = managerial_context["client"].get(managerial_context["url"])
@@ -177,7 +177,7 @@ def test_list_payment_plans(
         etag_second_call = response.headers["etag"]
         assert json.loads(cache.get(response.headers["etag"])[0].decode("utf8")) == response.json()
         assert etag_second_call == etag
-        assert len(ctx.captured_queries) == 6
+        assert len(ctx.captured_queries) == 5
 
 
 def test_list_payment_plans_approval_process_data(
@@ -1,7 +1,7 @@
 from typing import Any
 
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 import pytest
 
 from extras.test_utils.factories import (
@@ -13,9 +13,10 @@ from extras.test_utils.factories import (
     ProgramCycleFactory,
     ProgramFactory,
 )
+from hope.apps.payment.services.payment_number_allocator import FeistelPermutation, PaymentNumberAllocator
 from hope.apps.payment.validators import payment_token_and_order_number_validator
 from hope.apps.payment.xlsx.xlsx_payment_plan_delivery_export_service import XlsxPaymentPlanDeliveryExportService
-from hope.models import Payment, PaymentPlan
+from hope.models import Payment, PaymentNumberSequence, PaymentPlan
 
 pytestmark = pytest.mark.django_db
 
@@ -97,6 +98,50 @@ def test_generate_token_and_order_numbers_for_payments(
     assert len(str(payment.token_number)) == 7
 
 
+def test_generate_token_and_order_numbers_advances_program_sequence(
+    payment_plan: PaymentPlan, program: Any, payments: list[Payment]
+) -> None:
+    payments[0].order_number = 123456789
+    payments[0].save(update_fields=["order_number"])
+
+    XlsxPaymentPlanDeliveryExportService.generate_token_and_order_numbers(payment_plan.eligible_payments.all(), program)
+
+    payments[0].refresh_from_db()
+    numbers = list(payment_plan.eligible_payments.values_list("order_number", "token_number"))
+    sequence = PaymentNumberSequence.objects.get(program=program)
+    assert payments[0].order_number == 123456789
+    assert len({order_number for order_number, _ in numbers}) == 2
+    assert len({token_number for _, token_number in numbers}) == 2
+    assert sequence.order_number_position >= 1
+    assert sequence.token_number_position >= 2
+
+
+def test_feistel_permutation_is_a_bijection() -> None:
+    permutation = FeistelPermutation(1000, b"key")
+
+    assert sorted(permutation[index] for index in range(1000)) == list(range(1000))
+    with pytest.raises(IndexError):
+        permutation[1000]
+
+
+def test_allocator_skips_numbers_assigned_before_the_sequence(program: Any, payments: list[Payment]) -> None:
+    sequence = PaymentNumberSequence.objects.create(program=program)
+    allocator = PaymentNumberAllocator(program)
+    with transaction.atomic():
+        first_token = allocator.allocate("token_number", 1)[0]
+    sequence.token_number_position = 0
+    sequence.save(update_fields=["token_number_position"])
+    payments[0].token_number = first_token
+    payments[0].save(update_fields=["token_number"])
+
+    with transaction.atomic():
+        tokens = allocator.allocate("token_number", 3)
+
+    assert first_token not in tokens
+    assert len(set(tokens)) == 3
+    assert all(1000000 <= token <= 9999999 for token in tokens)
+
+
 def test_validation_token_must_not_has_the_same_digit_more_than_three_times() -> None:
     with pytest.raises(ValidationError):
         payment_token_and_order_number_validator(1111111)
@@ -55,12 +55,12 @@ def test_get_quantity_in_usd_uses_provided_client_for_falsy_exchange_rate(curren
 
 
 @patch("hope.apps.payment.utils.ExchangeRates")
-def test_get_quantity_in_usd_creates_exchange_rates_client_for_falsy_exchange_rate(
+def test_get_quantity_in_usd_uses_shared_exchange_rates_for_falsy_exchange_rate(
     exchange_rates_cls: Mock, currency, django_assert_num_queries
 ) -> None:
     exchange_rates_client = Mock()
     exchange_rates_client.get_exchange_rate_for_currency_code.return_value = 4
-    exchange_rates_cls.return_value = exchange_rates_client
+    exchange_rates_cls.get_shared.return_value = exchange_rates_client
 
     with django_assert_num_queries(0):
         result = get_quantity_in_usd(
@@ -70,7 +70,7 @@ def test_get_quantity_in_usd_creates_exchange_rates_client_for_falsy_exchange_ra
             currency_exchange_date=timezone.now(),
         )
 
-    exchange_rates_cls.assert_called_once()
+    exchange_rates_cls.get_shared.assert_called_once()
     exchange_rates_client.get_exchange_rate_for_currency_code.assert_called_once()
     assert result == Decimal("3.00")
 
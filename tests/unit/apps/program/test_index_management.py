@@ -1,6 +1,6 @@
 """Tests for check_program_indexes."""
 
-from typing import Callable
+from typing import Any, Callable
 
 from constance.test import override_config
 from django.conf import settings
@@ -9,6 +9,7 @@ import pytest
 
 from extras.test_utils.factories import BusinessAreaFactory, HouseholdFactory, IndividualFactory, ProgramFactory
 from hope.apps.household.documents import get_household_doc, get_individual_doc
+from hope.apps.household.services import index_management
 from hope.apps.household.services.index_management import (
     check_program_indexes,
     create_program_indexes,
@@ -16,7 +17,13 @@ from hope.apps.household.services.index_management import (
     populate_program_indexes,
     rebuild_program_indexes,
 )
-from hope.models import BusinessArea, Program
+from hope.apps.utils.elasticsearch_utils import (
+    capture_index_writes,
+    is_index_rebuilding,
+    populate_index,
+    remove_elasticsearch_documents_by_matching_ids,
+)
+from hope.models import BusinessArea, Individual, Program
 
 pytestmark = [
     pytest.mark.usefixtures("django_elasticsearch_setup"),
@@ -265,3 +272,103 @@ def test_index_operations_succeed_with_special_chars_in_code(
 
     ok, _ = delete_program_indexes(str(program.id))
     assert ok is True
+
+
+@override_config(IS_ELASTICSEARCH_ENABLED=True)
+def test_rebuild_program_indexes_swaps_alias_to_new_index(
+    django_elasticsearch_setup: None, create_program_es_index: Callable, es: Elasticsearch, program: Program
+) -> None:
+    create_program_es_index(program)
+    alias = get_individual_doc(str(program.id))._index._name
+    old_indexes = set(es.indices.get_alias(index=alias))
+
+    ok, _ = rebuild_program_indexes(str(program.id))
+
+    assert ok is True
+    new_indexes = set(es.indices.get_alias(index=alias))
+    assert len(new_indexes) == 1
+    assert new_indexes.isdisjoint(old_indexes)
+    assert not any(es.indices.exists(index=index) for index in old_indexes)
+
+
+@override_config(IS_ELASTICSEARCH_ENABLED=True)
+def test_rebuild_program_indexes_keeps_live_index_on_failure(
+    django_elasticsearch_setup: None, create_program_es_index: Callable, es: Elasticsearch, program: Program, mocker
+) -> None:
+    create_program_es_index(program)
+    alias = get_individual_doc(str(program.id))._index._name
+    old_indexes = set(es.indices.get_alias(index=alias))
+    mocker.patch("hope.apps.household.services.index_management.bulk_populate_index", return_value=(0, 1))
+
+    ok, msg = rebuild_program_indexes(str(program.id))
+
+    assert ok is False
+    assert "failed to index" in msg
+    assert set(es.indices.get_alias(index=alias)) == old_indexes
+    assert set(es.indices.get_alias(index=f"{alias}-*")) == old_indexes
+
+
+@override_config(IS_ELASTICSEARCH_ENABLED=True)
+def test_writes_during_rebuild_are_recorded(
+    django_elasticsearch_setup: None,
+    create_program_es_index: Callable,
+    program: Program,
+    django_capture_on_commit_callbacks,
+) -> None:
+    create_program_es_index(program)
+    doc = get_individual_doc(str(program.id))
+    alias = doc._index._name
+    with override_config(IS_ELASTICSEARCH_ENABLED=False):
+        individual = IndividualFactory(program=program, business_area=program.business_area)
+
+    with capture_index_writes(alias) as written_ids:
+        with django_capture_on_commit_callbacks(execute=True):
+            populate_index(Individual.objects.filter(id=individual.id), doc)
+            remove_elasticsearch_documents_by_matching_ids([str(individual.id)], doc)
+
+        assert written_ids() == {str(individual.id)}
+        assert written_ids() == set()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        populate_index(Individual.objects.filter(id=individual.id), doc)
+    assert not is_index_rebuilding(alias)
+
+
+@override_config(IS_ELASTICSEARCH_ENABLED=True)
+def test_rebuild_resyncs_writes_made_during_the_load(
+    django_elasticsearch_setup: None,
+    create_program_es_index: Callable,
+    es: Elasticsearch,
+    program: Program,
+    mocker,
+    django_capture_on_commit_callbacks,
+) -> None:
+    create_program_es_index(program)
+    doc = get_individual_doc(str(program.id))
+    alias = doc._index._name
+    with override_config(IS_ELASTICSEARCH_ENABLED=False):
+        updated = IndividualFactory(program=program, business_area=program.business_area, given_name="Old")
+        deleted = IndividualFactory(program=program, business_area=program.business_area)
+    bulk_populate_index = index_management.bulk_populate_index
+    loads = []
+
+    def load_then_write(*args: Any, **kwargs: Any) -> tuple[int, int]:
+        result = bulk_populate_index(*args, **kwargs)
+        if not loads:
+            # the load read both records before they changed
+            with django_capture_on_commit_callbacks(execute=True):
+                Individual.objects.filter(id=updated.id).update(given_name="New")
+                populate_index(Individual.objects.filter(id=updated.id), doc)
+                deleted.delete(soft=False)
+                remove_elasticsearch_documents_by_matching_ids([str(deleted.id)], doc)
+        loads.append(kwargs["index_name"])
+        return result
+
+    mocker.patch.object(index_management, "bulk_populate_index", side_effect=load_then_write)
+
+    ok, _ = rebuild_program_indexes(str(program.id))
+
+    assert ok is True
+    es.indices.refresh(index=alias)
+    assert es.get(index=alias, id=str(updated.id))["_source"]["given_name"] == "New"
+    assert not es.exists(index=alias, id=str(deleted.id))
@@ -4,6 +4,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Any, Callable, Dict
 
+from django.test import TestCase
 from django.urls import reverse
 from django.utils.dateparse import parse_date
 import pytest
@@ -19,6 +20,7 @@ from extras.test_utils.factories import (
     ProgramFactory,
     UserFactory,
 )
+from hope.api.caches import get_program_model_version
 from hope.apps.account.permissions import Permissions
 from hope.apps.program.api.serializers import (
     ProgramCycleCreateSerializer,
@@ -434,6 +436,31 @@ def test_update_cycle_dates_and_payment_plan(
     assert payment_plan.start_date.strftime("%Y-%m-%d") == "2023-02-02"
 
 
+def test_update_cycle_dates_invalidates_payment_plan_list_cache(
+    authenticated_client: Any,
+    user: User,
+    afghanistan: BusinessArea,
+    program: Program,
+    cycle1: ProgramCycle,
+    cycle_1_detail_url: str,
+    create_user_role_with_permissions: Callable,
+) -> None:
+    create_user_role_with_permissions(
+        user=user,
+        permissions=[Permissions.PM_PROGRAMME_CYCLE_UPDATE],
+        business_area=afghanistan,
+        program=program,
+    )
+    PaymentPlanFactory(program_cycle=cycle1)
+    version_before_update = get_program_model_version(program.id, PaymentPlan)
+
+    with TestCase.captureOnCommitCallbacks(execute=True):
+        response = authenticated_client.patch(cycle_1_detail_url, {"end_date": parse_date("2023-02-22")}, format="json")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert get_program_model_version(program.id, PaymentPlan) > version_before_update
+
+
 def test_delete_program_cycle_with_permission(
     authenticated_client: Any,
     user: User,
@@ -5,7 +5,9 @@ from unittest.mock import patch
 import uuid
 
 from django.conf import settings
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from flags.models import FlagState
 import pytest
 
@@ -1084,6 +1086,40 @@ def test_store_rdis_deduplication_statistics(biometric_deduplication_context: di
     assert ind3.biometric_deduplication_golden_record_status == UNIQUE
 
 
+def test_store_rdi_deduplication_statistics_queries_do_not_depend_on_individuals_count(
+    biometric_deduplication_context: dict[str, object],
+) -> None:
+    program = biometric_deduplication_context["program"]
+    user = biometric_deduplication_context["user"]
+    service = BiometricDeduplicationService()
+
+    def _store_statistics(individuals_count: int) -> int:
+        rdi = RegistrationDataImportFactory(
+            status=RegistrationDataImport.IN_REVIEW,
+            program=program,
+            business_area=program.business_area,
+            imported_by=user,
+        )
+        individuals = IndividualFactory.create_batch(
+            individuals_count,
+            program=program,
+            business_area=program.business_area,
+            registration_data_import=rdi,
+            rdi_merge_status=MergeStatusModel.PENDING,
+        )
+        ind1, ind2, *_ = sorted(individuals, key=lambda x: x.id)
+        service.store_similarity_pairs(
+            program, [SimilarityPair(score=0.7, first=str(ind1.id), second=str(ind2.id), status_code="200")]
+        )
+        with CaptureQueriesContext(connection) as queries:
+            service.store_rdi_deduplication_statistics(rdi)
+        rdi.refresh_from_db()
+        assert rdi.dedup_engine_batch_duplicates == 2
+        return len(queries)
+
+    assert _store_statistics(2) == _store_statistics(6)
+
+
 def test_update_rdis_deduplication_statistics(biometric_deduplication_context: dict[str, object]) -> None:
     program = biometric_deduplication_context["program"]
     user = biometric_deduplication_context["user"]
@@ -1,8 +1,10 @@
 """Tests for DeduplicateTask extracted helper methods."""
 
-from unittest.mock import MagicMock
+from collections import Counter
+from unittest.mock import MagicMock, patch
 import uuid
 
+from constance.test import override_config
 import pytest
 
 from extras.test_utils.factories import (
@@ -13,12 +15,14 @@ from extras.test_utils.factories import (
     RegistrationDataImportFactory,
 )
 from hope.apps.household.const import (
+    DUPLICATE,
     DUPLICATE_IN_BATCH,
     UNIQUE_IN_BATCH,
 )
 from hope.apps.registration_data.tasks.deduplicate import DeduplicateTask, HardDocumentDeduplication
 from hope.models import (
     BusinessArea,
+    Document,
     Program,
     RegistrationDataImport,
 )
@@ -142,6 +146,80 @@ def test_finalize_successful_deduplication(task, rdi, pending_household_for_fina
     assert rdi.error_message == ""
 
 
+# --- sharded deduplication ---
+
+
+@override_config(DEDUPLICATION_SHARD_SIZE=2)
+def test_queue_deduplication_shards(task, rdi, business_area, pending_household_for_finalize):
+    individuals = [
+        PendingIndividualFactory(
+            registration_data_import=rdi,
+            program=rdi.program,
+            business_area=business_area,
+            household=pending_household_for_finalize,
+        )
+        for _ in range(5)
+    ]
+    business_area.custom_fields = {"hope": {"sharded_deduplication": True}}
+    task.business_area = business_area
+    pending_individuals = task._get_pending_individuals_queryset(rdi)
+    assert task._should_shard_deduplication(pending_individuals.count()) is True
+
+    with patch("hope.apps.registration_data.celery_tasks.rdi_deduplication_shard_async_task") as mock_shard_task:
+        task._queue_deduplication_shards(rdi, pending_individuals)
+
+    ids = sorted(str(individual.id) for individual in individuals)
+    shards = [
+        (call.kwargs["first_individual_id"], call.kwargs["last_individual_id"])
+        for call in mock_shard_task.call_args_list
+    ]
+    assert shards == [(ids[0], ids[1]), (ids[2], ids[3]), (ids[4], ids[4])]
+    assert {call.kwargs["shards_count"] for call in mock_shard_task.call_args_list} == {3}
+    assert len({call.kwargs["sharding_run_id"] for call in mock_shard_task.call_args_list}) == 1
+    rdi.refresh_from_db()
+    assert rdi.status == RegistrationDataImport.DEDUPLICATION
+
+
+def test_should_not_shard_deduplication_without_sys_option(task):
+    assert task._should_shard_deduplication(10**6) is False
+
+
+@patch("hope.apps.registration_data.tasks.deduplicate.remove_elasticsearch_documents_by_matching_ids")
+def test_finalize_sharded_deduplication_success(mock_remove_documents, task, rdi, pending_individuals_for_finalize):
+    individual_1, individual_2 = pending_individuals_for_finalize
+    individual_1.deduplication_batch_results = {"duplicates": [{"hit_id": str(individual_2.id)}]}
+    individual_1.deduplication_batch_status = DUPLICATE_IN_BATCH
+    individual_1.save()
+    task.thresholds.DEDUPLICATION_BATCH_DUPLICATES_PERCENTAGE = 100
+
+    task.finalize_sharded_deduplication(rdi)
+
+    rdi.refresh_from_db()
+    assert rdi.status == RegistrationDataImport.IN_REVIEW
+    assert rdi.batch_duplicates == 1
+    individual_2.refresh_from_db()
+    assert individual_2.deduplication_batch_status == UNIQUE_IN_BATCH
+    mock_remove_documents.assert_called_once()
+
+
+@patch("hope.apps.registration_data.tasks.deduplicate.remove_elasticsearch_documents_by_matching_ids")
+def test_finalize_sharded_deduplication_fails_when_percentage_exceeded(
+    mock_remove_documents, task, rdi, pending_individuals_for_finalize
+):
+    individual_1, individual_2 = pending_individuals_for_finalize
+    individual_1.deduplication_golden_record_status = DUPLICATE
+    individual_1.save()
+    task.thresholds.DEDUPLICATION_BATCH_DUPLICATES_PERCENTAGE = 100
+    task.thresholds.DEDUPLICATION_GOLDEN_RECORD_DUPLICATES_PERCENTAGE = 50
+
+    task.finalize_sharded_deduplication(rdi)
+
+    rdi.refresh_from_db()
+    assert rdi.status == RegistrationDataImport.DEDUPLICATION_FAILED
+    assert "population" in rdi.error_message
+    mock_remove_documents.assert_called_once()
+
+
 # --- HardDocumentDeduplication._build_document_signatures ---
 
 
@@ -152,7 +230,7 @@ def test_build_document_signatures_empty():
     assert documents_numbers == []
     assert new_sigs == []
     assert dict(per_individual_dict) == {}
-    assert duplicated == []
+    assert duplicated == Counter()
 
 
 def test_build_document_signatures_single_doc():
@@ -171,8 +249,8 @@ def test_build_document_signatures_single_doc():
     expected_sig = "passport--DOC-001--AFG"
     assert documents_numbers == ["DOC-001"]
     assert new_sigs == [expected_sig]
-    assert per_individual_dict[str(individual_id)] == [expected_sig]
-    assert duplicated == []
+    assert per_individual_dict[str(individual_id)] == Counter({expected_sig: 1})
+    assert duplicated == Counter()
 
 
 def test_build_document_signatures_duplicates():
@@ -199,9 +277,76 @@ def test_build_document_signatures_duplicates():
     expected_sig = "passport--DOC-001--AFG"
     assert documents_numbers == ["DOC-001", "DOC-001"]
     assert new_sigs == [expected_sig, expected_sig]
-    assert per_individual_dict[str(individual_id_1)] == [expected_sig]
-    assert per_individual_dict[str(individual_id_2)] == [expected_sig]
-    assert duplicated == [expected_sig, expected_sig]
+    assert per_individual_dict[str(individual_id_1)] == Counter({expected_sig: 1})
+    assert per_individual_dict[str(individual_id_2)] == Counter({expected_sig: 1})
+    assert duplicated == Counter({expected_sig: 2})
+
+
+# --- HardDocumentDeduplication._deduplication_documents ---
+
+
+def _make_document(individual_id, document_number="DOC-001", type_id="tax_id", valid_for_deduplication=False):
+    doc = MagicMock()
+    doc.document_number = document_number
+    doc.individual_id = individual_id
+    doc.type.valid_for_deduplication = valid_for_deduplication
+    doc.type_id = type_id
+    doc.country_id = "AFG"
+    return doc
+
+
+def _deduplicate_documents(documents):
+    dedup = HardDocumentDeduplication()
+    _, _, per_individual_dict, duplicated = dedup._build_document_signatures(documents)
+    ticket_data_dict = {}
+    dedup._deduplication_documents(
+        {},
+        set(),
+        set(),
+        documents,
+        new_document_signatures_duplicated_in_batch=duplicated,
+        new_document_signatures_in_batch_per_individual_dict=per_individual_dict,
+        possible_duplicates_individuals_id_set=set(),
+        ticket_data_dict=ticket_data_dict,
+    )
+    return ticket_data_dict
+
+
+def test_deduplication_documents_same_number_type_and_individual_in_batch():
+    individual_id = uuid.uuid4()
+    doc1 = _make_document(individual_id)
+    doc2 = _make_document(individual_id)
+
+    ticket_data_dict = _deduplicate_documents([doc1, doc2])
+
+    assert doc1.status == Document.STATUS_INVALID
+    assert doc2.status == Document.STATUS_VALID
+    assert ticket_data_dict == {}
+
+
+def test_deduplication_documents_same_number_different_type_for_individual():
+    individual_id = uuid.uuid4()
+    doc1 = _make_document(individual_id, type_id="tax_id")
+    doc2 = _make_document(individual_id, type_id="national_id")
+
+    _deduplicate_documents([doc1, doc2])
+
+    assert doc1.status == Document.STATUS_VALID
+    assert doc2.status == Document.STATUS_VALID
+
+
+def test_deduplication_documents_duplicated_between_individuals():
+    doc1 = _make_document(uuid.uuid4(), valid_for_deduplication=True)
+    doc2 = _make_document(uuid.uuid4(), valid_for_deduplication=True)
+    doc3 = _make_document(uuid.uuid4(), valid_for_deduplication=True)
+
+    ticket_data_dict = _deduplicate_documents([doc1, doc2, doc3])
+
+    assert doc1.status == Document.STATUS_VALID
+    assert doc2.status == Document.STATUS_NEED_INVESTIGATION
+    assert doc3.status == Document.STATUS_NEED_INVESTIGATION
+    assert ticket_data_dict["tax_id--DOC-001--AFG"]["original"] is doc1
+    assert ticket_data_dict["tax_id--DOC-001--AFG"]["possible_duplicates"] == {doc2, doc3}
 
 
 # --- HardDocumentDeduplication._get_existing_duplicates_through ---
@@ -508,3 +508,59 @@ def test_deduplicate_individuals_from_other_source(
 
     assert needs_adjudication.count() == 0
     assert duplicate.count() == 2
+
+
+@override_config(IS_ELASTICSEARCH_ENABLED=True, DEDUPLICATION_MSEARCH_WINDOW_SIZE=3)
+def test_batch_deduplication_with_batched_search(batch_deduplication_context: dict[str, Any]) -> None:
+    business_area = batch_deduplication_context["business_area"]
+    program = batch_deduplication_context["program"]
+    registration_data_import = batch_deduplication_context["registration_data_import"]
+    business_area.custom_fields = {"hope": {"batched_deduplication": True}}
+    business_area.save()
+
+    task = DeduplicateTask(business_area.slug, program.id)
+    assert task.use_batched_search is True
+    task.deduplicate_pending_individuals(registration_data_import)
+
+    individuals = PendingIndividual.objects.order_by("full_name")
+    assert tuple(
+        individuals.filter(deduplication_batch_status=DUPLICATE_IN_BATCH).values_list("full_name", flat=True)
+    ) == (
+        "Tessta Testowski",
+        "Tessta Testowski",
+        "Test Testowski",
+        "Test Testowski",
+    )
+    assert tuple(
+        individuals.filter(deduplication_golden_record_status=DUPLICATE).values_list("full_name", flat=True)
+    ) == (
+        "Tessta Testowski",
+        "Tessta Testowski",
+        "Test Example",
+        "Test Testowski",
+        "Test Testowski",
+    )
+    assert individuals.filter(deduplication_golden_record_status=NEEDS_ADJUDICATION).count() == 1
+    assert tuple(individuals.filter(deduplication_golden_record_status=UNIQUE).values_list("full_name", flat=True)) == (
+        "Tesa Testowski",
+    )
+
+
+@override_config(IS_ELASTICSEARCH_ENABLED=True, DEDUPLICATION_MSEARCH_WINDOW_SIZE=2)
+def test_golden_record_deduplication_with_batched_search(golden_record_context: dict[str, Any]) -> None:
+    business_area = golden_record_context["business_area"]
+    program = golden_record_context["program"]
+    registration_data_import = golden_record_context["registration_data_import"]
+    business_area.custom_fields = {"hope": {"batched_deduplication": True}}
+    business_area.save()
+
+    task = DeduplicateTask(business_area.slug, program.id)
+    individuals = evaluate_qs(
+        Individual.objects.filter(registration_data_import=registration_data_import).select_for_update().order_by("pk")
+    )
+    populate_index(individuals, get_individual_doc(str(program.id)))
+
+    task.deduplicate_individuals_against_population(individuals)
+
+    assert Individual.objects.filter(deduplication_golden_record_status=NEEDS_ADJUDICATION).count() == 0
+    assert Individual.objects.filter(deduplication_golden_record_status=DUPLICATE).count() == 4
@@ -758,15 +758,34 @@ def test_populate_index_individuals_when_es_enabled(
     mock_get_individual_doc.return_value.return_value.update.assert_called_once()
 
 
+@mock.patch("hope.apps.registration_data.tasks.rdi_merge.flush_index_queue")
 @mock.patch("hope.apps.registration_data.tasks.rdi_merge.get_household_doc")
 def test_populate_index_households_when_es_enabled(
     mock_get_household_doc: mock.Mock,
+    mock_flush_index_queue: mock.Mock,
     rdi: object,
     rdi_merge_task,
+    django_capture_on_commit_callbacks,
 ) -> None:
-    with mock.patch("hope.apps.registration_data.tasks.rdi_merge.config") as mock_config:
+    with (
+        mock.patch("hope.apps.registration_data.tasks.rdi_merge.config") as mock_config,
+        django_capture_on_commit_callbacks(execute=True),
+    ):
         mock_config.IS_ELASTICSEARCH_ENABLED = True
-        rdi_merge_task._populate_index_households(rdi)
+        rdi_merge_task._populate_index_households(rdi, ["ind-id-1", "hh-id-1"])
+        mock_flush_index_queue.assert_not_called()
 
     mock_get_household_doc.assert_called_once_with(str(rdi.program.id))
     mock_get_household_doc.return_value.return_value.update.assert_called_once()
+    mock_flush_index_queue.assert_called_once_with(str(rdi.program_id), object_ids=["ind-id-1", "hh-id-1"])
+
+
+@mock.patch("hope.apps.registration_data.tasks.rdi_merge.flush_index_queue", side_effect=ConnectionError)
+def test_flush_index_queue_failure_does_not_raise(
+    mock_flush_index_queue: mock.Mock,
+    rdi: object,
+    rdi_merge_task,
+) -> None:
+    rdi_merge_task._flush_index_queue(rdi, ["ind-id-1"])
+
+    mock_flush_index_queue.assert_called_once_with(str(rdi.program_id), object_ids=["ind-id-1"])
@@ -3,6 +3,7 @@
 from unittest.mock import MagicMock, patch
 import uuid
 
+from django.core.cache import cache
 import pytest
 
 from extras.test_utils.factories import (
@@ -14,6 +15,7 @@ from extras.test_utils.factories import (
     ProgramFactory,
     RegistrationDataImportFactory,
 )
+from hope.apps.core.cache_tags import tag_cache_key
 from hope.apps.grievance.models import GrievanceTicket
 from hope.apps.registration_data.tasks.rdi_merge import RdiMergeTask
 from hope.models import (
@@ -96,29 +98,26 @@ def test_update_merge_statuses_sets_merged_on_all_models(
     ).exists()
 
 
-def test_clear_cache_deletes_matching_keys(business_area: BusinessArea) -> None:
-    mock_cache = MagicMock()
-    mock_cache.keys.return_value = [
-        f"count_{business_area.slug}_HouseholdNodeConnection_abc",
-        f"count_{business_area.slug}_IndividualNodeConnection_xyz",
-        "unrelated_key",
-    ]
+def test_clear_cache_deletes_tagged_keys(business_area: BusinessArea) -> None:
+    household_key = f"count_{business_area.slug}_HouseholdNodeConnection_abc"
+    individual_key = f"count_{business_area.slug}_IndividualNodeConnection_xyz"
+    for key in (household_key, individual_key, "unrelated_key"):
+        cache.set(key, 1)
+    tag_cache_key(household_key, f"count_{business_area.slug}_HouseholdNodeConnection_", timeout=60)
+    tag_cache_key(individual_key, f"count_{business_area.slug}_IndividualNodeConnection_", timeout=60)
 
-    task = RdiMergeTask()
-    with patch("hope.apps.registration_data.tasks.rdi_merge.cache", mock_cache):
-        task._clear_cache(business_area.slug)
+    RdiMergeTask()._clear_cache(business_area.slug)
 
-    assert mock_cache.delete.call_count == 2
-    mock_cache.delete.assert_any_call(f"count_{business_area.slug}_HouseholdNodeConnection_abc")
-    mock_cache.delete.assert_any_call(f"count_{business_area.slug}_IndividualNodeConnection_xyz")
+    assert cache.get(household_key) is None
+    assert cache.get(individual_key) is None
+    assert cache.get("unrelated_key") == 1
 
 
 def test_clear_cache_suppresses_connection_error(business_area: BusinessArea) -> None:
-    mock_cache = MagicMock()
-    mock_cache.keys.side_effect = ConnectionError("Redis down")
-
     task = RdiMergeTask()
-    with patch("hope.apps.registration_data.tasks.rdi_merge.cache", mock_cache):
+    with patch(
+        "hope.apps.registration_data.tasks.rdi_merge.clear_cache_for_key", side_effect=ConnectionError("Redis down")
+    ):
         # Should not raise
         task._clear_cache(business_area.slug)
 
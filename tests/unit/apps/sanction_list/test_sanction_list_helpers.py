@@ -6,7 +6,7 @@ import uuid
 import pytest
 
 from hope.apps.sanction_list.tasks.check_against_sanction_list_pre_merge import (
-    _resolve_individual_hit,
+    _resolve_individual_hits,
     _save_tickets_and_notify,
 )
 
@@ -33,99 +33,73 @@ def make_program():
 
 
 # ---------------------------------------------------------------------------
-# _resolve_individual_hit
+# _resolve_individual_hits
 # ---------------------------------------------------------------------------
 
 
-# Branch 1: individuals_ids is non-empty and hit.id is NOT in the list
+def _db_individual(individual_id: str, program_id: str) -> MagicMock:
+    individual = MagicMock()
+    individual.id = individual_id
+    individual.program_id = program_id
+    return individual
+
+
+# Hits outside of individuals_ids are skipped
 @patch("hope.apps.sanction_list.tasks.check_against_sanction_list_pre_merge.Individual")
-def test_returns_none_when_hit_id_not_in_individuals_ids(mock_individual_cls, make_hit, make_program):
+def test_returns_empty_when_hit_id_not_in_individuals_ids(mock_individual_cls, make_hit, make_program):
     hit = make_hit(hit_id="not-in-list")
     program = make_program()
-    individuals_ids = ["id-a", "id-b"]
 
-    result = _resolve_individual_hit(hit, individuals_ids, 5.0, program)
+    result = _resolve_individual_hits([hit], ["id-a", "id-b"], 5.0, program)
 
-    assert result is None
+    assert result == {}
     # DB should never be queried
     mock_individual_cls.all_objects.filter.assert_not_called()
 
 
-# Branch 2: score is below the threshold
+# Hits below the threshold are skipped
 @patch("hope.apps.sanction_list.tasks.check_against_sanction_list_pre_merge.Individual")
-def test_returns_none_when_score_below_threshold(mock_individual_cls, make_hit, make_program):
+def test_returns_empty_when_score_below_threshold(mock_individual_cls, make_hit, make_program):
     hit = make_hit(hit_id="id-a", score=3.0)
     program = make_program()
-    individuals_ids = ["id-a"]
 
-    result = _resolve_individual_hit(hit, individuals_ids, 5.0, program)
+    result = _resolve_individual_hits([hit], ["id-a"], 5.0, program)
 
-    assert result is None
+    assert result == {}
     mock_individual_cls.all_objects.filter.assert_not_called()
 
 
-# Branch 3: individual not found in the database
-@patch("hope.apps.sanction_list.tasks.check_against_sanction_list_pre_merge.Individual")
-def test_returns_none_when_individual_not_in_db(mock_individual_cls, make_hit, make_program):
-    hit = make_hit(hit_id="id-a", score=10.0)
-    program = make_program()
-    individuals_ids = ["id-a"]
-    mock_individual_cls.all_objects.filter.return_value.first.return_value = None
-
-    result = _resolve_individual_hit(hit, individuals_ids, 5.0, program)
-
-    assert result is None
-    mock_individual_cls.all_objects.filter.assert_called_once_with(id="id-a")
-
-
-# Branch 4: individual program_id does not match program.id
+# All hits are loaded with a single query, missing and other program individuals are skipped
 @patch("hope.apps.sanction_list.tasks.check_against_sanction_list_pre_merge.Individual")
-def test_returns_none_when_program_id_mismatch(mock_individual_cls, make_hit, make_program):
-    hit = make_hit(hit_id="id-a", score=10.0)
+def test_resolves_hits_with_single_query(mock_individual_cls, make_hit, make_program):
     program = make_program(program_id="program-1")
-    individuals_ids = ["id-a"]
-
-    db_individual = MagicMock()
-    db_individual.program_id = "different-program"
-    mock_individual_cls.all_objects.filter.return_value.first.return_value = db_individual
-
-    result = _resolve_individual_hit(hit, individuals_ids, 5.0, program)
-
-    assert result is None
-
-
-# Branch 5 (success): all checks pass, return the individual
-@patch("hope.apps.sanction_list.tasks.check_against_sanction_list_pre_merge.Individual")
-def test_returns_individual_on_success(mock_individual_cls, make_hit, make_program):
-    program_id = "program-1"
-    hit = make_hit(hit_id="id-a", score=10.0)
-    program = make_program(program_id=program_id)
-    individuals_ids = ["id-a"]
-
-    db_individual = MagicMock()
-    db_individual.program_id = program_id
-    mock_individual_cls.all_objects.filter.return_value.first.return_value = db_individual
+    hits = [
+        make_hit(hit_id="id-a"),
+        make_hit(hit_id="id-b"),
+        make_hit(hit_id="id-missing"),
+        make_hit(hit_id="id-a"),
+    ]
+    individual_a = _db_individual("id-a", "program-1")
+    individual_b = _db_individual("id-b", "different-program")
+    mock_individual_cls.all_objects.filter.return_value.select_related.return_value = [individual_a, individual_b]
 
-    result = _resolve_individual_hit(hit, individuals_ids, 5.0, program)
+    result = _resolve_individual_hits(hits, ["id-a", "id-b", "id-missing"], 5.0, program)
 
-    assert result is db_individual
+    assert result == {"id-a": individual_a}
+    mock_individual_cls.all_objects.filter.assert_called_once_with(id__in={"id-a", "id-b", "id-missing"})
 
 
-# Extra edge case: empty individuals_ids list skips the membership check
+# Without individuals_ids the whole program is screened against merged individuals only
 @patch("hope.apps.sanction_list.tasks.check_against_sanction_list_pre_merge.Individual")
-def test_empty_individuals_ids_skips_membership_check(mock_individual_cls, make_hit, make_program):
-    """When individuals_ids is an empty list (falsy), the first guard is skipped."""
-    program_id = "program-1"
-    hit = make_hit(hit_id="id-a", score=10.0)
-    program = make_program(program_id=program_id)
-
-    db_individual = MagicMock()
-    db_individual.program_id = program_id
-    mock_individual_cls.all_objects.filter.return_value.first.return_value = db_individual
+def test_empty_individuals_ids_uses_program_individuals(mock_individual_cls, make_hit, make_program):
+    program = make_program(program_id="program-1")
+    individual_a = _db_individual("id-a", "program-1")
+    mock_individual_cls.objects.filter.return_value.select_related.return_value = [individual_a]
 
-    result = _resolve_individual_hit(hit, [], 5.0, program)
+    result = _resolve_individual_hits([make_hit(hit_id="id-a")], [], 5.0, program)
 
-    assert result is db_individual
+    assert result == {"id-a": individual_a}
+    mock_individual_cls.all_objects.filter.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -1,15 +1,16 @@
 from datetime import date, datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable
+from unittest.mock import patch
 
 from django.utils import timezone
 import pytest
 from strategy_field.utils import fqn
 
-from extras.test_utils.factories import BusinessAreaFactory, CountryFactory
+from extras.test_utils.factories import BusinessAreaFactory, CountryFactory, IndividualFactory
 from hope.apps.sanction_list.strategies.un import UNSanctionList
 from hope.apps.sanction_list.tasks.load_xml import LoadSanctionListXMLTask
-from hope.models import SanctionListIndividual, SanctionListIndividualDateOfBirth
+from hope.models import Individual, SanctionListIndividual, SanctionListIndividualDateOfBirth
 
 if TYPE_CHECKING:
     from hope.models import Program, SanctionList
@@ -98,7 +99,7 @@ def test_invalid_dates_of_birth_are_recorded_in_internal_data(
     main_test_files_path = Path(__file__).parent / "test_files"
 
     task = LoadSanctionListXMLTask(sanction_list)
-    with django_assert_num_queries(25):
+    with django_assert_num_queries(17):
         task.load_from_file(main_test_files_path / "broken-dob-consolidated.xml")
 
     assert SanctionListIndividual.all_objects.count() == 1
@@ -122,7 +123,7 @@ def test_bad_dob_does_not_poison_other_individuals(
     main_test_files_path = Path(__file__).parent / "test_files"
 
     task = LoadSanctionListXMLTask(sanction_list)
-    with django_assert_num_queries(27):
+    with django_assert_num_queries(17):
         task.load_from_file(main_test_files_path / "broken-dob-multi-consolidated.xml")
 
     assert SanctionListIndividual.all_objects.count() == 2
@@ -136,3 +137,79 @@ def test_bad_dob_does_not_poison_other_individuals(
     assert individual_b.dates_of_birth.count() == 1
     assert individual_b.dates_of_birth.first().date == date(year=1975, month=6, day=15)
     assert "date_of_birth_parse_errors" not in individual_b.internal_data
+
+
+@pytest.mark.elasticsearch
+def test_reloading_unchanged_file_does_not_touch_entries(sanction_list: "SanctionList", program: "Program") -> None:
+    main_test_files_path = Path(__file__).parent / "test_files"
+    LoadSanctionListXMLTask(sanction_list).load_from_file(main_test_files_path / "original-consolidated.xml")
+    individual = SanctionListIndividual.all_objects.get(reference_number="KPi.111")
+    assert individual.content_hash
+
+    with patch("hope.apps.sanction_list.strategies.un.check_against_sanction_list_pre_merge") as check_mock:
+        LoadSanctionListXMLTask(sanction_list).load_from_file(main_test_files_path / "original-consolidated.xml")
+
+    check_mock.assert_not_called()
+    reloaded_individual = SanctionListIndividual.all_objects.get(reference_number="KPi.111")
+    assert reloaded_individual.updated_at == individual.updated_at
+    assert reloaded_individual.content_hash == individual.content_hash
+    assert reloaded_individual.documents.count() == 2
+
+
+@pytest.mark.elasticsearch
+def test_only_new_entries_are_rescreened(sanction_list: "SanctionList", program: "Program") -> None:
+    file_path = Path(__file__).parent / "test_files" / "broken-dob-multi-consolidated.xml"
+    LoadSanctionListXMLTask(sanction_list).load_from_file(file_path)
+    SanctionListIndividual.all_objects.filter(reference_number="KPi.222").hard_delete()
+
+    with patch("hope.apps.sanction_list.strategies.un.check_against_sanction_list_pre_merge") as check_mock:
+        LoadSanctionListXMLTask(sanction_list).load_from_file(file_path)
+
+    new_individual = SanctionListIndividual.all_objects.get(reference_number="KPi.222")
+    check_mock.assert_called_once_with(program_id=program.id, sanction_list_individuals=[new_individual.id])
+
+
+@pytest.mark.elasticsearch
+def test_updated_entries_trigger_full_rescreen(sanction_list: "SanctionList", program: "Program") -> None:
+    main_test_files_path = Path(__file__).parent / "test_files"
+    LoadSanctionListXMLTask(sanction_list).load_from_file(main_test_files_path / "original-consolidated.xml")
+    individual = SanctionListIndividual.all_objects.get(reference_number="KPi.111")
+
+    with patch("hope.apps.sanction_list.strategies.un.check_against_sanction_list_pre_merge") as check_mock:
+        LoadSanctionListXMLTask(sanction_list).load_from_file(main_test_files_path / "updated-consolidated.xml")
+
+    check_mock.assert_called_once_with(program_id=program.id, sanction_list_individuals=None)
+    individual.refresh_from_db()
+    assert individual.third_name == "TEST"
+
+
+@pytest.mark.elasticsearch
+def test_possible_match_cleared_when_updated_entry_stops_matching(
+    sanction_list: "SanctionList", program: "Program", create_program_es_index: Callable
+) -> None:
+    main_test_files_path = Path(__file__).parent / "test_files"
+    create_program_es_index(program)
+    LoadSanctionListXMLTask(sanction_list).load_from_file(main_test_files_path / "original-consolidated.xml")
+    # flagged by a screen against the entry as it was before the update
+    individual = IndividualFactory(
+        program=program, business_area=program.business_area, full_name="Firstn Secondn Testn"
+    )
+    Individual.objects.filter(id=individual.id).update(sanction_list_possible_match=True)
+
+    LoadSanctionListXMLTask(sanction_list).load_from_file(main_test_files_path / "updated-consolidated.xml")
+
+    individual.refresh_from_db()
+    assert individual.sanction_list_possible_match is False
+
+
+@pytest.mark.elasticsearch
+def test_removed_entries_trigger_full_rescreen(sanction_list: "SanctionList", program: "Program") -> None:
+    main_test_files_path = Path(__file__).parent / "test_files"
+    LoadSanctionListXMLTask(sanction_list).load_from_file(main_test_files_path / "broken-dob-multi-consolidated.xml")
+
+    with patch("hope.apps.sanction_list.strategies.un.check_against_sanction_list_pre_merge") as check_mock:
+        LoadSanctionListXMLTask(sanction_list).load_from_file(main_test_files_path / "broken-dob-consolidated.xml")
+
+    check_mock.assert_called_once_with(program_id=program.id, sanction_list_individuals=None)
+    assert not SanctionListIndividual.all_objects.get(reference_number="KPi.222").active
+    assert SanctionListIndividual.objects.filter(reference_number="KPi.111").exists()
@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Any, Tuple
 from unittest.mock import Mock
 
 import pytest
@@ -6,6 +6,9 @@ import pytest
 from extras.test_utils.factories import BusinessAreaFactory, HouseholdFactory, UserFactory
 from hope.admin.rule import RuleAdmin
 from hope.admin.rule_commit import RuleCommitAdmin
+from hope.apps.steficon.cache import rule_cache
+from hope.apps.steficon.exception import RuleError
+from hope.apps.steficon.interpreters import PythonExec, compile_rule
 from hope.config import settings
 from hope.models import Household, Rule, User
 
@@ -152,6 +155,37 @@ def test_nested_rule(basic_rule_setup: Tuple[User, Household]) -> None:
     assert result.value == 101
 
 
+@pytest.mark.django_db
+def test_nested_rule_with_rule_cache(basic_rule_setup: Tuple[User, Household], django_assert_num_queries: Any) -> None:
+    user, household = basic_rule_setup
+    rule1 = Rule.objects.create(name="Rule1", definition="result.value=101", enabled=True)
+    rule2 = Rule.objects.create(
+        name="Rule2",
+        definition=f"result.value=invoke({rule1.pk}, context).value",
+        enabled=True,
+    )
+    rule1.release()
+    rule2.release()
+
+    with rule_cache():
+        assert rule2.execute({"hh": household}).value == 101
+        with django_assert_num_queries(0):
+            assert rule2.execute({"hh": household}).value == 101
+
+
+@pytest.mark.django_db
+def test_rule_cache_is_invalidated_on_release() -> None:
+    rule = Rule.objects.create(name="Rule1", definition="result.value=1", enabled=True)
+    rule.release()
+
+    with rule_cache():
+        assert rule.execute({}).value == 1
+        rule.definition = "result.value=2"
+        rule.save()
+        rule.release()
+        assert rule.execute({}).value == 2
+
+
 @pytest.mark.django_db
 def test_modules() -> None:
     rule = Rule.objects.create(
@@ -167,6 +201,46 @@ def test_modules() -> None:
     assert is_valid
 
 
+def test_python_exec_reuses_compiled_code_and_globals() -> None:
+    compile_rule.cache_clear()
+    interpreter = PythonExec("result.value=context['value'] * 2")
+
+    assert interpreter.execute({"value": 1}).value == 2
+    assert interpreter.execute({"value": 3}).value == 6
+    assert compile_rule.cache_info().misses == 1
+    assert interpreter.restricted_builtins is interpreter.restricted_builtins
+    assert PythonExec("result.value=context['value'] * 2").code is interpreter.code
+
+
+def test_python_exec_does_not_share_globals_between_executions() -> None:
+    interpreter = PythonExec(
+        """
+global marker
+marker = True
+result.value = "leaked" in __builtins__
+__builtins__["leaked"] = True
+__builtins__["str"] = int
+"""
+    )
+
+    assert interpreter.execute({}).value is False
+    assert interpreter.execute({}).value is False
+    assert interpreter.restricted_builtins["str"] is str
+
+
+def test_python_exec_execute_many() -> None:
+    interpreter = PythonExec("result.value=context['value'] + 1")
+
+    results = interpreter.execute_many({"value": value} for value in range(3))
+
+    assert [result.value for result in results] == [1, 2, 3]
+
+
+def test_python_exec_syntax_error_raises_rule_error() -> None:
+    with pytest.raises(RuleError):
+        PythonExec("result.value=").execute({})
+
+
 @pytest.mark.django_db
 def test_root_user_can_edit_version_and_rule(basic_rule_setup: Tuple[User, Household]) -> None:
     user, household = basic_rule_setup
@@ -1,13 +1,16 @@
 from unittest.mock import MagicMock, call, patch
 
 from constance.test import override_config
+from django.test import override_settings
 from elasticsearch import NotFoundError
 import pytest
 
 from extras.test_utils.factories import BusinessAreaFactory, ProgramFactory
 from hope.apps.utils.elasticsearch_utils import (
+    bulk_populate_index,
     populate_all_indexes,
     rebuild_search_index,
+    refresh_disabled,
     remove_elasticsearch_documents_by_matching_ids,
 )
 from hope.models import BusinessArea, Program
@@ -104,6 +107,25 @@ def test_rebuild_search_index_calls_per_program_and_global(mock_rebuild_program:
     assert mock_rebuild_program.call_count == 2
 
 
+@pytest.mark.django_db
+@patch("hope.apps.household.services.index_management.rebuild_program_indexes")
+@override_config(IS_ELASTICSEARCH_ENABLED=True)
+@override_settings(ELASTICSEARCH_REBUILD_WORKERS=2)
+def test_rebuild_search_index_rebuilds_programs_concurrently(mock_rebuild_program: MagicMock) -> None:
+    ba: BusinessArea = BusinessAreaFactory()
+    with override_config(IS_ELASTICSEARCH_ENABLED=False):
+        program_1: Program = ProgramFactory(business_area=ba, status=Program.ACTIVE)
+        program_2: Program = ProgramFactory(business_area=ba, status=Program.ACTIVE)
+        program_3: Program = ProgramFactory(business_area=ba, status=Program.ACTIVE)
+
+    rebuild_search_index()
+
+    mock_rebuild_program.assert_has_calls(
+        [call(str(program_1.id)), call(str(program_2.id)), call(str(program_3.id))], any_order=True
+    )
+    assert mock_rebuild_program.call_count == 3
+
+
 @pytest.mark.django_db
 @patch("hope.apps.household.services.index_management.rebuild_program_indexes")
 @override_config(IS_ELASTICSEARCH_ENABLED=True)
@@ -166,3 +188,63 @@ def test_remove_elasticsearch_documents_by_matching_ids_ignores_not_found() -> N
     )
 
     remove_elasticsearch_documents_by_matching_ids(["id-1"], mock_document)
+
+
+@patch("hope.apps.utils.elasticsearch_utils.connections")
+def test_refresh_disabled_restores_refresh_interval(mock_connections: MagicMock) -> None:
+    mock_es = mock_connections.get_connection.return_value
+    mock_es.indices.get_settings.return_value = {"index_1": {"settings": {"index.refresh_interval": "5s"}}}
+
+    with refresh_disabled("index_1"):
+        mock_es.indices.put_settings.assert_called_once_with(index="index_1", settings={"index.refresh_interval": "-1"})
+
+    mock_es.indices.put_settings.assert_called_with(index="index_1", settings={"index.refresh_interval": "5s"})
+    mock_es.indices.refresh.assert_called_once_with(index="index_1")
+
+
+@patch("hope.apps.utils.elasticsearch_utils.connections")
+def test_refresh_disabled_restores_default_refresh_interval_on_error(mock_connections: MagicMock) -> None:
+    mock_es = mock_connections.get_connection.return_value
+    mock_es.indices.get_settings.return_value = {"index_1": {"settings": {}}}
+
+    with pytest.raises(RuntimeError), refresh_disabled("index_1"):
+        raise RuntimeError
+
+    mock_es.indices.put_settings.assert_called_with(index="index_1", settings={"index.refresh_interval": None})
+    mock_es.indices.refresh.assert_called_once_with(index="index_1")
+
+
+@patch("hope.apps.utils.elasticsearch_utils.parallel_bulk")
+@patch("hope.apps.utils.elasticsearch_utils.streaming_bulk")
+@patch("hope.apps.utils.elasticsearch_utils.connections")
+@override_config(IS_ELASTICSEARCH_ENABLED=True)
+def test_bulk_populate_index_counts_indexed_and_failed_documents(
+    mock_connections: MagicMock, mock_streaming_bulk: MagicMock, mock_parallel_bulk: MagicMock
+) -> None:
+    mock_connections.get_connection.return_value.indices.get_settings.return_value = {}
+    mock_streaming_bulk.return_value = iter([(True, {}), (False, {"index": {"error": "mapping"}}), (True, {})])
+    queryset = MagicMock()
+    queryset.iterator.return_value = [MagicMock(), MagicMock(), MagicMock()]
+
+    assert bulk_populate_index(queryset, MagicMock()) == (2, 1)
+
+    mock_streaming_bulk.assert_called_once()
+    mock_parallel_bulk.assert_not_called()
+
+
+@patch("hope.apps.utils.elasticsearch_utils.parallel_bulk")
+@patch("hope.apps.utils.elasticsearch_utils.streaming_bulk")
+@patch("hope.apps.utils.elasticsearch_utils.connections")
+@override_config(IS_ELASTICSEARCH_ENABLED=True)
+def test_bulk_populate_index_uses_parallel_bulk_for_many_threads(
+    mock_connections: MagicMock, mock_streaming_bulk: MagicMock, mock_parallel_bulk: MagicMock
+) -> None:
+    mock_connections.get_connection.return_value.indices.get_settings.return_value = {}
+    mock_parallel_bulk.return_value = iter([(True, {})])
+    queryset = MagicMock()
+    queryset.iterator.return_value = [MagicMock()]
+
+    assert bulk_populate_index(queryset, MagicMock(), thread_count=4) == (1, 0)
+
+    assert mock_parallel_bulk.call_args.kwargs["thread_count"] == 4
+    mock_streaming_bulk.assert_not_called()